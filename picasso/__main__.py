@@ -748,6 +748,24 @@ def _dark(files: str) -> None:
             io.save_locs(base + "_dark.hdf5", locs, info)
 
 
+def _calibrate(stages: list[str], reset: bool) -> None:
+    """Choose the number of workers of the parallel stages on this
+    machine and store them in the user settings, see
+    ``resources.calibrate``."""
+    from . import resources
+
+    if reset:
+        resources.reset_calibration()
+        print("Calibration reset, default worker counts are used.")
+        return
+    print("Calibrating, this may take a few minutes...")
+    calibration = resources.calibrate(tuple(stages))
+    for stage, result in calibration.items():
+        values = ", ".join(f"{key}: {value}" for key, value in result.items())
+        print(f"{stage}: {values}")
+    print("Results saved to the user settings.")
+
+
 def _align(files: str, display: bool) -> None:
     """Align localization files using RCC, see ``postprocess.align``
     for details."""
@@ -1035,6 +1053,8 @@ def _localize_load_3d_calibration(
 _FIT_METHOD_MAP = {
     "lq": "gausslq",
     "lq-3d": "gausslq",
+    "lq-batch": "gausslq-batch",
+    "lq-batch-3d": "gausslq-batch",
     "lq-gpu": "gausslq-gpu",
     "lq-gpu-3d": "gausslq-gpu",
     "mle": "gaussmle",
@@ -1067,13 +1087,12 @@ def _localize_process_file(
     """
     from os.path import splitext
     from .io import load_movie, save_locs
-    from .localize import localize, add_file_to_db
+    from .localize import localize, localize_online, add_file_to_db
 
     print("------------------------------------------")
     print("------------------------------------------")
     print(f"Processing {path}, File {i + 1} of {n_total}")
     print("------------------------------------------")
-    movie, info = load_movie(path)
 
     fitting_method = _FIT_METHOD_MAP[args.fit_method]
     cam_info = dict(camera_info)
@@ -1083,21 +1102,52 @@ def _localize_process_file(
         "Box Size": box,
     }
 
-    locs, info = localize(
-        movie,
-        cam_info,
-        parameters,
-        roi=roi,
-        frame_bounds=frame_bounds,
-        movie_info=info,
-        fitting_method=fitting_method,
-        eps=convergence if convergence > 0 else 0.001,
-        max_it=max_iterations if max_iterations > 0 else 100,
-        threaded=True,
-        identification_progress_callback="console",
-        fit_progress_callback="console",
-        return_info=True,
-    )
+    base, ext = splitext(path)
+
+    try:
+        sfx = args.suffix
+    except Exception:
+        sfx = ""
+
+    out_path = f"{base}{sfx}_locs.hdf5"
+
+    # localize in blocks of frames, appended to out_path, to resume
+    # interrupted runs
+    checkpoint = getattr(args, "checkpoint", 0)
+
+    if getattr(args, "online", False):
+        # localize the movie while it is being acquired (server watcher)
+        print("Localizing online until the movie stops growing...")
+        locs, info = localize_online(
+            path,
+            cam_info,
+            parameters,
+            out_path,
+            roi=roi,
+            fitting_method=fitting_method,
+            eps=convergence if convergence > 0 else 0.001,
+            max_it=max_iterations if max_iterations > 0 else 100,
+            chunk_size=checkpoint if checkpoint > 0 else 100,
+        )
+    else:
+        movie, info = load_movie(path)
+        locs, info = localize(
+            movie,
+            cam_info,
+            parameters,
+            roi=roi,
+            frame_bounds=frame_bounds,
+            movie_info=info,
+            fitting_method=fitting_method,
+            eps=convergence if convergence > 0 else 0.001,
+            max_it=max_iterations if max_iterations > 0 else 100,
+            threaded=True,
+            identification_progress_callback="console",
+            fit_progress_callback="console",
+            chunk_size=checkpoint if checkpoint > 0 else None,
+            checkpoint_path=out_path if checkpoint > 0 else None,
+            return_info=True,
+        )
 
     if z_params is not None:
         from . import zfit
@@ -1120,14 +1170,6 @@ def _localize_process_file(
         print("3D fitting complete.")
         print("------------------------------------------")
 
-    base, ext = splitext(path)
-
-    try:
-        sfx = args.suffix
-    except Exception:
-        sfx = ""
-
-    out_path = f"{base}{sfx}_locs.hdf5"
     save_locs(out_path, locs, info)
     print("File saved to {}".format(out_path))
 
@@ -1168,6 +1210,7 @@ def _localize(args: argparse.Namespace) -> None:  # noqa: C901
         Method to use for fitting localizations. Options are:
         - 'mle': Maximum Likelihood Estimation
         - 'lq-3d': LQ 3D fitting
+        - 'lq-batch': LQ fitting with the compiled multithreaded solver
         - 'lq-gpu-3d': LQ GPU 3D fitting
     box_side_length : int
         Side length of the box used for localization.
@@ -1339,6 +1382,7 @@ def _render(args: argparse.Namespace) -> None:
     from .lib import locs_glob_map
     from os.path import isdir
     from .io import load_user_settings, save_user_settings
+    from .render import render_columns
     from tqdm import tqdm
     from glob import glob
 
@@ -1351,6 +1395,10 @@ def _render(args: argparse.Namespace) -> None:
             cmap = "viridis"
     settings["Render"]["Colormap"] = cmap
     save_user_settings(settings)
+    # only the columns needed for the blur method are loaded
+    columns = render_columns(
+        None if args.blur_method == "none" else args.blur_method
+    )
 
     if isdir(args.files):
         print("Analyzing folder")
@@ -1371,6 +1419,7 @@ def _render(args: argparse.Namespace) -> None:
                     cmap,
                     True,
                 ),
+                columns=columns,
             )
 
     else:
@@ -1387,6 +1436,7 @@ def _render(args: argparse.Namespace) -> None:
                 cmap,
                 args.silent,
             ),
+            columns=columns,
         )
 
 
@@ -2410,7 +2460,17 @@ def main():  # noqa: C901
     localize_parser.add_argument(
         "-a",
         "--fit-method",
-        choices=["mle", "lq", "lq-gpu", "lq-3d", "lq-gpu-3d", "mle-3d", "avg"],
+        choices=[
+            "mle",
+            "lq",
+            "lq-batch",
+            "lq-gpu",
+            "lq-3d",
+            "lq-batch-3d",
+            "lq-gpu-3d",
+            "mle-3d",
+            "avg",
+        ],
         default="mle",
         help="fitting method",
     )
@@ -2488,6 +2548,18 @@ def main():  # noqa: C901
         help="add the run to the local database",
     )
 
+    localize_parser.add_argument(
+        "-ck",
+        "--checkpoint",
+        type=int,
+        default=0,
+        help=(
+            "localize in blocks of this many frames that are appended to"
+            " the output file, such that an interrupted run resumes from"
+            " the last block; 0 to deactivate"
+        ),
+    )
+
     subparsers.add_parser("filter", help="filter raw files based on SNR (GUI)")
 
     # render
@@ -3027,6 +3099,26 @@ def main():  # noqa: C901
         ),
     )
 
+    # calibrate
+    calibrate_parser = subparsers.add_parser(
+        "calibrate",
+        help="choose the number of workers for localization on this machine",
+    )
+    calibrate_parser.add_argument(
+        "-s",
+        "--stages",
+        nargs="+",
+        choices=["identify", "fit"],
+        default=["identify", "fit"],
+        help="stages to be calibrated",
+    )
+    calibrate_parser.add_argument(
+        "-r",
+        "--reset",
+        action="store_true",
+        help="discard the calibration and use the default worker counts",
+    )
+
     # align
     align_parser = subparsers.add_parser(
         "align", help="align one localization file to another"
@@ -3330,6 +3422,8 @@ def main():  # noqa: C901
             _nneighbor(args.files)
         elif args.command == "dark":
             _dark(args.files)
+        elif args.command == "calibrate":
+            _calibrate(args.stages, args.reset)
         elif args.command == "align":
             _align(args.file, args.display)
         elif args.command == "join":
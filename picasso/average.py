@@ -21,7 +21,7 @@ import pandas as pd
 import scipy.sparse
 from tqdm import tqdm
 
-from . import lib, render, __version__
+from . import lib, render, resources, __version__
 
 
 def compute_xcorr(
@@ -423,10 +423,9 @@ def average(
     angles = np.arange(0, 2 * np.pi, a_step)
 
     # Setup multiprocessing
-    n_workers = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
-    manager = multiprocessing.Manager()
+    n_workers = resources.n_workers("average")
+    context = lib.process_pool_context()
+    manager = context.Manager()
     counter = manager.Value("d", 0)
     lock = manager.Lock()
     groups_per_worker = max(1, int(n_groups / n_workers))
@@ -435,7 +434,7 @@ def average(
     x = sharedctypes.RawArray("f", locs["x"].to_numpy())
     y = sharedctypes.RawArray("f", locs["y"].to_numpy())
 
-    pool = multiprocessing.Pool(
+    pool = context.Pool(
         n_workers,
         _init_pool_worker,
         (x, y, group_index),
@@ -9,7 +9,6 @@ interest (ROI).
 :copyright: Copyright (c) 2016-2026 Jungmann Lab, MPI of Biochemistry
 """
 
-import multiprocessing
 from concurrent import futures
 from typing import Callable, Literal
 
@@ -18,7 +17,11 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from . import gausslq, lib
+from . import gausslq, lib, resources
+
+
+# spots fitted between two progress updates in ``fit_spots``
+_BLOCK_SIZE = 100_000
 
 
 @numba.jit(nopython=True, nogil=True)
@@ -32,6 +35,35 @@ def _sum(spot: lib.FloatArray2D, size: int) -> float:
     return _sum_
 
 
+@numba.jit(nopython=True, nogil=True)
+def _fit_spot_into(
+    spots: lib.FloatArray3D, theta: lib.FloatArray2D, i: int
+) -> None:
+    """Write the fit parameters of spot ``i`` into ``theta[i]``, see
+    ``fit_spot``."""
+    avg_roi = _sum(spots[i], spots.shape[1])
+    theta[i, 0] = 0
+    theta[i, 1] = 0
+    theta[i, 2] = avg_roi
+    theta[i, 3] = avg_roi
+    theta[i, 4] = 1
+    theta[i, 5] = 1
+
+
+@numba.jit(nopython=True, nogil=True)
+def _fit_spots_serial(spots: lib.FloatArray3D, theta: lib.FloatArray2D):
+    """Write the fit parameters of ``spots`` into ``theta``."""
+    for i in range(len(spots)):
+        _fit_spot_into(spots, theta, i)
+
+
+@numba.njit(parallel=True, nogil=True)
+def _fit_spots_parallel(spots: lib.FloatArray3D, theta: lib.FloatArray2D):
+    """Multithreaded version of ``_fit_spots_serial``."""
+    for i in numba.prange(len(spots)):
+        _fit_spot_into(spots, theta, i)
+
+
 def fit_spot(spot: lib.FloatArray2D) -> list[float]:
     """Fit a single spot and return fit parameters."""
     size = spot.shape[0]
@@ -47,19 +79,88 @@ def fit_spots(
         Callable[[int], None] | Literal["console"] | None
     ) = None,
 ) -> lib.FloatArray2D:
-    """Fit spots and return fit parameters."""
-    theta = np.empty((len(spots), 6), dtype=np.float32)
-    theta.fill(np.nan)
+    """Fit spots and return fit parameters.
+
+    Parameters
+    ----------
+    spots : lib.FloatArray3D
+        A 3D array of shape (n_spots, size, size) with the spots in
+        photons.
+    progress_callback : callable or None
+        If a callable provided, it must accept one integer input (number
+        of localized spots). Since v0.10.1, it is called after each
+        block of up to 100,000 spots with the total number of spots
+        fitted so far (the last call with N), instead of after each spot
+        with its index. If "console", tqdm is used to display progress.
+        If None, progress is not tracked.
+
+    Returns
+    -------
+    theta : lib.FloatArray2D
+        A 2D array with the fit parameters for each spot. The columns
+        correspond to [x, y, photons, bg, sx, sy].
+    """
+    return _fit_spots_blocks(
+        _fit_spots_serial, spots, _BLOCK_SIZE, progress_callback
+    )
+
+
+def fit_spots_batch(
+    spots: lib.FloatArray3D,
+    block_size: int = 1_000_000,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+) -> lib.FloatArray2D:
+    """Fit spots in compiled code on all CPU threads, without process
+    pools. Since the fit only sums the pixels of each spot, it is
+    limited by memory bandwidth.
+
+    Parameters
+    ----------
+    spots : lib.FloatArray3D
+        A 3D array of shape (n_spots, size, size) with the spots in
+        photons.
+    block_size : int, optional
+        Number of spots fitted per compiled call; progress is reported
+        after each block. Default is 1,000,000.
+    progress_callback : callable or None
+        If a callable provided, it must accept one integer input (number
+        of localized spots). If "console", tqdm is used to display
+        progress. If None, progress is not tracked.
+
+    Returns
+    -------
+    theta : lib.FloatArray2D
+        A 2D array with the fit parameters for each spot. The columns
+        correspond to [x, y, photons, bg, sx, sy].
+    """
+    return _fit_spots_blocks(
+        _fit_spots_parallel, spots, block_size, progress_callback
+    )
+
+
+def _fit_spots_blocks(
+    kernel: Callable,
+    spots: lib.FloatArray3D,
+    block_size: int,
+    progress_callback: Callable[[int], None] | Literal["console"] | None,
+) -> lib.FloatArray2D:
+    """Run a fitting kernel on blocks of spots and report progress."""
+    n_spots = len(spots)
+    theta = np.empty((n_spots, 6), dtype=np.float32)
     use_tqdm = progress_callback == "console"
     if use_tqdm:
-        iter_range = tqdm(range(len(spots)), desc="Fitting...", unit="spot")
-    else:
-        iter_range = range(len(spots))
-    for i in iter_range:
-        spot = spots[i]
-        theta[i] = fit_spot(spot)
-        if callable(progress_callback):
-            progress_callback(i)
+        progress_bar = tqdm(total=n_spots, desc="Fitting...", unit="spot")
+    for start in range(0, n_spots, block_size):
+        stop = min(start + block_size, n_spots)
+        kernel(spots[start:stop], theta[start:stop])
+        if use_tqdm:
+            progress_bar.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop)
+    if use_tqdm:
+        progress_bar.close()
     return theta
 
 
@@ -68,27 +169,12 @@ def fit_spots_parallel(
     asynch: bool = False,
 ) -> lib.FloatArray2D | list[futures.Future]:
     """Fit spots in parallel (if ``asynch`` is True)."""
-    n_workers = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
-    n_spots = len(spots)
-    n_tasks = 100 * n_workers
-    spots_per_task = [
-        (
-            int(n_spots / n_tasks + 1)
-            if _ < n_spots % n_tasks
-            else int(n_spots / n_tasks)
-        )
-        for _ in range(n_tasks)
-    ]
-    start_indices = np.cumsum([0] + spots_per_task[:-1])
-    fs = []
-    executor = futures.ProcessPoolExecutor(n_workers)
-    for i, n_spots_task in zip(start_indices, spots_per_task):
-        fs.append(executor.submit(fit_spots, spots[i : i + n_spots_task]))
+    n_workers = resources.n_workers("fit")
+    n_tasks = resources.n_tasks("fit", n_workers)
+    fs = lib.fit_spots_shared(fit_spots, spots, 6, n_workers, n_tasks)
     if asynch:
         return fs
-    with tqdm(total=n_tasks, unit="task") as progress_bar:
+    with tqdm(total=len(fs), unit="task") as progress_bar:
         for f in futures.as_completed(fs):
             progress_bar.update()
     return fits_from_futures(fs)
@@ -17,7 +17,6 @@ are added, for example, localization cloud shape modeling.
 
 from __future__ import annotations
 
-import os
 import time
 from abc import ABCMeta, abstractmethod
 from concurrent.futures import ProcessPoolExecutor
@@ -32,7 +31,7 @@ from sklearn.utils import check_random_state
 from tqdm import tqdm
 from PyQt6 import QtWidgets
 
-from . import lib, zfit, __version__
+from . import lib, resources, zfit, __version__
 
 
 SPOT_SIZE_DEPRECATION_WARNING = (
@@ -2383,9 +2382,7 @@ def _run_g5m_parallel(
         List of futures.
     """
     n_groups = len(np.unique(locs["group"]))
-    n_workers = min(
-        60, max(1, int(0.35 * os.cpu_count()))
-    )  # Python crashes when using >64 cores
+    n_workers = resources.n_workers("g5m")
     groups_per_task = [
         (
             int(n_groups / N_TASKS + 1)
@@ -2396,7 +2393,9 @@ def _run_g5m_parallel(
     ]
     start_indices = np.cumsum([0] + groups_per_task[:-1])
     fs = []
-    executor = ProcessPoolExecutor(n_workers)
+    executor = ProcessPoolExecutor(
+        n_workers, mp_context=lib.process_pool_context()
+    )
     for i, n_groups_task in zip(start_indices, groups_per_task):
         fs.append(
             executor.submit(
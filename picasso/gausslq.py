@@ -10,7 +10,6 @@ Fit spots (single-molecule images) with 2D Gaussian least squares.
 
 from __future__ import annotations
 
-import multiprocessing
 from concurrent import futures
 from typing import Callable, Literal
 
@@ -20,7 +19,7 @@ import pandas as pd
 from scipy import optimize
 from tqdm import tqdm
 
-from picasso import lib
+from picasso import lib, resources
 
 try:
     from picasso.ext.pygpufit import gpufit as gf
@@ -296,6 +295,10 @@ def fit_spots_parallel(
     """Allows for running ``fit_spots`` asynchronously
     (multiprocessing).
 
+    Since v0.10.1, the spots and the fitted parameters are exchanged
+    with the worker processes via shared memory and the process pool
+    is kept alive between calls, see ``lib.fit_spots_shared``.
+
     Parameters
     ----------
     spots : lib.FloatArray3D
@@ -317,32 +320,225 @@ def fit_spots_parallel(
         [x, y, photons, bg, sx, sy]. If `asynch` is True, returns a list
         of futures that can be processed asynchronously.
     """
-    n_workers = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
-    n_spots = len(spots)
-    n_tasks = 100 * n_workers
-    spots_per_task = [
-        (
-            int(n_spots / n_tasks + 1)
-            if _ < n_spots % n_tasks
-            else int(n_spots / n_tasks)
-        )
-        for _ in range(n_tasks)
-    ]
-    start_indices = np.cumsum([0] + spots_per_task[:-1])
-    fs = []
-    executor = futures.ProcessPoolExecutor(n_workers)
-    for i, n_spots_task in zip(start_indices, spots_per_task):
-        fs.append(executor.submit(fit_spots, spots[i : i + n_spots_task]))
+    n_workers = resources.n_workers("fit")
+    n_tasks = resources.n_tasks("fit", n_workers)
+    fs = lib.fit_spots_shared(fit_spots, spots, 6, n_workers, n_tasks)
     if asynch:
         return fs
-    with tqdm(desc="LQ fitting", total=n_tasks, unit="task") as progress_bar:
+    with tqdm(desc="LQ fitting", total=len(fs), unit="task") as progress_bar:
         for f in futures.as_completed(fs):
             progress_bar.update()
     return fits_from_futures(fs)
 
 
+@numba.jit(nopython=True, nogil=True)
+def _lm_model_and_jacobian(
+    theta: lib.FloatArray1D,
+    grid: lib.FloatArray1D,
+    size: int,
+    model: lib.FloatArray1D,
+    jacobian: lib.FloatArray2D,
+) -> None:
+    """Evaluate the Gaussian model of ``_compute_model`` (flattened)
+    and its analytic Jacobian w.r.t. [x, y, photons, bg, sx, sy]."""
+    x, y, n, bg, sx, sy = theta
+    norm_x = 0.3989422804014327 / sx
+    norm_y = 0.3989422804014327 / sy
+    for i in range(size):
+        dy = grid[i] - y
+        gy = norm_y * np.exp(-0.5 * (dy / sy) ** 2)
+        for j in range(size):
+            dx = grid[j] - x
+            gx = norm_x * np.exp(-0.5 * (dx / sx) ** 2)
+            k = i * size + j
+            g = gy * gx
+            ng = n * g
+            model[k] = ng + bg
+            jacobian[k, 0] = ng * dx / sx**2
+            jacobian[k, 1] = ng * dy / sy**2
+            jacobian[k, 2] = g
+            jacobian[k, 3] = 1.0
+            jacobian[k, 4] = ng * (dx**2 / sx**3 - 1.0 / sx)
+            jacobian[k, 5] = ng * (dy**2 / sy**3 - 1.0 / sy)
+
+
+@numba.jit(nopython=True, nogil=True)
+def _lm_solve(
+    A: lib.FloatArray2D,
+    b: lib.FloatArray1D,
+    step: lib.FloatArray1D,
+) -> bool:
+    """Solve the symmetric positive definite system ``A @ step = b``
+    with a Cholesky decomposition. Returns False if ``A`` is not
+    positive definite."""
+    n = len(b)
+    L = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1):
+            s = A[i, j]
+            for k in range(j):
+                s -= L[i, k] * L[j, k]
+            if i == j:
+                if not s > 0.0:
+                    return False
+                L[i, i] = np.sqrt(s)
+            else:
+                L[i, j] = s / L[j, j]
+    # forward substitution
+    for i in range(n):
+        s = b[i]
+        for k in range(i):
+            s -= L[i, k] * step[k]
+        step[i] = s / L[i, i]
+    # back substitution
+    for i in range(n - 1, -1, -1):
+        s = step[i]
+        for k in range(i + 1, n):
+            s -= L[k, i] * step[k]
+        step[i] = s / L[i, i]
+    return True
+
+
+@numba.jit(nopython=True, nogil=True)
+def _fit_spot_lm(
+    spot: lib.FloatArray2D,
+    max_it: int,
+    tol: float,
+) -> lib.FloatArray1D:
+    """Fit a single spot with the Levenberg-Marquardt algorithm, see
+    ``fit_spots_batch``."""
+    size = spot.shape[0]
+    size_half = int(size / 2)
+    n_pixels = size * size
+    grid = np.arange(-size_half, size_half + 1).astype(np.float64)
+    data = spot.astype(np.float64).ravel()
+    theta = _initial_parameters(spot, size, size_half).astype(np.float64)
+    model = np.empty(n_pixels)
+    jacobian = np.empty((n_pixels, 6))
+    A = np.empty((6, 6))
+    A_damped = np.empty((6, 6))
+    b = np.empty(6)
+    step = np.empty(6)
+    theta_new = np.empty(6)
+    model_new = np.empty(n_pixels)
+    jacobian_new = np.empty((n_pixels, 6))
+
+    _lm_model_and_jacobian(theta, grid, size, model, jacobian)
+    cost = np.sum((data - model) ** 2)
+    if not np.isfinite(cost):
+        return theta.astype(np.float32)
+    damping = 1e-3
+    for _ in range(max_it):
+        # normal equations
+        for p in range(6):
+            b[p] = np.sum(jacobian[:, p] * (data - model))
+            for q in range(p + 1):
+                A[p, q] = np.sum(jacobian[:, p] * jacobian[:, q])
+                A[q, p] = A[p, q]
+        converged = False
+        while True:
+            A_damped[:, :] = A
+            for p in range(6):
+                A_damped[p, p] += damping * A[p, p]
+            if _lm_solve(A_damped, b, step):
+                theta_new[:] = theta + step
+                _lm_model_and_jacobian(
+                    theta_new, grid, size, model_new, jacobian_new
+                )
+                cost_new = np.sum((data - model_new) ** 2)
+                if np.isfinite(cost_new) and cost_new <= cost:
+                    break
+            damping *= 10.0
+            if damping > 1e10:
+                converged = True
+                break
+        if converged:
+            break
+        # accept step
+        rel_step = np.sqrt(np.sum(step**2) / (np.sum(theta**2) + tol))
+        rel_cost = (cost - cost_new) / (cost + tol)
+        theta[:] = theta_new
+        model[:] = model_new
+        jacobian[:, :] = jacobian_new
+        cost = cost_new
+        damping = max(damping / 10.0, 1e-7)
+        if rel_step < tol or rel_cost < tol:
+            break
+    return theta.astype(np.float32)
+
+
+@numba.njit(parallel=True, nogil=True)
+def _fit_spots_lm(
+    spots: lib.FloatArray3D,
+    theta: lib.FloatArray2D,
+    max_it: int,
+    tol: float,
+) -> None:
+    """Fit all spots in parallel, results are written to theta."""
+    for i in numba.prange(len(spots)):
+        theta[i] = _fit_spot_lm(spots[i], max_it, tol)
+
+
+def fit_spots_batch(
+    spots: lib.FloatArray3D,
+    max_it: int = 100,
+    tol: float = 1e-6,
+    block_size: int = 10_000,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+) -> lib.FloatArray2D:
+    """Fit multiple spots with a compiled Levenberg-Marquardt solver.
+
+    Uses the same model and initial parameters as ``fit_spot`` but
+    fits whole batches of spots in compiled code on all CPU threads
+    (the GIL is released), avoiding the overhead of one
+    ``scipy.optimize.leastsq`` call per spot and of process pools.
+    Results agree with ``fit_spots`` within the tolerance of the
+    latter (``leastsq`` stops at a relative change of 1e-2).
+
+    Parameters
+    ----------
+    spots : lib.FloatArray3D
+        A 3D array of shape (n_spots, size, size) with the spots in
+        photons.
+    max_it : int, optional
+        Maximum number of iterations per spot. Default is 100.
+    tol : float, optional
+        Convergence criterion, i.e., relative change of the parameters
+        or of the sum of squared residuals. Default is 1e-6.
+    block_size : int, optional
+        Number of spots fitted per compiled call; progress is reported
+        after each block. Default is 10,000.
+    progress_callback : callable or None
+        If a callable provided, it must accept one integer input (number
+        of localized spots). If "console", tqdm is used to display
+        progress. If None, progress is not tracked.
+
+    Returns
+    -------
+    theta : lib.FloatArray2D
+        A 2D array with the optimized parameters for each spot. The
+        columns correspond to [x, y, photons, bg, sx, sy].
+    """
+    spots = np.ascontiguousarray(spots, dtype=np.float32)
+    n_spots = len(spots)
+    theta = np.full((n_spots, 6), np.nan, dtype=np.float32)
+    use_tqdm = progress_callback == "console"
+    if use_tqdm:
+        progress_bar = tqdm(total=n_spots, desc="Fitting", unit="spot")
+    for start in range(0, n_spots, block_size):
+        stop = min(start + block_size, n_spots)
+        _fit_spots_lm(spots[start:stop], theta[start:stop], max_it, tol)
+        if use_tqdm:
+            progress_bar.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop)
+    if use_tqdm:
+        progress_bar.close()
+    return theta
+
+
 def fit_spots_gpufit(spots: lib.FloatArray3D) -> lib.FloatArray2D:
     """Fit multiple spots using GPU-based Gaussian fitting. Each spot is
     a 2D array representing the pixel values of the spot image. The
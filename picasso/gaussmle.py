@@ -12,7 +12,6 @@ Smith, et al. Nature Methods, 2010.
 from __future__ import annotations
 
 import math
-import multiprocessing
 import threading
 from concurrent import futures
 from typing import Callable, Literal
@@ -20,9 +19,10 @@ from typing import Callable, Literal
 import numba
 import numpy as np
 import pandas as pd
+from scipy.spatial import KDTree
 from tqdm import tqdm
 
-from picasso import lib
+from picasso import lib, resources
 
 
 @numba.jit(nopython=True, nogil=True)
@@ -383,27 +383,336 @@ def _derivative_gaussian_integral_iso_sigma(
     return dudt, d2udt2
 
 
+# spots claimed at once by a fitting thread; small, such that slowly
+# converging spots only delay their own block
+_MLE_BLOCK_SIZE = 32
+# spots fitted between two progress updates in ``gaussmle``
+_MLE_PROGRESS_STEP = 1024
+
+
+def _fit_method(method: str) -> bool:
+    """Return whether ``method`` fits sigma in x and y separately."""
+    if method not in ("sigma", "sigmaxy"):
+        raise ValueError("Method not available.")
+    return method == "sigmaxy"
+
+
+@numba.jit(nopython=True, nogil=True)
+def _has_converged(
+    theta: lib.FloatArray1D,
+    old_theta: lib.FloatArray1D,
+    eps: float,
+    converge_all: bool,
+) -> bool:
+    """Whether the last update of ``theta`` (x, y, photons, bg and
+    sigma(s)) changed the positions (and sigma_x and sigma_y, if
+    fitted separately) by less than ``eps`` pixels. If
+    ``converge_all``, the sigma must change by less than ``eps`` pixels
+    and photons and background by less than ``eps`` relative to their
+    values, too. ``old_theta`` is set to ``theta`` for the next
+    check."""
+    sigmaxy = len(theta) == 6
+    converged = True
+    for i in range(len(theta)):
+        change = np.abs(theta[i] - old_theta[i])
+        old_theta[i] = theta[i]
+        if i == 2 or i == 3:  # photons and background
+            if not converge_all:
+                continue
+            change /= max(np.abs(theta[i]), 1.0)
+        elif i >= 4 and not (sigmaxy or converge_all):
+            continue
+        if change >= eps:
+            converged = False
+    return converged
+
+
+@numba.jit(nopython=True, nogil=True)
+def _start_theta(
+    spot: lib.FloatArray2D,
+    source: lib.FloatArray1D,
+    sigmaxy: bool,
+) -> lib.FloatArray1D:
+    """Initial parameters of a fit. Starts from ``source`` (x, y,
+    photons, bg, sx, sy) if these parameters are plausible for the spot,
+    otherwise from the estimates of ``_initial_parameters``."""
+    size = spot.shape[0]
+    valid = len(source) == 6
+    if valid:
+        for i in range(6):
+            if not np.isfinite(source[i]):
+                valid = False
+    if valid:
+        valid = (
+            0 <= source[0] <= size - 1
+            and 0 <= source[1] <= size - 1
+            and source[2] > 0
+            and source[4] > 0
+            and source[5] > 0
+        )
+    if not valid:
+        if sigmaxy:
+            return _initial_theta_sigmaxy(spot, size)
+        return _initial_theta_sigma(spot, size)
+    if sigmaxy:
+        theta = np.empty(6, dtype=np.float32)
+        theta[:] = source
+    else:
+        theta = np.empty(5, dtype=np.float32)
+        theta[:4] = source[:4]
+        theta[4] = (source[4] + source[5]) / 2
+    return theta
+
+
+@numba.jit(nopython=True, nogil=True)
+def _mlefit_range(
+    spots: lib.FloatArray3D,
+    order: lib.IntArray1D,
+    start: int,
+    stop: int,
+    thetas: lib.FloatArray2D,
+    CRLBs: lib.FloatArray2D,
+    likelihoods: lib.FloatArray1D,
+    iterations: lib.IntArray1D,
+    converged: lib.BoolArray1D,
+    eps: float,
+    max_it: int,
+    converge_all: bool,
+    sigmaxy: bool,
+    init_thetas: lib.FloatArray2D,
+    previous: lib.IntArray1D,
+    variances: lib.FloatArray3D,
+) -> None:
+    """Fits the spots ``order[start:stop]`` in compiled code, see
+    ``_mlefit_sigma`` and ``_mlefit_sigmaxy``.
+
+    A spot starts from the fit of ``previous[index]`` if that spot was
+    fitted right before it in the same range, otherwise from
+    ``init_thetas[index]`` (if given, i.e., not empty) or from the
+    default estimates. ``variances`` holds the per-pixel camera
+    variance of each spot or is empty (no camera noise)."""
+    no_source = np.empty(0, dtype=np.float32)
+    size = spots.shape[1]
+    no_variance = np.zeros((size, size), dtype=np.float32)
+    for position in range(start, stop):
+        index = order[position]
+        if len(variances) > 0:
+            variance = variances[index]
+        else:
+            variance = no_variance
+        if (
+            len(previous) > 0
+            and position > start
+            and previous[index] == order[position - 1]
+        ):
+            source = thetas[previous[index]]
+        elif len(init_thetas) > 0:
+            source = init_thetas[index]
+        else:
+            source = no_source
+        theta = _start_theta(spots[index], source, sigmaxy)
+        if sigmaxy:
+            _mlefit_sigmaxy(
+                spots,
+                index,
+                theta,
+                thetas,
+                CRLBs,
+                likelihoods,
+                iterations,
+                converged,
+                eps,
+                max_it,
+                converge_all,
+                variance,
+            )
+        else:
+            _mlefit_sigma(
+                spots,
+                index,
+                theta,
+                thetas,
+                CRLBs,
+                likelihoods,
+                iterations,
+                converged,
+                eps,
+                max_it,
+                converge_all,
+                variance,
+            )
+
+
 def _worker(
-    func,
     spots,
+    order,
     thetas,
     CRLBs,
     likelihoods,
     iterations,
+    converged,
     eps,
     max_it,
+    converge_all,
+    sigmaxy,
+    init_thetas,
+    previous,
+    variances,
+    next_spot,
     current,
     lock,
+    block_size,
 ):
-    """Worker function for asynchronous Gaussian fitting."""
+    """Worker function for asynchronous Gaussian fitting. Claims blocks
+    of spots until none are left (dynamic scheduling) and fits them
+    without holding the GIL. ``current[0]`` counts the fitted spots."""
     N = len(spots)
     while True:
         with lock:
-            index = current[0]
-            if index == N:
+            start = next_spot[0]
+            if start >= N:
                 return
-            current[0] += 1
-        func(spots, index, thetas, CRLBs, likelihoods, iterations, eps, max_it)
+            stop = min(start + block_size, N)
+            next_spot[0] = stop
+        _mlefit_range(
+            spots,
+            order,
+            start,
+            stop,
+            thetas,
+            CRLBs,
+            likelihoods,
+            iterations,
+            converged,
+            eps,
+            max_it,
+            converge_all,
+            sigmaxy,
+            init_thetas,
+            previous,
+            variances,
+        )
+        with lock:
+            current[0] += stop - start
+
+
+def previous_frame_spots(identifications: pd.DataFrame) -> lib.IntArray1D:
+    """Find the spot identified at the same pixel in the previous frame
+    for each identification, e.g., the same molecule during a binding
+    event that lasts for several frames.
+
+    Parameters
+    ----------
+    identifications : pd.DataFrame
+        Identified spots with the columns `frame`, `x` and `y`.
+
+    Returns
+    -------
+    previous : lib.IntArray1D
+        Position (in ``identifications``) of the spot at the same
+        pixel in the previous frame, -1 if there is none.
+    """
+    table = pd.DataFrame(
+        {
+            "frame": identifications["frame"].to_numpy(dtype=np.int64),
+            "x": identifications["x"].to_numpy(dtype=np.int64),
+            "y": identifications["y"].to_numpy(dtype=np.int64),
+            "index": np.arange(len(identifications)),
+        }
+    )
+    earlier = table.drop_duplicates(["frame", "x", "y"]).assign(
+        frame=lambda df: df["frame"] + 1
+    )
+    matches = table.merge(
+        earlier, on=["frame", "x", "y"], suffixes=("", "_previous")
+    )
+    previous = np.full(len(identifications), -1, dtype=np.int64)
+    previous[matches["index"].to_numpy()] = matches[
+        "index_previous"
+    ].to_numpy()
+    return previous
+
+
+def _fit_order(previous: lib.IntArray1D) -> lib.IntArray1D:
+    """Order of fitting such that spots linked by ``previous`` are
+    fitted one after the other."""
+    first = np.where(previous < 0, np.arange(len(previous)), previous)
+    while True:  # pointer jumping to the first spot of each chain
+        jumped = first[first]
+        if np.array_equal(jumped, first):
+            break
+        first = jumped
+    depth = np.zeros(len(previous), dtype=np.int64)
+    linked = previous >= 0
+    pointer = previous.copy()
+    while linked.any():
+        depth[linked] += 1
+        pointer[linked] = previous[pointer[linked]]
+        linked = pointer >= 0
+    return np.lexsort((depth, first)).astype(np.int64)
+
+
+def _prepare_start(
+    N: int,
+    init_thetas: lib.FloatArray2D | None,
+    previous: lib.IntArray1D | None,
+) -> tuple[lib.IntArray1D, lib.FloatArray2D, lib.IntArray1D]:
+    """Fitting order and starting values in the form passed to
+    ``_mlefit_range``."""
+    if init_thetas is None:
+        init_thetas = np.empty((0, 6), dtype=np.float32)
+    else:
+        init_thetas = np.ascontiguousarray(init_thetas, dtype=np.float32)
+        if init_thetas.shape != (N, 6):
+            raise ValueError(
+                f"init_thetas must have the shape ({N}, 6), got "
+                f"{init_thetas.shape}."
+            )
+    if previous is None:
+        previous = np.empty(0, dtype=np.int64)
+        order = np.arange(N, dtype=np.int64)
+    else:
+        previous = np.ascontiguousarray(previous, dtype=np.int64)
+        if previous.shape != (N,):
+            raise ValueError(
+                f"previous must have the shape ({N},), got {previous.shape}."
+            )
+        order = _fit_order(previous)
+    return order, init_thetas, previous
+
+
+def _prepare_variances(
+    spots: lib.FloatArray3D,
+    variances: lib.FloatArray3D | None,
+) -> lib.FloatArray3D:
+    """Per-pixel camera variances in the form passed to
+    ``_mlefit_range`` and ``_mlefit_multi_serial``."""
+    if variances is None:
+        return np.empty((0, 0, 0), dtype=np.float32)
+    variances = np.ascontiguousarray(variances, dtype=np.float32)
+    if variances.shape != spots.shape:
+        raise ValueError(
+            f"variances must have the shape {spots.shape}, got "
+            f"{variances.shape}."
+        )
+    return variances
+
+
+def _allocate_results(
+    N: int,
+) -> tuple[
+    lib.FloatArray2D,
+    lib.FloatArray2D,
+    lib.FloatArray1D,
+    lib.IntArray1D,
+    lib.BoolArray1D,
+]:
+    thetas = np.zeros((N, 6), dtype=np.float32)
+    CRLBs = np.inf * np.ones((N, 6), dtype=np.float32)
+    likelihoods = np.zeros(N, dtype=np.float32)
+    iterations = np.zeros(N, dtype=np.int32)
+    converged = np.zeros(N, dtype=np.bool_)
+    return thetas, CRLBs, likelihoods, iterations, converged
 
 
 def gaussmle(
@@ -414,12 +723,31 @@ def gaussmle(
     progress_callback: (
         Callable[[int], None] | Literal["console"] | None
     ) = None,
-) -> tuple[
-    lib.FloatArray2D, lib.FloatArray2D, lib.FloatArray1D, lib.IntArray1D
-]:
+    init_thetas: lib.FloatArray2D | None = None,
+    previous: lib.IntArray1D | None = None,
+    variances: lib.FloatArray3D | None = None,
+    converge_all: bool = False,
+    return_converged: bool = False,
+) -> (
+    tuple[lib.FloatArray2D, lib.FloatArray2D, lib.FloatArray1D, lib.IntArray1D]
+    | tuple[
+        lib.FloatArray2D,
+        lib.FloatArray2D,
+        lib.FloatArray1D,
+        lib.IntArray1D,
+        lib.BoolArray1D,
+    ]
+):
     """Fits Gaussians using Maximum Likelihood Estimation (MLE) to the
     extracted spots.
 
+    Since v0.10.1: warm start from given parameters (``init_thetas``),
+    e.g., least-squares fits, or from the fit of the same molecule in
+    the previous frame (``previous``). Per-pixel camera noise of sCMOS
+    cameras (``variances``) is accounted for as in Huang, et al. Nature
+    Methods, 2013: the variance (in photons^2) is added to both the
+    data and the model of each pixel.
+
     Parameters
     ----------
     spots : lib.FloatArray3D
@@ -434,8 +762,39 @@ def gaussmle(
         The method to use for fitting the Gaussian.
     progress_callback : callable or None
         If a callable provided, it must accept one integer input (number
-        of localized spots). If "console", tqdm is used to display
-        progress. If None, progress is not tracked.
+        of localized spots). Since v0.10.1, it is called after each
+        block of up to 1024 spots with the total number of spots fitted
+        so far (the last call with N), instead of after each spot with
+        its index. If "console", tqdm is used to display progress. If
+        None, progress is not tracked.
+    init_thetas : lib.FloatArray2D or None, optional
+        Initial parameters of shape (N, 6) with the columns x, y,
+        photons, background, sigma_x and sigma_y, where x and y are
+        relative to the box origin (as in the returned ``thetas``).
+        Rows that are not finite or not plausible (e.g., positions
+        outside of the box) use the default initial estimates. Default
+        is None, i.e., default initial estimates for all spots.
+    previous : lib.IntArray1D or None, optional
+        Index of the spot at the same position in the previous frame
+        (-1 if none) for each spot, see ``previous_frame_spots``. Linked
+        spots are fitted one after the other, each starting from the
+        fit of its predecessor, which takes precedence over
+        ``init_thetas``. Default is None.
+    variances : lib.FloatArray3D or None, optional
+        Camera read noise variance of each pixel of the spots in
+        photons^2, same shape as ``spots``. Default is None, i.e., no
+        read noise (EMCCD or uniform camera model).
+    converge_all : bool, optional
+        If True, a fit converges only once all parameters changed by
+        less than ``eps`` in the last iteration: the sigmas in pixels,
+        photons and background relative to their values. This takes
+        more iterations, but fits of the same spot from different
+        starts (e.g., warm starts) agree in all parameters. Default is
+        False, i.e., only the positions (and sigma_x and sigma_y for
+        ``method="sigmaxy"``) are checked.
+    return_converged : bool, optional
+        If True, whether each fit converged within ``max_it`` iterations
+        is returned as well. Default is False.
 
     Returns
     -------
@@ -451,27 +810,47 @@ def gaussmle(
     iterations : lib.IntArray1D
         The number of iterations taken to converge for each spot,
         shape (N,).
+    converged : lib.BoolArray1D
+        Only returned if ``return_converged`` is True. Whether the fit
+        met the convergence criterion (see ``converge_all``) within
+        ``max_it`` iterations, shape (N,).
     """
     N = len(spots)
-    thetas = np.zeros((N, 6), dtype=np.float32)
-    CRLBs = np.inf * np.ones((N, 6), dtype=np.float32)
-    likelihoods = np.zeros(N, dtype=np.float32)
-    iterations = np.zeros(N, dtype=np.int32)
-    if method == "sigma":
-        func = _mlefit_sigma
-    elif method == "sigmaxy":
-        func = _mlefit_sigmaxy
-    else:
-        raise ValueError("Method not available.")
+    sigmaxy = _fit_method(method)
+    order, init_thetas, previous = _prepare_start(N, init_thetas, previous)
+    variances = _prepare_variances(spots, variances)
+    thetas, CRLBs, likelihoods, iterations, converged = _allocate_results(N)
     use_tqdm = progress_callback == "console"
     if use_tqdm:
-        iter_range = tqdm(range(N), desc="Fitting...", unit="spot")
-    else:
-        iter_range = range(N)
-    for i in iter_range:
-        func(spots, i, thetas, CRLBs, likelihoods, iterations, eps, max_it)
-        if callable(progress_callback):
-            progress_callback(i)
+        pbar = tqdm(total=N, desc="Fitting...", unit="spot")
+    for start in range(0, N, _MLE_PROGRESS_STEP):
+        stop = min(start + _MLE_PROGRESS_STEP, N)
+        _mlefit_range(
+            spots,
+            order,
+            start,
+            stop,
+            thetas,
+            CRLBs,
+            likelihoods,
+            iterations,
+            converged,
+            eps,
+            max_it,
+            converge_all,
+            sigmaxy,
+            init_thetas,
+            previous,
+            variances,
+        )
+        if use_tqdm:
+            pbar.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop)
+    if use_tqdm:
+        pbar.close()
+    if return_converged:
+        return thetas, CRLBs, likelihoods, iterations, converged
     return thetas, CRLBs, likelihoods, iterations
 
 
@@ -480,69 +859,133 @@ def gaussmle_async(
     eps: float,
     max_it: int,
     method: Literal["sigma", "sigmaxy"] = "sigmaxy",
+    init_thetas: lib.FloatArray2D | None = None,
+    previous: lib.IntArray1D | None = None,
+    variances: lib.FloatArray3D | None = None,
+    converge_all: bool = False,
+    return_converged: bool = False,
 ) -> tuple[
     list, lib.FloatArray2D, lib.FloatArray2D, lib.FloatArray1D, lib.IntArray1D
 ]:
-    """Runs ``gaussmle`` asynchronously (multiprocessing) to fit
+    """Runs ``gaussmle`` asynchronously (multithreading) to fit
     Gaussians using Maximum Likelihood Estimation (MLE) to the
     extracted spots. See ``gaussmle`` for parameter details.
 
+    The threads fit small blocks of spots in compiled code without
+    holding the GIL and claim the next block once they are done, so
+    that slowly converging spots do not stall the other threads.
+
     Returns
     -------
     current : list
-        A single-element list containing the current index of the
-        spot being processed.
-    thetas, CRLBs, likelihoods, iterations
+        A single-element list containing the number of fitted spots.
+        Fitting is finished once it equals the number of spots.
+    thetas, CRLBs, likelihoods, iterations(, converged)
         The same as in ``gaussmle``.
     """
     N = len(spots)
-    thetas = np.zeros((N, 6), dtype=np.float32)
-    CRLBs = np.inf * np.ones((N, 6), dtype=np.float32)
-    likelihoods = np.zeros(N, dtype=np.float32)
-    iterations = np.zeros(N, dtype=np.int32)
-    n_workers = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
+    sigmaxy = _fit_method(method)
+    order, init_thetas, previous = _prepare_start(N, init_thetas, previous)
+    variances = _prepare_variances(spots, variances)
+    thetas, CRLBs, likelihoods, iterations, converged = _allocate_results(N)
+    n_workers = resources.n_workers("fit", processes=False)
+    block_size = max(1, min(_MLE_BLOCK_SIZE, N // (8 * n_workers)))
     lock = threading.Lock()
+    next_spot = [0]
     current = [0]
-    if method == "sigma":
-        func = _mlefit_sigma
-    elif method == "sigmaxy":
-        func = _mlefit_sigmaxy
-    else:
-        raise ValueError("Method not available.")
     executor = futures.ThreadPoolExecutor(n_workers)
     for i in range(n_workers):
         executor.submit(
             _worker,
-            func,
             spots,
+            order,
             thetas,
             CRLBs,
             likelihoods,
             iterations,
+            converged,
             eps,
             max_it,
+            converge_all,
+            sigmaxy,
+            init_thetas,
+            previous,
+            variances,
+            next_spot,
             current,
             lock,
+            block_size,
         )
     executor.shutdown(wait=False)
+    if return_converged:
+        return current, thetas, CRLBs, likelihoods, iterations, converged
     return current, thetas, CRLBs, likelihoods, iterations
 
 
+def iteration_statistics(
+    iterations: lib.IntArray1D,
+    max_it: int,
+    converged: lib.BoolArray1D | None = None,
+) -> dict[str, float | int | list[int]]:
+    """Summarize the number of iterations of MLE fits, e.g., to tune
+    ``max_it`` or to compare warm starts.
+
+    Parameters
+    ----------
+    iterations : lib.IntArray1D
+        Number of iterations of each fit.
+    max_it : int
+        The maximum number of iterations used for fitting.
+    converged : lib.BoolArray1D or None, optional
+        Whether each fit converged, see ``gaussmle``. Default is None,
+        i.e., fits that stopped at ``max_it`` count as not converged,
+        including those that converged in the last iteration.
+
+    Returns
+    -------
+    statistics : dict
+        Mean number of iterations, number of fits that did not converge
+        and the histogram of the number of iterations (the i-th count
+        is the number of fits that took i iterations).
+    """
+    iterations = np.asarray(iterations, dtype=np.int64)
+    if not len(iterations):
+        return {
+            "Mean iterations": 0.0,
+            "Not converged": 0,
+            "Iterations histogram": [],
+        }
+    if converged is None:
+        not_converged = iterations >= max_it
+    else:
+        not_converged = ~np.asarray(converged, dtype=bool)
+    return {
+        "Mean iterations": round(float(iterations.mean()), 3),
+        "Not converged": int(not_converged.sum()),
+        "Iterations histogram": np.bincount(iterations).tolist(),
+    }
+
+
 @numba.jit(nopython=True, nogil=True)
 def _mlefit_sigma(
     spots: lib.FloatArray3D,
     index: int,
+    theta: lib.FloatArray1D,
     thetas: lib.FloatArray2D,
     CRLBs: lib.FloatArray2D,
     likelihoods: lib.FloatArray1D,
     iterations: lib.IntArray1D,
+    converged: lib.BoolArray1D,
     eps: float,
     max_it: int,
+    converge_all: bool,
+    variance: lib.FloatArray2D,
 ) -> None:
     """Fits a Gaussian to a single spot using Maximum Likelihood
     Estimation (MLE) with a single sigma for both x and y dimensions.
+    ``theta`` holds the initial parameters and is updated in place.
+    ``variance`` is the per-pixel camera variance (photons^2), which is
+    added to the data and the model (zero for EMCCD cameras).
 
     Based on the work of Smith, et al. Nature Methods, 2010. The
     equations mentioned below refer to the supplementary information of
@@ -553,7 +996,6 @@ def _mlefit_sigma(
     size, _ = spot.shape
 
     # theta is [x, y, N, bg, S]
-    theta = _initial_theta_sigma(spot, size)
     # Set maximum iteration for each parameter
     max_step = np.zeros(n_params, dtype=np.float32)
     max_step[0:2] = theta[4]
@@ -567,8 +1009,8 @@ def _mlefit_sigma(
     numerator = np.zeros(n_params, dtype=np.float32)
     denominator = np.zeros(n_params, dtype=np.float32)
 
-    old_x = theta[0]
-    old_y = theta[1]
+    old_theta = theta.copy()
+    converged_ = False
 
     kk = 0
     while (
@@ -612,10 +1054,10 @@ def _mlefit_sigma(
                 # fairly easily following the logic of equations 10, 11
                 # and 14
 
-                # equation 2, model := mu_k
-                model = theta[2] * PSFx * PSFy + theta[3]
+                # equation 2, model := mu_k (+ sCMOS variance)
+                model = theta[2] * PSFx * PSFy + theta[3] + variance[jj, ii]
                 cf = df = 0.0
-                data = spot[jj, ii]  # data := x_k
+                data = spot[jj, ii] + variance[jj, ii]  # data := x_k
                 if model > 10e-3:
                     cf = data / model - 1  # cf := (x_k / mu_k - 1) (eq 13)
                     df = data / model**2  # df := x_k / mu_k^2 (eq 13)
@@ -629,19 +1071,16 @@ def _mlefit_sigma(
         _update_theta_sigma(theta, numerator, denominator, max_step, size)
 
         # Check for convergence
-        if (np.abs(old_x - theta[0]) < eps) and (
-            np.abs(old_y - theta[1]) < eps
-        ):
+        if _has_converged(theta, old_theta, eps, converge_all):
+            converged_ = True
             break
-        else:
-            old_x = theta[0]
-            old_y = theta[1]
 
     # Fitting is finished here, we save the results in the output arrays
     thetas[index, 0:5] = theta
     thetas[index, 5] = theta[4]
     iterations[index] = kk
-    _mlefit_sigma_crlb(theta, spot, index, CRLBs, likelihoods)
+    converged[index] = converged_
+    _mlefit_sigma_crlb(theta, spot, index, CRLBs, likelihoods, variance)
 
 
 @numba.jit(nopython=True, nogil=True)
@@ -677,6 +1116,7 @@ def _mlefit_sigma_crlb(
     index: int,
     CRLBs: lib.FloatArray2D,
     likelihoods: lib.FloatArray1D,
+    variance: lib.FloatArray2D,
 ) -> None:
     """Calculate the Cramer-Rao Lower Bounds (CRLB) for a single spot
     fitted with a Gaussian with a single sigma for both x and y
@@ -712,7 +1152,8 @@ def _mlefit_sigma_crlb(
             dudt[3] = 1.0
 
             # Building the Fisher Information Matrix
-            model = theta[2] * PSFx * PSFy + theta[3]  # model := mu_k
+            # model := mu_k (+ sCMOS variance)
+            model = theta[2] * PSFx * PSFy + theta[3] + variance[jj, ii]
             for kk in range(n_params):
                 for ll in range(kk, n_params):
                     M[kk, ll] += dudt[ll] * dudt[kk] / model
@@ -720,7 +1161,7 @@ def _mlefit_sigma_crlb(
 
             # log-likelihood, see equation 7 + Stirling approximation
             if model > 0:
-                data = spot[jj, ii]
+                data = spot[jj, ii] + variance[jj, ii]
                 if data > 0:
                     log_likelihood += (
                         data * np.log(model)
@@ -746,15 +1187,21 @@ def _mlefit_sigma_crlb(
 def _mlefit_sigmaxy(
     spots: lib.FloatArray3D,
     index: int,
+    theta: lib.FloatArray1D,
     thetas: lib.FloatArray2D,
     CRLBs: lib.FloatArray2D,
     likelihoods: lib.FloatArray1D,
     iterations: lib.IntArray1D,
+    converged: lib.BoolArray1D,
     eps: float,
     max_it: int,
+    converge_all: bool,
+    variance: lib.FloatArray2D,
 ) -> None:
     """Fit a Gaussian to a single spot using Maximum Likelihood
     Estimation (MLE) with separate sigmas for x and y dimensions.
+    ``theta`` holds the initial parameters and is updated in place.
+    See ``_mlefit_sigma`` for ``variance``.
 
     Based on the work of Smith, et al. Nature Methods, 2010. The
     equations mentioned below refer to the supplementary information of
@@ -765,7 +1212,6 @@ def _mlefit_sigmaxy(
     size, _ = spot.shape
 
     # theta is [x, y, N, bg, Sx (sigma_x), Sy (sigma_y)]
-    theta = _initial_theta_sigmaxy(spot, size)
     # Set maximum iteration for each parameter
     max_step = np.zeros(n_params, dtype=np.float32)
     max_step[0:2] = theta[4]
@@ -779,10 +1225,8 @@ def _mlefit_sigmaxy(
     numerator = np.zeros(n_params, dtype=np.float32)
     denominator = np.zeros(n_params, dtype=np.float32)
 
-    old_x = theta[0]
-    old_y = theta[1]
-    old_sx = theta[4]
-    old_sy = theta[5]
+    old_theta = theta.copy()
+    converged_ = False
 
     kk = 0
     while (
@@ -824,10 +1268,10 @@ def _mlefit_sigmaxy(
                 # fairly easily following the logic of equations 10, 11
                 # and 14
 
-                # equation 2, model := mu_k
-                model = theta[2] * PSFx * PSFy + theta[3]
+                # equation 2, model := mu_k (+ sCMOS variance)
+                model = theta[2] * PSFx * PSFy + theta[3] + variance[jj, ii]
                 cf = df = 0.0
-                data = spot[jj, ii]  # data := x_k
+                data = spot[jj, ii] + variance[jj, ii]  # data := x_k
                 if model > 10e-3:
                     cf = data / model - 1  # cf := (x_k / mu_k - 1) (eq 13)
                     df = data / model**2  # df := x_k / mu_k^2 (eq 13)
@@ -841,20 +1285,15 @@ def _mlefit_sigmaxy(
         _update_theta_sigmaxy(theta, numerator, denominator, max_step)
 
         # Check for convergence
-        if np.abs(old_x - theta[0]) < eps:
-            if np.abs(old_y - theta[1]) < eps:
-                if np.abs(old_sx - theta[4]) < eps:
-                    if np.abs(old_sy - theta[5]) < eps:
-                        break
-        old_x = theta[0]
-        old_y = theta[1]
-        old_sx = theta[4]
-        old_sy = theta[5]
+        if _has_converged(theta, old_theta, eps, converge_all):
+            converged_ = True
+            break
 
     # Fitting is finished here, we save the results in the output arrays
     thetas[index] = theta
     iterations[index] = kk
-    _mlefit_sigmaxy_crlb(theta, spot, index, CRLBs, likelihoods)
+    converged[index] = converged_
+    _mlefit_sigmaxy_crlb(theta, spot, index, CRLBs, likelihoods, variance)
 
 
 @numba.jit(nopython=True, nogil=True)
@@ -891,6 +1330,7 @@ def _mlefit_sigmaxy_crlb(
     index: int,
     CRLBs: lib.FloatArray2D,
     likelihoods: lib.FloatArray1D,
+    variance: lib.FloatArray2D,
 ) -> None:
     """Calculate the Cramer-Rao Lower Bounds (CRLB) for a single spot
     fitted with a Gaussian with separate sigmas for x and y dimensions.
@@ -925,7 +1365,8 @@ def _mlefit_sigmaxy_crlb(
             dudt[3] = 1.0
 
             # Building the Fisher Information Matrix
-            model = theta[2] * PSFx * PSFy + theta[3]  # model := mu_k
+            # model := mu_k (+ sCMOS variance)
+            model = theta[2] * PSFx * PSFy + theta[3] + variance[jj, ii]
             for kk in range(n_params):
                 for ll in range(kk, n_params):
                     M[kk, ll] += dudt[ll] * dudt[kk] / model
@@ -933,7 +1374,7 @@ def _mlefit_sigmaxy_crlb(
 
             # log-likelihood, see equation 7 + Stirling approximation
             if model > 0:
-                data = spot[jj, ii]
+                data = spot[jj, ii] + variance[jj, ii]
                 if data > 0:
                     log_likelihood += (
                         data * np.log(model)
@@ -954,6 +1395,519 @@ def _mlefit_sigmaxy_crlb(
     CRLBs[index] = CRLB
 
 
+# spots fitted between two progress updates in ``gaussmle_multi``
+_MULTI_BLOCK_SIZE = 10_000
+
+
+@numba.jit(nopython=True, nogil=True)
+def _multi_model(
+    theta: lib.FloatArray1D,
+    k: int,
+    ii: int,
+    jj: int,
+    dudt: lib.FloatArray1D,
+    d2udt2: lib.FloatArray1D,
+) -> float:
+    """Model value of the pixel (ii, jj) for ``k`` emitters with a
+    common background and sigma, ``theta`` is [x_1, y_1, N_1, ...,
+    x_k, y_k, N_k, bg, sigma]. The first and second derivatives w.r.t.
+    the parameters are written into ``dudt`` and ``d2udt2``."""
+    i_bg = 3 * k
+    sigma = theta[i_bg + 1]
+    model = theta[i_bg]
+    dudt[i_bg] = 1.0
+    d2udt2[i_bg] = 0.0
+    dudt[i_bg + 1] = 0.0
+    d2udt2[i_bg + 1] = 0.0
+    for e in range(k):
+        x = theta[3 * e]
+        y = theta[3 * e + 1]
+        photons = theta[3 * e + 2]
+        PSFx = _gaussian_integral(ii, x, sigma)
+        PSFy = _gaussian_integral(jj, y, sigma)
+        dudt[3 * e], d2udt2[3 * e] = _derivative_gaussian_integral(
+            ii, x, sigma, photons, PSFy
+        )
+        dudt[3 * e + 1], d2udt2[3 * e + 1] = _derivative_gaussian_integral(
+            jj, y, sigma, photons, PSFx
+        )
+        dudt[3 * e + 2] = PSFx * PSFy
+        d2udt2[3 * e + 2] = 0.0
+        dsigma, d2sigma = _derivative_gaussian_integral_iso_sigma(
+            ii, jj, x, y, sigma, photons, PSFx, PSFy
+        )
+        dudt[i_bg + 1] += dsigma
+        d2udt2[i_bg + 1] += d2sigma
+        model += photons * PSFx * PSFy
+    return model
+
+
+@numba.jit(nopython=True, nogil=True)
+def _mlefit_multi(
+    spot: lib.FloatArray2D,
+    theta: lib.FloatArray1D,
+    k: int,
+    eps: float,
+    max_it: int,
+    converge_all: bool,
+    variance: lib.FloatArray2D,
+) -> tuple[int, bool]:
+    """Fit ``k`` emitters to a spot, see ``_multi_model``. ``theta``
+    holds the initial parameters and is updated in place. Same
+    Newton-Raphson scheme, camera ``variance`` and convergence criterion
+    (``converge_all``, see ``_has_converged``) as ``_mlefit_sigma``.
+    Returns the number of iterations and whether the fit converged."""
+    n_params = 3 * k + 2
+    size = spot.shape[0]
+    i_bg = 3 * k
+
+    max_step = np.empty(n_params, dtype=np.float64)
+    for e in range(k):
+        max_step[3 * e] = theta[i_bg + 1]
+        max_step[3 * e + 1] = theta[i_bg + 1]
+        max_step[3 * e + 2] = 0.1 * theta[3 * e + 2]
+    max_step[i_bg] = 0.1 * theta[i_bg]
+    max_step[i_bg + 1] = 0.2 * theta[i_bg + 1]
+
+    dudt = np.zeros(n_params, dtype=np.float64)
+    d2udt2 = np.zeros(n_params, dtype=np.float64)
+    numerator = np.zeros(n_params, dtype=np.float64)
+    denominator = np.zeros(n_params, dtype=np.float64)
+    old_theta = theta[:n_params].copy()
+    converged = False
+
+    kk = 0
+    while kk < max_it:
+        kk += 1
+        numerator[:] = 0.0
+        denominator[:] = 0.0
+        for ii in range(size):
+            for jj in range(size):
+                model = _multi_model(theta, k, ii, jj, dudt, d2udt2)
+                model += variance[jj, ii]
+                cf = df = 0.0
+                data = spot[jj, ii] + variance[jj, ii]
+                if model > 10e-3:
+                    cf = data / model - 1
+                    df = data / model**2
+                cf = min(cf, 10e4)
+                df = min(df, 10e4)
+                for ll in range(n_params):
+                    numerator[ll] += cf * dudt[ll]
+                    denominator[ll] += cf * d2udt2[ll] - df * dudt[ll] ** 2
+
+        for ll in range(n_params):
+            if denominator[ll] == 0.0:
+                theta[ll] -= np.sign(numerator[ll]) * max_step[ll]
+            else:
+                theta[ll] -= min(
+                    max(numerator[ll] / denominator[ll], -max_step[ll]),
+                    max_step[ll],
+                )
+
+        # constraints, emitters may not leave the box
+        for e in range(k):
+            theta[3 * e] = min(max(theta[3 * e], -1.0), size)
+            theta[3 * e + 1] = min(max(theta[3 * e + 1], -1.0), size)
+            theta[3 * e + 2] = max(theta[3 * e + 2], 1.0)
+        theta[i_bg] = max(theta[i_bg], 0.01)
+        theta[i_bg + 1] = min(max(theta[i_bg + 1], 0.01), size)
+
+        converged = True
+        for ll in range(n_params):
+            change = np.abs(theta[ll] - old_theta[ll])
+            old_theta[ll] = theta[ll]
+            position = ll < i_bg and ll % 3 != 2
+            if not (position or converge_all):
+                continue
+            if ll == i_bg or (ll < i_bg and ll % 3 == 2):
+                # photons and background relative to their values
+                change /= max(np.abs(theta[ll]), 1.0)
+            if change >= eps:
+                converged = False
+        if converged:
+            break
+    return kk, converged
+
+
+@numba.jit(nopython=True, nogil=True)
+def _mlefit_multi_crlb(
+    spot: lib.FloatArray2D,
+    theta: lib.FloatArray1D,
+    k: int,
+    crlb: lib.FloatArray1D,
+    variance: lib.FloatArray2D,
+) -> float:
+    """Write the CRLBs of a multi-emitter fit into ``crlb`` and return
+    its log-likelihood, see ``_mlefit_sigma_crlb``."""
+    n_params = 3 * k + 2
+    size = spot.shape[0]
+    dudt = np.zeros(n_params, dtype=np.float64)
+    d2udt2 = np.zeros(n_params, dtype=np.float64)
+    M = np.zeros((n_params, n_params), dtype=np.float64)
+    log_likelihood = 0.0
+    for ii in range(size):
+        for jj in range(size):
+            model = _multi_model(theta, k, ii, jj, dudt, d2udt2)
+            model += variance[jj, ii]
+            for kk in range(n_params):
+                for ll in range(kk, n_params):
+                    M[kk, ll] += dudt[ll] * dudt[kk] / model
+                    M[ll, kk] = M[kk, ll]
+            data = spot[jj, ii] + variance[jj, ii]
+            if data > 0:
+                log_likelihood += (
+                    data * np.log(model) - model - data * np.log(data) + data
+                )
+            else:
+                log_likelihood += -model
+    Minv = np.linalg.pinv(M)
+    for kk in range(n_params):
+        crlb[kk] = Minv[kk, kk]
+    return log_likelihood
+
+
+@numba.jit(nopython=True, nogil=True)
+def _add_emitter(
+    spot: lib.FloatArray2D, theta: lib.FloatArray1D, k: int
+) -> lib.FloatArray1D:
+    """Initial parameters for ``k + 1`` emitters: the fit of ``k``
+    emitters plus one emitter at the maximum of the residuals."""
+    size = spot.shape[0]
+    n_params = 3 * k + 2
+    dudt = np.zeros(n_params, dtype=np.float64)
+    d2udt2 = np.zeros(n_params, dtype=np.float64)
+    max_residual = -np.inf
+    x_max = y_max = 0
+    for ii in range(size):
+        for jj in range(size):
+            residual = spot[jj, ii] - _multi_model(
+                theta, k, ii, jj, dudt, d2udt2
+            )
+            if residual > max_residual:
+                max_residual = residual
+                x_max = ii
+                y_max = jj
+    sigma = theta[3 * k + 1]
+    new_theta = np.empty(n_params + 3, dtype=np.float64)
+    new_theta[: 3 * k] = theta[: 3 * k]
+    new_theta[3 * k] = x_max
+    new_theta[3 * k + 1] = y_max
+    new_theta[3 * k + 2] = max(max_residual * 2 * np.pi * sigma**2, 1.0)
+    new_theta[3 * k + 3] = theta[3 * k]
+    new_theta[3 * k + 4] = sigma
+    return new_theta
+
+
+@numba.jit(nopython=True, nogil=True)
+def _emitters_valid(theta: lib.FloatArray1D, k: int, size: int) -> bool:
+    """Whether all emitters of a fit lie in the box, are brighter than
+    the lower bound and are separated by more than sigma."""
+    sigma = theta[3 * k + 1]
+    for e in range(k):
+        x = theta[3 * e]
+        y = theta[3 * e + 1]
+        if not (-0.5 <= x <= size - 0.5 and -0.5 <= y <= size - 0.5):
+            return False
+        if theta[3 * e + 2] <= 1.0:
+            return False
+        for f in range(e):
+            distance = np.sqrt(
+                (x - theta[3 * f]) ** 2 + (y - theta[3 * f + 1]) ** 2
+            )
+            if distance <= sigma:
+                return False
+    return True
+
+
+@numba.jit(nopython=True, nogil=True)
+def _mlefit_multi_spot(
+    spot: lib.FloatArray2D,
+    max_emitters: int,
+    penalty: float,
+    eps: float,
+    max_it: int,
+    converge_all: bool,
+    variance: lib.FloatArray2D,
+    theta_out: lib.FloatArray2D,
+    crlb_out: lib.FloatArray2D,
+) -> tuple[float, int, int, bool]:
+    """Fit 1 to ``max_emitters`` emitters to a spot and keep the model
+    with the lowest score, -2 * log-likelihood + k * ``penalty``. The
+    emitters of the chosen model are written into the rows of
+    ``theta_out`` and ``crlb_out`` (x, y, photons, bg, sx, sy). Returns
+    the log-likelihood, number of iterations, number of emitters and
+    convergence of the chosen model."""
+    size = spot.shape[0]
+    start = _initial_theta_sigma(spot, size)
+    theta = np.empty(5, dtype=np.float64)
+    for i in range(5):
+        theta[i] = start[i]
+    best_score = np.inf
+    best_k = 0
+    best_likelihood = 0.0
+    best_iterations = 0
+    best_converged = False
+    n_max = 3 * max_emitters + 2
+    best_theta = np.empty(n_max, dtype=np.float64)
+    best_crlb = np.empty(n_max, dtype=np.float64)
+    for k in range(1, max_emitters + 1):
+        if k > 1:
+            theta = _add_emitter(spot, theta, k - 1)
+        iterations, converged = _mlefit_multi(
+            spot, theta, k, eps, max_it, converge_all, variance
+        )
+        crlb = np.empty(3 * k + 2, dtype=np.float64)
+        likelihood = _mlefit_multi_crlb(spot, theta, k, crlb, variance)
+        score = -2 * likelihood + k * penalty
+        # a single emitter is always accepted
+        if k == 1 or (score < best_score and _emitters_valid(theta, k, size)):
+            best_score = score
+            best_k = k
+            best_likelihood = likelihood
+            best_iterations = iterations
+            best_converged = converged
+            best_theta[: 3 * k + 2] = theta
+            best_crlb[: 3 * k + 2] = crlb
+    i_bg = 3 * best_k
+    for e in range(best_k):
+        for d in range(3):
+            theta_out[e, d] = best_theta[3 * e + d]
+            crlb_out[e, d] = best_crlb[3 * e + d]
+        theta_out[e, 3] = best_theta[i_bg]
+        crlb_out[e, 3] = best_crlb[i_bg]
+        for d in range(4, 6):
+            theta_out[e, d] = best_theta[i_bg + 1]
+            crlb_out[e, d] = best_crlb[i_bg + 1]
+    return best_likelihood, best_iterations, best_k, best_converged
+
+
+@numba.jit(nopython=True, nogil=True)
+def _mlefit_multi_serial(
+    spots: lib.FloatArray3D,
+    max_emitters: int,
+    penalty: float,
+    eps: float,
+    max_it: int,
+    converge_all: bool,
+    variances: lib.FloatArray3D,
+    thetas: lib.FloatArray3D,
+    CRLBs: lib.FloatArray3D,
+    likelihoods: lib.FloatArray1D,
+    iterations: lib.IntArray1D,
+    n_emitters: lib.IntArray1D,
+    converged: lib.BoolArray1D,
+) -> None:
+    """Fit the spots one after the other, see ``_mlefit_multi_spot``.
+    ``variances`` holds the per-pixel camera variance of each spot or
+    is empty (no camera noise)."""
+    no_variance = np.zeros(spots.shape[1:], dtype=np.float32)
+    for i in range(len(spots)):
+        variance = variances[i] if len(variances) > 0 else no_variance
+        likelihood, its, n, conv = _mlefit_multi_spot(
+            spots[i],
+            max_emitters,
+            penalty,
+            eps,
+            max_it,
+            converge_all,
+            variance,
+            thetas[i],
+            CRLBs[i],
+        )
+        likelihoods[i] = likelihood
+        iterations[i] = its
+        n_emitters[i] = n
+        converged[i] = conv
+
+
+@numba.njit(parallel=True, nogil=True)
+def _mlefit_multi_parallel(
+    spots: lib.FloatArray3D,
+    max_emitters: int,
+    penalty: float,
+    eps: float,
+    max_it: int,
+    converge_all: bool,
+    variances: lib.FloatArray3D,
+    thetas: lib.FloatArray3D,
+    CRLBs: lib.FloatArray3D,
+    likelihoods: lib.FloatArray1D,
+    iterations: lib.IntArray1D,
+    n_emitters: lib.IntArray1D,
+    converged: lib.BoolArray1D,
+) -> None:
+    """Multithreaded version of ``_mlefit_multi_serial``."""
+    no_variance = np.zeros(spots.shape[1:], dtype=np.float32)
+    for i in numba.prange(len(spots)):
+        variance = variances[i] if len(variances) > 0 else no_variance
+        likelihood, its, n, conv = _mlefit_multi_spot(
+            spots[i],
+            max_emitters,
+            penalty,
+            eps,
+            max_it,
+            converge_all,
+            variance,
+            thetas[i],
+            CRLBs[i],
+        )
+        likelihoods[i] = likelihood
+        iterations[i] = its
+        n_emitters[i] = n
+        converged[i] = conv
+
+
+def gaussmle_multi(
+    spots: lib.FloatArray3D,
+    eps: float,
+    max_it: int,
+    max_emitters: int = 3,
+    penalty: float | None = None,
+    parallel: bool = True,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+    abort_callback: Callable[[], bool] | None = None,
+    variances: lib.FloatArray3D | None = None,
+    converge_all: bool = False,
+    return_converged: bool = False,
+) -> (
+    tuple[
+        lib.FloatArray3D,
+        lib.FloatArray3D,
+        lib.FloatArray1D,
+        lib.IntArray1D,
+        lib.IntArray1D,
+    ]
+    | tuple[
+        lib.FloatArray3D,
+        lib.FloatArray3D,
+        lib.FloatArray1D,
+        lib.IntArray1D,
+        lib.IntArray1D,
+        lib.BoolArray1D,
+    ]
+):
+    """Fits 1 to ``max_emitters`` Gaussians with a common background
+    and sigma to each spot using Maximum Likelihood Estimation (MLE),
+    e.g., to localize overlapping emitters in dense frames. The number
+    of emitters is chosen by penalized likelihood, i.e., the model with
+    the lowest -2 * log-likelihood + n_emitters * ``penalty``.
+
+    Models with more than one emitter are only accepted if all emitters
+    lie within the box, are brighter than 1 photon and are separated by
+    more than sigma.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    spots : lib.FloatArray3D
+        The input image patches containing the spots of shape
+        (N, size, size).
+    eps : float
+        The convergence criterion for the fitting algorithm.
+    max_it : int
+        The maximum number of iterations for each model.
+    max_emitters : int, optional
+        Maximum number of emitters per spot. Default is 3.
+    penalty : float or None, optional
+        Penalty per emitter added to -2 * log-likelihood. None uses the
+        Bayesian information criterion (BIC), i.e., 3 * ln(size**2)
+        for the 3 parameters of each emitter. A likelihood ratio test is
+        obtained by using a quantile of the chi-squared distribution
+        with 3 degrees of freedom, e.g., 16.27 (p = 0.001). Default is
+        None.
+    parallel : bool, optional
+        Whether to fit the spots on all CPU threads in compiled code.
+        Default is True.
+    progress_callback : callable or None
+        If a callable provided, it must accept one integer input (number
+        of localized spots). If "console", tqdm is used to display
+        progress. If None, progress is not tracked.
+    abort_callback : callable or None, optional
+        Called without arguments between blocks of spots. If it returns
+        True, fitting stops and the remaining spots are left unfitted
+        (NaN). Default is None.
+    variances : lib.FloatArray3D or None, optional
+        Camera read noise variance of each pixel of the spots in
+        photons^2, see ``gaussmle``. Default is None.
+    converge_all : bool, optional
+        If True, all parameters must converge, see ``gaussmle``.
+        Default is False, i.e., only the positions of the emitters are
+        checked.
+    return_converged : bool, optional
+        Whether to also return if the fit of each spot converged, see
+        ``gaussmle``. Default is False.
+
+    Returns
+    -------
+    thetas : lib.FloatArray3D
+        Fitted parameters of shape (N, max_emitters, 6), the columns are
+        x, y, photons, background, sigma_x and sigma_y (both equal to
+        the common sigma). Rows of emitters beyond ``n_emitters`` are
+        NaN.
+    CRLBs : lib.FloatArray3D
+        The Cramer-Rao Lower Bounds of the fitted parameters, same shape
+        as ``thetas``.
+    likelihoods : lib.FloatArray1D
+        The log-likelihoods of the chosen models, shape (N,).
+    iterations : lib.IntArray1D
+        The number of iterations of the chosen models, shape (N,).
+    n_emitters : lib.IntArray1D
+        The number of emitters of each spot, shape (N,).
+    converged : lib.BoolArray1D
+        Whether the fits of the chosen models converged, shape (N,).
+        Only returned if ``return_converged`` is True.
+    """
+    if max_emitters < 1:
+        raise ValueError("max_emitters must be at least 1.")
+    spots = np.ascontiguousarray(spots, dtype=np.float32)
+    variances = _prepare_variances(spots, variances)
+    N, size, _ = spots.shape
+    if penalty is None:
+        penalty = 3 * np.log(size * size)
+    thetas = np.full((N, max_emitters, 6), np.nan, dtype=np.float32)
+    CRLBs = np.full((N, max_emitters, 6), np.nan, dtype=np.float32)
+    likelihoods = np.zeros(N, dtype=np.float32)
+    iterations = np.zeros(N, dtype=np.int32)
+    n_emitters = np.zeros(N, dtype=np.int32)
+    converged = np.zeros(N, dtype=np.bool_)
+    kernel = _mlefit_multi_parallel if parallel else _mlefit_multi_serial
+    use_tqdm = progress_callback == "console"
+    if use_tqdm:
+        pbar = tqdm(total=N, desc="Fitting...", unit="spot")
+    for start in range(0, N, _MULTI_BLOCK_SIZE):
+        if callable(abort_callback) and abort_callback():
+            break
+        stop = min(start + _MULTI_BLOCK_SIZE, N)
+        kernel(
+            spots[start:stop],
+            max_emitters,
+            float(penalty),
+            eps,
+            max_it,
+            converge_all,
+            variances[start:stop],
+            thetas[start:stop],
+            CRLBs[start:stop],
+            likelihoods[start:stop],
+            iterations[start:stop],
+            n_emitters[start:stop],
+            converged[start:stop],
+        )
+        if use_tqdm:
+            pbar.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop)
+    if use_tqdm:
+        pbar.close()
+    if return_converged:
+        return thetas, CRLBs, likelihoods, iterations, n_emitters, converged
+    return thetas, CRLBs, likelihoods, iterations, n_emitters
+
+
 def locs_from_fits(
     identifications: pd.DataFrame,
     theta: lib.FloatArray2D,
@@ -961,6 +1915,7 @@ def locs_from_fits(
     log_likelihoods: lib.FloatArray1D,
     iterations: lib.IntArray1D,
     box: int,
+    converged: lib.BoolArray1D | None = None,
 ) -> pd.DataFrame:
     """Convert the results of Gaussian fits into a data frame array
     suitable for further analysis or visualization.
@@ -985,6 +1940,9 @@ def locs_from_fits(
     box : int
         The size of the box used for fitting, which is used to
         calculate the offsets for the x and y coordinates.
+    converged : lib.BoolArray1D or None, optional
+        Whether each fit converged (see ``gaussmle``), stored in the
+        column `converged` if given. Default is None.
 
     Returns
     -------
@@ -1029,6 +1987,12 @@ def locs_from_fits(
             "sy_unc": sy_unc.astype(np.float32),
         }
     )
+    if converged is not None:
+        locs.insert(
+            locs.columns.get_loc("iterations") + 1,
+            "converged",
+            np.asarray(converged, dtype=bool),
+        )
     if "n_id" in identifications.columns:
         locs["n_id"] = identifications.n_id.astype(np.uint32)
         locs.sort_values(by=["n_id"], kind="quicksort", inplace=True)
@@ -1037,6 +2001,93 @@ def locs_from_fits(
     return locs
 
 
+def locs_from_multi_fits(
+    identifications: pd.DataFrame,
+    thetas: lib.FloatArray3D,
+    CRLBs: lib.FloatArray3D,
+    log_likelihoods: lib.FloatArray1D,
+    iterations: lib.IntArray1D,
+    n_emitters: lib.IntArray1D,
+    box: int,
+    converged: lib.BoolArray1D | None = None,
+) -> pd.DataFrame:
+    """Convert the results of ``gaussmle_multi`` into localizations,
+    one per emitter, with the columns of ``locs_from_fits`` and the
+    number of emitters fitted in the spot (`n_emitters`).
+
+    Boxes of nearby spots overlap, so an emitter may be fitted in
+    several of them. Each emitter is therefore only kept in the box
+    whose center (identification) in the same frame is nearest.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    identifications : pd.DataFrame
+        Data frame containing the identifications of the spots, see
+        ``locs_from_fits``.
+    thetas, CRLBs, log_likelihoods, iterations, n_emitters
+        The results of ``gaussmle_multi``.
+    box : int
+        The size of the box used for fitting.
+    converged : lib.BoolArray1D or None, optional
+        Whether the fit of each spot converged, see ``locs_from_fits``.
+        Default is None.
+
+    Returns
+    -------
+    locs : pd.DataFrame
+        Localizations of the emitters.
+    """
+    n_emitters = np.asarray(n_emitters, dtype=np.int64)
+    index = np.repeat(np.arange(len(n_emitters)), n_emitters)
+    first = np.repeat(np.cumsum(n_emitters) - n_emitters, n_emitters)
+    slot = np.arange(len(index)) - first
+    box_offset = int(box / 2)
+    x_center = identifications["x"].to_numpy(dtype=np.float64)
+    y_center = identifications["y"].to_numpy(dtype=np.float64)
+    x = thetas[index, slot, 0] + x_center[index] - box_offset
+    y = thetas[index, slot, 1] + y_center[index] - box_offset
+    keep = _nearest_spot(identifications, index, x, y, box) == index
+    index = index[keep]
+    slot = slot[keep]
+    locs = locs_from_fits(
+        identifications.iloc[index].reset_index(drop=True),
+        thetas[index, slot],
+        CRLBs[index, slot],
+        log_likelihoods[index],
+        iterations[index],
+        box,
+        converged=None if converged is None else converged[index],
+    )
+    locs["n_emitters"] = pd.Series(n_emitters[index], dtype=np.uint8)
+    return locs
+
+
+def _nearest_spot(
+    identifications: pd.DataFrame,
+    index: lib.IntArray1D,
+    x: lib.FloatArray1D,
+    y: lib.FloatArray1D,
+    box: int,
+) -> lib.IntArray1D:
+    """Index of the identification whose center is nearest to each of
+    the positions (x, y), searching in the frame of the identification
+    ``index``."""
+    x_center = identifications["x"].to_numpy(dtype=np.float64)
+    y_center = identifications["y"].to_numpy(dtype=np.float64)
+    if not len(x_center):
+        return np.zeros(0, dtype=np.int64)
+    # frames are spaced further apart than any two positions in a frame
+    spacing = 4 * (
+        max(np.abs(x_center).max(), np.abs(y_center).max()) + box + 1
+    )
+    frames = identifications["frame"].to_numpy(dtype=np.float64) * spacing
+    tree = KDTree(np.column_stack((x_center, y_center, frames)))
+    _, nearest = tree.query(np.column_stack((x, y, frames[index])))
+    return nearest
+
+
 def sigma_uncertainty(
     sigma: lib.SeriesOrFloatArray1D,
     sigma_orth: lib.SeriesOrFloatArray1D,
@@ -1583,7 +1583,7 @@ class LocColumnSelectionDialog(lib.Dialog):
                 for col in subcols:
                     columns[col] = True
         for column, checkbox in self.column_checkboxes.items():
-            is_checked = columns[column]
+            is_checked = columns.get(column, True)
             checkbox.setChecked(is_checked)
 
 
@@ -1754,6 +1754,8 @@ class Window(QtWidgets.QMainWindow):
         select_columns_action = file_menu.addAction("Select columns to save")
         select_columns_action.triggered.connect(self.columns_dialog.show)
         file_menu.addAction(select_columns_action)
+        read_ahead_action = file_menu.addAction("Read-ahead frames")
+        read_ahead_action.triggered.connect(self.set_read_ahead)
         file_menu.addSeparator()
         export_current_action = file_menu.addAction("Export current view")
         export_current_action.setShortcut("Ctrl+E")
@@ -1933,9 +1935,21 @@ class Window(QtWidgets.QMainWindow):
         else:
             prompt_info = self.prompt_info
 
-        result = io.load_movie(path, prompt_info=prompt_info)
+        # optional read-ahead of frames, e.g., for network drives
+        read_ahead = io.load_user_settings()["Localize"].get("read_ahead")
+        result = io.load_movie(
+            path,
+            prompt_info=prompt_info,
+            read_ahead=(
+                read_ahead
+                if isinstance(read_ahead, int) and read_ahead > 0
+                else None
+            ),
+        )
 
         if result is not None:
+            if isinstance(self.movie, io.ReadAheadMovie):
+                self.movie.stop()
             self.movie, self.info = result
             dt = time.time() - t0
             self.movie_path = path
@@ -2021,6 +2035,26 @@ class Window(QtWidgets.QMainWindow):
         if path:
             self.load_locs(path)
 
+    def set_read_ahead(self) -> None:
+        """Ask for the number of frames read ahead in a background
+        thread when opening movies (0 disables read-ahead). The value is
+        stored in the user settings and used for the next movie opened.
+        """
+        settings = io.load_user_settings()
+        read_ahead = settings["Localize"].get("read_ahead")
+        n_frames, ok = QtWidgets.QInputDialog.getInt(
+            self,
+            "Read-ahead",
+            "Frames read ahead when opening a movie (0 to disable):",
+            read_ahead if isinstance(read_ahead, int) else 0,
+            min=0,
+            max=100_000,
+        )
+        if not ok:
+            return
+        settings["Localize"]["read_ahead"] = n_frames if n_frames else None
+        io.save_user_settings(settings)
+
     def load_locs(self, path: str) -> None:
         """Load localizations from a HDF5 file. Provide spot
         identifications."""
@@ -2440,6 +2474,9 @@ class Window(QtWidgets.QMainWindow):
                 f"Identified {n_identifications:,} spots (Box Size: {box}; "
                 f"Min. Net Gradient: {mng}). Ready for fit."
             )
+            if isinstance(self.movie, io.ReadAheadMovie):
+                hit_rate = self.movie.statistics()["Hit rate"]
+                message += f" Read-ahead hit rate: {hit_rate:.0%}."
             self.status_bar.showMessage(message)
             self.identifications = identifications
             self.ready_for_fit = True
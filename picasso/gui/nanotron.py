@@ -16,7 +16,6 @@ import importlib
 import pkgutil
 import datetime
 import threading
-import multiprocessing
 import joblib
 import yaml
 import concurrent.futures
@@ -32,7 +31,7 @@ from sklearn.metrics import confusion_matrix
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtGui import QIcon
 
-from .. import io, lib, render, nanotron, __version__
+from .. import io, lib, render, nanotron, resources, __version__
 
 DEFAULT_MODEL_PATH = os.path.join(
     os.sep,
@@ -416,9 +415,7 @@ class Predictor(QtCore.QThread):
 
         lock = threading.Lock()
 
-        n_workers = min(
-            60, max(1, int(0.75 * multiprocessing.cpu_count()))
-        )  # Python crashes when using >64 cores
+        n_workers = resources.n_workers("nanotron", processes=False)
 
         current = [0]
         finished = [0]
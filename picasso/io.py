@@ -19,7 +19,8 @@ import json
 import os
 import threading
 import warnings
-from typing import Callable, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Literal
 
 import tifffile
 import yaml
@@ -37,6 +38,39 @@ if bitplane.IMSWRITER:
     from .ext.bitplane import IMSFile
 
 
+# rows per chunk of the columnar localizations layout, see ``save_locs``;
+# the compressed size hardly depends on it (< 0.1% between 2**14 and
+# 2**18 rows for 10**6 localizations), whereas frame ranges are read in
+# whole chunks (256 kB per float32 column)
+_LOCS_CHUNK_ROWS = 2**16
+# HDF5 file format of the columnar layout: the chunk indices of HDF5
+# 1.10 add far less overhead per column than the default B-trees,
+# which would double the size of small files
+_LOCS_COLUMNS_LIBVER = ("v110", "latest")
+# rows per block processed by ``LazyLocs``
+_LAZY_LOCS_BLOCK_ROWS = 2**20
+
+
+def _read_at(file, offset: int, out: np.ndarray, lock: threading.Lock) -> None:
+    """Fill ``out`` with the bytes of ``file`` starting at ``offset``.
+    Uses a positional read (``os.preadv``) where available, which does
+    not touch the file position, such that frames can be read from
+    several threads at once through the same file handle. Otherwise,
+    seeking and reading are serialized with ``lock``."""
+    buffer = memoryview(out).cast("B")
+    if hasattr(os, "preadv"):
+        n_bytes = os.preadv(file.fileno(), [buffer], offset)
+    else:
+        with lock:
+            file.seek(offset)
+            n_bytes = file.readinto(buffer)
+    if n_bytes != out.nbytes:
+        raise ValueError(
+            f"Unexpected end of file {file.name} when reading"
+            f" {out.nbytes} bytes at offset {offset}."
+        )
+
+
 class NoMetadataFileError(FileNotFoundError):
     pass
 
@@ -279,11 +313,13 @@ def load_tif(path: str, progress=None) -> tuple[TiffMultiMap, list[dict]]:
     -------
     movie : TiffMultiMap
         A movie object providing array-like access to TIFF frames.
-        Frames are loaded into memory on access.
+        Uncompressed little-endian files with regularly spaced frames
+        are memory-mapped, otherwise frames are loaded into memory on
+        access.
     info : list[dict]
         A list containing a dictionary with metadata about the movie.
     """
-    movie = TiffMultiMap(path, memmap_frames=False)
+    movie = TiffMultiMap(path, memmap_frames=True)
     info = movie.info()
     return movie, [info]
 
@@ -337,6 +373,7 @@ def load_movie(
     path: str,
     prompt_info=None,
     progress=None,
+    read_ahead: int | None = None,
 ) -> tuple[AbstractPicassoMovie, list[dict]]:
     """Load a movie file based on its extension and returns the movie
     object and its metadata. Accepted format are ``.raw``, ``ome.tif``,
@@ -350,6 +387,11 @@ def load_movie(
         Placeholder for prompt information, not used in this function.
     progress : None
         Placeholder for progress tracking, not used in this function.
+    read_ahead : int, optional
+        If given, frames of ``.tif``, ``.nd2`` and ``.stk`` movies are
+        read ahead by a background thread, keeping up to this many
+        frames in a buffer, see ``ReadAheadMovie``. Ignored for ``.raw``
+        and ``.ims`` files, which are memory-mapped. Default is None.
 
     Returns
     -------
@@ -363,13 +405,18 @@ def load_movie(
     if ext == ".raw":
         return load_raw(path, prompt_info=prompt_info)
     elif ext == ".tif" or ext == ".tiff":
-        return load_tif(path)
+        movie, info = load_tif(path)
     elif ext == ".ims":
         return load_ims(path, prompt_info=prompt_info)
     elif ext == ".nd2":
-        return load_nd2(path)
+        movie, info = load_nd2(path)
     elif ext == ".stk":
-        return load_stk(path)
+        movie, info = load_stk(path)
+    else:
+        return
+    if read_ahead:
+        movie = ReadAheadMovie(movie, read_ahead)
+    return movie, info
 
 
 def load_info(
@@ -633,6 +680,9 @@ class AbstractPicassoMovie(abc.ABC):
     """An abstract class defining the minimal interfaces of a
     PicassoMovie used throughout Picasso."""
 
+    # whether frames can be read from multiple threads concurrently
+    concurrent_reads = False
+
     @abc.abstractmethod
     def __init__(self):
         self.use_dask = False
@@ -1132,9 +1182,16 @@ class ND2Movie(AbstractPicassoMovie):
 
 class TiffMap:
     """Read TIFF files and provide array-like access to TIFF image data.
-    Frames are loaded into memory on access (not memory-mapped).
+    Frames are loaded into memory on access, unless ``memmap_frames`` is
+    set and the frames are stored uncompressed, in little-endian byte
+    order and at a regular stride in the file (as written by
+    Micro-Manager), in which case they are exposed as a memory-mapped
+    array (``memmap``).
     This class is used for single-frame TIFF files, not multi-page TIFFs.
-    Both classic TIFF (magic 42) and BigTIFF (magic 43) are supported."""
+    Both classic TIFF (magic 42) and BigTIFF (magic 43) are supported.
+    Frames can be read from multiple threads concurrently."""
+
+    concurrent_reads = True
 
     TIFF_TYPES = {
         1: "B",
@@ -1160,7 +1217,9 @@ class TiffMap:
         "RATIONAL": 8,
     }
 
-    def __init__(self, path: str, verbose: bool = False):  # noqa: C901
+    def __init__(  # noqa: C901
+        self, path: str, verbose: bool = False, memmap_frames: bool = False
+    ):
         """Initialize the TiffMap object by reading the TIFF file and
         extracting metadata such as width, height, and data type.
         Automatically detects classic TIFF (magic=42) and BigTIFF
@@ -1213,6 +1272,7 @@ class TiffMap:
         #   BigTIFF:  tag(H) type(H) count(Q) value_or_offset(Q)   = 20 bytes
         self.file.seek(self.first_ifd_offset)
         n_entries = self.read(self._n_entries_type)
+        self.compression = 1  # no compression
         for i in range(n_entries):
             self.file.seek(
                 self.first_ifd_offset
@@ -1226,7 +1286,9 @@ class TiffMap:
             # Threshold is _value_field_size (4 for classic, 8 for BigTIFF).
             if count * self.TYPE_SIZES[type] > self._value_field_size:
                 self.file.seek(self.read(self._offset_type))
-            if tag == 256:
+            if tag == 259:
+                self.compression = self.read(type, count)
+            elif tag == 256:
                 self.width = self.read(type, count)
             elif tag == 257:
                 self.height = self.read(type, count)
@@ -1243,16 +1305,30 @@ class TiffMap:
 
         # Collect image offsets by walking the IFD chain.
         self.image_offsets = []
-        offset = self.first_ifd_offset
-        last_offset = (
-            self.first_ifd_offset
-        )  # safe fallback if first read fails
-        while offset != 0:
+        # safe fallback if first read fails
+        self.last_ifd_offset = self.first_ifd_offset
+        self._read_image_offsets(self.first_ifd_offset)
+        self.lock = threading.Lock()  # for reading without os.preadv
+        self._memmap_frames = memmap_frames
+        self.memmap = self._map_frames() if memmap_frames else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _read_image_offsets(self, offset: int) -> None:
+        """Walk the IFD chain starting at ``offset`` and append the image
+        offsets found to ``image_offsets``. ``last_ifd_offset`` is set to
+        the position of the next-IFD pointer of the last IFD read."""
+        while offset:
             self.file.seek(offset)
             n_entries = self.read(self._n_entries_type)
             if n_entries is None:
                 # Some MM files have trailing nonsense bytes
                 break
+            image_offset = None
             for i in range(n_entries):
                 self.file.seek(
                     offset + self._ifd_count_size + i * self._entry_size
@@ -1261,63 +1337,123 @@ class TiffMap:
                 if tag == 273:
                     type = self.TIFF_TYPES[self.read("H")]
                     count = self.read(self._count_type)
-                    self.image_offsets.append(self.read(type, count))
+                    image_offset = self.read(type, count)
                     break
 
             # Seek to the next-IFD pointer, which sits immediately after
             # all entries. Its width is _offset_type (4 or 8 bytes).
-            self.file.seek(
-                offset + self._ifd_count_size + n_entries * self._entry_size
-            )
-            last_offset = (
+            pointer_offset = (
                 offset + self._ifd_count_size + n_entries * self._entry_size
             )
+            self.file.seek(pointer_offset)
             offset = self.read(self._offset_type)
+            if offset is None:
+                # the IFD is incomplete, e.g., still being written
+                break
+            if image_offset is not None:
+                self.image_offsets.append(image_offset)
+            self.last_ifd_offset = pointer_offset
         self.n_frames = len(self.image_offsets)
-        self.last_ifd_offset = last_offset
-        self.lock = threading.Lock()
 
-    def __enter__(self):
-        return self
+    def refresh(self) -> int:
+        """Read the IFDs appended to the file since it was opened or
+        last refreshed, e.g., while a movie is being acquired. Only the
+        new part of the IFD chain is read.
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.close()
+        Since v0.10.1.
+
+        Returns
+        -------
+        n_new_frames : int
+            Number of frames added.
+        """
+        n_frames = self.n_frames
+        with self.lock:
+            # seeking from the end drops buffered (possibly stale) bytes
+            self.file.seek(0, os.SEEK_END)
+            if self.last_ifd_offset == self.first_ifd_offset:
+                # no complete IFD was read so far
+                offset = self.first_ifd_offset
+            else:
+                self.file.seek(self.last_ifd_offset)
+                offset = self.read(self._offset_type)
+            self._read_image_offsets(offset)
+        if self.n_frames > n_frames and self._memmap_frames:
+            self.memmap = self._map_frames()
+        return self.n_frames - n_frames
+
+    def _map_frames(self) -> lib.IntArray3D | None:
+        """Memory-map all frames as a single array of shape
+        (n_frames, height, width) if they are uncompressed, little-endian
+        and spaced at a regular stride in the file. Returns None
+        otherwise."""
+        if (
+            self.compression != 1
+            or self._tif_byte_order != "<"
+            or self.n_frames == 0
+        ):
+            return None
+        offsets = np.array(self.image_offsets, dtype=np.int64)
+        itemsize = self.dtype.itemsize
+        frame_bytes = self.frame_size * itemsize
+        stride = frame_bytes
+        if self.n_frames > 1:
+            strides = np.diff(offsets)
+            stride = int(strides[0])
+            if stride < frame_bytes or (strides != stride).any():
+                return None
+        n_bytes = stride * (self.n_frames - 1) + frame_bytes
+        if offsets[0] + n_bytes > os.path.getsize(self.path):
+            return None
+        # copy-on-write such that frames are writable like loaded ones
+        data = np.memmap(
+            self.path,
+            dtype=np.uint8,
+            mode="c",
+            offset=int(offsets[0]),
+            shape=(n_bytes,),
+        )
+        return np.ndarray(
+            shape=(self.n_frames, self.height, self.width),
+            dtype=self.dtype,
+            buffer=data,
+            strides=(stride, self.width * itemsize, itemsize),
+        )
 
     def __getitem__(self, it):  # noqa: C901
-        with self.lock:  # for reading frames from multiple threads
-            if isinstance(it, tuple):
-                if isinstance(it, int) or np.issubdtype(it[0], np.integer):
-                    return self[it[0]][it[1:]]
-                elif isinstance(it[0], slice):
-                    indices = range(*it[0].indices(self.n_frames))
-                    stack = np.array([self.get_frame(_) for _ in indices])
-                    if len(indices) == 0:
-                        return stack
-                    else:
-                        if len(it) == 2:
-                            return stack[:, it[1]]
-                        elif len(it) == 3:
-                            return stack[:, it[1], it[2]]
-                        else:
-                            raise IndexError
-                elif it[0] == Ellipsis:
-                    stack = self[it[0]]
+        if self.memmap is not None:
+            return self.memmap[it]
+        if isinstance(it, tuple):
+            if isinstance(it[0], (int, np.integer)):
+                return self[it[0]][it[1:]]
+            elif isinstance(it[0], slice):
+                indices = range(*it[0].indices(self.n_frames))
+                stack = np.array([self.get_frame(_) for _ in indices])
+                if len(indices) == 0:
+                    return stack
+                else:
                     if len(it) == 2:
                         return stack[:, it[1]]
                     elif len(it) == 3:
                         return stack[:, it[1], it[2]]
                     else:
                         raise IndexError
-            elif isinstance(it, slice):
-                indices = range(*it.indices(self.n_frames))
-                return np.array([self.get_frame(_) for _ in indices])
-            elif it == Ellipsis:
-                return np.array(
-                    [self.get_frame(_) for _ in range(self.n_frames)]
-                )
-            elif isinstance(it, int) or np.issubdtype(it, np.integer):
-                return self.get_frame(it)
-            raise TypeError
+            elif it[0] == Ellipsis:
+                stack = self[it[0]]
+                if len(it) == 2:
+                    return stack[:, it[1]]
+                elif len(it) == 3:
+                    return stack[:, it[1], it[2]]
+                else:
+                    raise IndexError
+        elif isinstance(it, slice):
+            indices = range(*it.indices(self.n_frames))
+            return np.array([self.get_frame(_) for _ in indices])
+        elif it == Ellipsis:
+            return np.array([self.get_frame(_) for _ in range(self.n_frames)])
+        elif isinstance(it, int) or np.issubdtype(it, np.integer):
+            return self.get_frame(it)
+        raise TypeError
 
     def __iter__(self):
         for i in range(self.n_frames):
@@ -1402,15 +1538,10 @@ class TiffMap:
 
     def get_frame(self, index: int, array: None = None) -> lib.IntArray2D:
         """Load one frame of the TIFF movie."""
-        self.file.seek(self.image_offsets[index])
-        frame = np.reshape(
-            np.fromfile(
-                self.file,
-                dtype=self._tif_dtype,
-                count=self.frame_size,
-            ),
-            self.frame_shape,
-        )
+        if self.memmap is not None:
+            return self.memmap[index]
+        frame = np.empty(self.frame_shape, dtype=self._tif_dtype)
+        _read_at(self.file, self.image_offsets[index], frame, self.lock)
         # We only want to deal with little endian byte order downstream:
         if self._tif_byte_order == ">":
             frame.byteswap(True)
@@ -1434,10 +1565,12 @@ class TiffMap:
             return None
 
     def close(self) -> None:
+        self.memmap = None
         self.file.close()
 
     def tofile(self, file_handle, byte_order=None):
-        do_byteswap = byte_order != self._tif_byte_order
+        # frames are converted to little-endian byte order on reading
+        do_byteswap = byte_order == ">"
         for image in self:
             if do_byteswap:
                 image = image.byteswap()
@@ -1457,6 +1590,8 @@ class STKMovie(AbstractPicassoMovie):
     matching the pattern of ``TiffMap``.
     """
 
+    concurrent_reads = True
+
     def __init__(self, path: str):
         super().__init__()
         self.path = os.path.abspath(path)
@@ -1499,7 +1634,7 @@ class STKMovie(AbstractPicassoMovie):
 
         # Open a persistent binary file handle for lazy frame reading.
         self._file = open(self.path, "rb")
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # for reading without os.preadv
 
     # ------------------------------------------------------------------
     # AbstractPicassoMovie interface
@@ -1512,39 +1647,36 @@ class STKMovie(AbstractPicassoMovie):
         self.close()
 
     def __getitem__(self, it):  # noqa: C901
-        with self._lock:
-            if isinstance(it, tuple):
-                if isinstance(it[0], int) or np.issubdtype(it[0], np.integer):
-                    return self[it[0]][it[1:]]
-                elif isinstance(it[0], slice):
-                    indices = range(*it[0].indices(self.n_frames))
-                    stack = np.array([self.get_frame(_) for _ in indices])
-                    if len(indices) == 0:
-                        return stack
-                    if len(it) == 2:
-                        return stack[:, it[1]]
-                    elif len(it) == 3:
-                        return stack[:, it[1], it[2]]
-                    else:
-                        raise IndexError
-                elif it[0] == Ellipsis:
-                    stack = self[it[0]]
-                    if len(it) == 2:
-                        return stack[:, it[1]]
-                    elif len(it) == 3:
-                        return stack[:, it[1], it[2]]
-                    else:
-                        raise IndexError
-            elif isinstance(it, slice):
-                indices = range(*it.indices(self.n_frames))
-                return np.array([self.get_frame(_) for _ in indices])
-            elif it == Ellipsis:
-                return np.array(
-                    [self.get_frame(_) for _ in range(self.n_frames)]
-                )
-            elif isinstance(it, int) or np.issubdtype(it, np.integer):
-                return self.get_frame(it)
-            raise TypeError
+        if isinstance(it, tuple):
+            if isinstance(it[0], int) or np.issubdtype(it[0], np.integer):
+                return self[it[0]][it[1:]]
+            elif isinstance(it[0], slice):
+                indices = range(*it[0].indices(self.n_frames))
+                stack = np.array([self.get_frame(_) for _ in indices])
+                if len(indices) == 0:
+                    return stack
+                if len(it) == 2:
+                    return stack[:, it[1]]
+                elif len(it) == 3:
+                    return stack[:, it[1], it[2]]
+                else:
+                    raise IndexError
+            elif it[0] == Ellipsis:
+                stack = self[it[0]]
+                if len(it) == 2:
+                    return stack[:, it[1]]
+                elif len(it) == 3:
+                    return stack[:, it[1], it[2]]
+                else:
+                    raise IndexError
+        elif isinstance(it, slice):
+            indices = range(*it.indices(self.n_frames))
+            return np.array([self.get_frame(_) for _ in indices])
+        elif it == Ellipsis:
+            return np.array([self.get_frame(_) for _ in range(self.n_frames)])
+        elif isinstance(it, int) or np.issubdtype(it, np.integer):
+            return self.get_frame(it)
+        raise TypeError
 
     def __iter__(self):
         for i in range(self.n_frames):
@@ -1602,12 +1734,8 @@ class STKMovie(AbstractPicassoMovie):
                 f"{self.n_frames} frames."
             )
         offset = self._first_data_offset + index * self._frame_bytes
-        self._file.seek(offset)
-        frame = np.fromfile(
-            self._file,
-            dtype=self._tif_dtype,
-            count=self.height * self.width,
-        ).reshape(self.frame_shape)
+        frame = np.empty(self.frame_shape, dtype=self._tif_dtype)
+        _read_at(self._file, offset, frame, self._lock)
         if self._byte_order == ">":
             frame = frame.byteswap().view(self._dtype)
         return frame
@@ -1638,6 +1766,8 @@ class STKMultiMovie(AbstractPicassoMovie):
     file is used.
     """
 
+    concurrent_reads = True
+
     def __init__(self, path: str):
         super().__init__()
         self.path = os.path.abspath(path)
@@ -1759,38 +1889,49 @@ class STKMultiMovie(AbstractPicassoMovie):
 class TiffMultiMap(AbstractPicassoMovie):
     """Read ``.ome.tif`` files created by MicroManager. Single files are
     maxed out at 4GB, so this class orchestrates reading from single
-    files, each accessed by ``TiffMap``."""
+    files, each accessed by ``TiffMap``.
+
+    The files following ``path`` are found by their names, unless they
+    are given explicitly as ``paths`` (since v0.10.1)."""
+
+    concurrent_reads = True
 
     def __init__(
         self,
         path: str,
         memmap_frames: bool = False,
         verbose: bool = False,
+        paths: list[str] | None = None,
     ):
         super().__init__()
         self.path = os.path.abspath(path)
         self.dir = os.path.dirname(self.path)
 
+        self._verbose = verbose
+        self._memmap_frames = memmap_frames
+
         # This matches the basename + an appendix of the file number
         filename = os.path.basename(self.path)
-        if "NDTiffStack" in filename:
+        if paths is not None:
+            self._pattern = None
+        elif "NDTiffStack" in filename:
             # only one extension (.tif)
             base, ext = os.path.splitext(self.path)
             base = re.escape(base)
-            pattern = re.compile(base + r"_(\d*).tif")
+            self._pattern = re.compile(base + r"_(\d*).tif")
         else:
             # split two extensions as in .ome.tif
             base, ext = os.path.splitext(os.path.splitext(self.path)[0])
             base = re.escape(base)
-            pattern = re.compile(base + r"_(\d*).ome.tif")
-        entries = [_.path for _ in os.scandir(self.dir) if _.is_file()]
-        matches = [re.match(pattern, _) for _ in entries]
-        matches = [_ for _ in matches if _ is not None]
-        paths_indices = [(int(_.group(1)), _.group(0)) for _ in matches]
-        self.paths = [self.path] + [
-            path for index, path in sorted(paths_indices)
+            self._pattern = re.compile(base + r"_(\d*).ome.tif")
+        if paths is None:
+            self.paths = self._find_paths()
+        else:
+            self.paths = [os.path.abspath(_) for _ in paths]
+        self.maps = [
+            TiffMap(path, verbose=verbose, memmap_frames=memmap_frames)
+            for path in self.paths
         ]
-        self.maps = [TiffMap(path, verbose=verbose) for path in self.paths]
         self.n_maps = len(self.maps)
         self.n_frames_per_map = [_.n_frames for _ in self.maps]
         self.n_frames = sum(self.n_frames_per_map)
@@ -1806,7 +1947,86 @@ class TiffMultiMap(AbstractPicassoMovie):
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
+    def _find_paths(self) -> list[str]:
+        """Return ``path`` followed by the files matching its name with
+        an appendix of the file number, sorted by that number."""
+        entries = [_.path for _ in os.scandir(self.dir) if _.is_file()]
+        matches = [re.match(self._pattern, _) for _ in entries]
+        matches = [_ for _ in matches if _ is not None]
+        paths_indices = [(int(_.group(1)), _.group(0)) for _ in matches]
+        return [self.path] + [path for index, path in sorted(paths_indices)]
+
+    def refresh(self) -> int:
+        """Read the frames appended to the last file since it was opened
+        or last refreshed, e.g., while a movie is being acquired (see
+        ``TiffMap.refresh``), and open the files started since then,
+        unless the files were given explicitly as ``paths``.
+
+        Since v0.10.1.
+
+        Returns
+        -------
+        n_new_frames : int
+            Number of frames added.
+        """
+        # look for new files first: once the next file has been started,
+        # the frames of the current last file are complete
+        if self._pattern is None:
+            new_paths = []
+        else:
+            new_paths = [_ for _ in self._find_paths() if _ not in self.paths]
+        n_frames = self.n_frames
+        try:
+            self.maps[-1].refresh()
+            self.n_frames_per_map[-1] = self.maps[-1].n_frames
+            for path in new_paths:
+                tiff_map = TiffMap(
+                    path,
+                    verbose=self._verbose,
+                    memmap_frames=self._memmap_frames,
+                )
+                self.paths.append(path)
+                self.maps.append(tiff_map)
+                self.n_frames_per_map.append(tiff_map.n_frames)
+        finally:
+            self.n_maps = len(self.maps)
+            self.n_frames = sum(self.n_frames_per_map)
+            self.cum_n_frames = np.insert(
+                np.cumsum(self.n_frames_per_map), 0, 0
+            )
+            self.shape = (self.n_frames, self.height, self.width)
+        return self.n_frames - n_frames
+
+    @property
+    def memmaps(self) -> list[lib.IntArray3D] | None:
+        """Memory-mapped frames of each file (see ``TiffMap.memmap``)
+        or None if not all files could be memory-mapped."""
+        memmaps = [_.memmap for _ in self.maps]
+        if any(_ is None for _ in memmaps):
+            return None
+        return memmaps
+
+    def _get_mapped_frames(self, indices: range) -> lib.IntArray3D:
+        """Read frames from the memory-mapped files, with one fancy
+        indexing operation per file."""
+        frames = np.arange(indices.start, indices.stop, indices.step)
+        map_indices = np.searchsorted(self.cum_n_frames, frames, "right") - 1
+        stack = np.empty((len(frames), self.height, self.width), self._dtype)
+        for i, memmap in enumerate(self.memmaps):
+            in_map = map_indices == i
+            if in_map.any():
+                stack[in_map] = memmap[frames[in_map] - self.cum_n_frames[i]]
+        return stack
+
     def __getitem__(self, it):  # noqa: C901
+        memmaps = self.memmaps
+        if memmaps is not None:
+            if self.n_maps == 1:
+                return memmaps[0][it]
+            if isinstance(it, slice):
+                return self._get_mapped_frames(
+                    range(*it.indices(self.n_frames))
+                )
         if isinstance(it, tuple):
             if it[0] == Ellipsis:
                 stack = self[it[0]]
@@ -1818,7 +2038,7 @@ class TiffMultiMap(AbstractPicassoMovie):
                     raise IndexError
             elif isinstance(it[0], slice):
                 indices = range(*it[0].indices(self.n_frames))
-                stack = np.array([self.get_frame(_) for _ in indices])
+                stack = self[it[0]]
                 if len(indices) == 0:
                     return stack
                 else:
@@ -1834,7 +2054,7 @@ class TiffMultiMap(AbstractPicassoMovie):
             indices = range(*it.indices(self.n_frames))
             return np.array([self.get_frame(_) for _ in indices])
         elif it == Ellipsis:
-            return np.array([self.get_frame(_) for _ in range(self.n_frames)])
+            return self[:]
         elif isinstance(it, int) or np.issubdtype(it, np.integer):
             return self.get_frame(it)
         raise TypeError
@@ -1968,34 +2188,312 @@ class TiffMultiMap(AbstractPicassoMovie):
             map.tofile(file_handle, byte_order)
 
 
-def to_raw_combined(basename: str, paths: list[str]) -> None:
+class ReadAheadMovie(AbstractPicassoMovie):
+    """Wrap a movie such that frames are read ahead, in frame order, by
+    a background thread into a bounded buffer, see ``load_movie``.
+
+    Frames up to ``read_ahead`` behind and ahead of the latest requested
+    frame are kept, so that frames requested slightly out of order (by
+    concurrent identification threads) or revisited (when browsing the
+    movie) are still served from the buffer. Requesting a frame outside
+    of this window restarts reading ahead from that frame.
+
+    Parameters
+    ----------
+    movie : AbstractPicassoMovie
+        Movie whose frames are read ahead.
+    read_ahead : int
+        Number of frames read ahead of the latest requested frame.
+
+    Attributes
+    ----------
+    n_frames : int
+        Number of frames in the movie.
+    read_ahead : int
+        Number of frames read ahead of the latest requested frame.
+    hits : int
+        Number of frames served from the buffer.
+    misses : int
+        Number of frames read on request.
+    """
+
+    concurrent_reads = True
+
+    def __init__(self, movie: AbstractPicassoMovie, read_ahead: int = 64):
+        super().__init__()
+        assert read_ahead > 0, "read_ahead must be positive"
+        self.movie = movie
+        self.n_frames = len(movie)
+        self.read_ahead = read_ahead
+        self.use_dask = False
+        self.hits = 0
+        self.misses = 0
+        self._buffer = {}
+        self._reading = set()  # frames being read by the background thread
+        self._position = 0  # next frame to be read ahead
+        self._latest = 0  # latest requested frame
+        self._stopped = False
+        self._condition = threading.Condition()
+        # frames of the wrapped movie are read either by the background
+        # thread or on request, serialize if that is not thread-safe
+        if getattr(movie, "concurrent_reads", False):
+            self._read_lock = None
+        else:
+            self._read_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._read_ahead, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getitem__(self, it):
+        if isinstance(it, (int, np.integer)):
+            return self.get_frame(int(it))
+        return self._read(it)
+
+    def __iter__(self):
+        for i in range(self.n_frames):
+            yield self.get_frame(i)
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.movie.shape
+
+    @property
+    def dtype(self):
+        return self.movie.dtype
+
+    def info(self) -> dict:
+        return self.movie.info()
+
+    def camera_parameters(self, config: dict) -> dict:
+        return self.movie.camera_parameters(config)
+
+    def tofile(self, file_handle, byte_order=None):
+        self.movie.tofile(file_handle, byte_order)
+
+    def _read(self, it) -> lib.IntArray2D | lib.IntArray3D:
+        """Read from the wrapped movie."""
+        if self._read_lock is None:
+            return self.movie[it]
+        with self._read_lock:
+            return self.movie[it]
+
+    def _read_ahead(self) -> None:
+        """Background thread filling the buffer in frame order."""
+        while True:
+            with self._condition:
+                while not self._stopped and (
+                    self._position >= self.n_frames
+                    or self._position >= self._latest + self.read_ahead
+                ):
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                index = self._position
+                self._position += 1
+                if index in self._buffer:
+                    continue
+                self._reading.add(index)
+            frame = None
+            try:
+                frame = self._read(index)
+            except Exception:
+                # leave the frame out of the buffer, such that get_frame
+                # reads it on request and the error reaches the caller
+                pass
+            finally:
+                with self._condition:
+                    self._reading.discard(index)
+                    if frame is not None and (
+                        self._latest - self.read_ahead
+                        <= index
+                        < self._latest + self.read_ahead
+                    ):
+                        self._buffer[index] = frame
+                    self._condition.notify_all()
+
+    def get_frame(self, index: int) -> lib.IntArray2D:
+        """Return one frame, from the buffer if it has been read ahead
+        already."""
+        if index < 0:
+            index += self.n_frames
+        with self._condition:
+            if index < self._latest - self.read_ahead:
+                # jump back (e.g., when browsing), read ahead from here
+                self._buffer.clear()
+                self._position = index + 1
+                self._latest = index
+            else:
+                if index >= self._position:
+                    # reading ahead fell behind, skip to the requested frame
+                    self._position = index + 1
+                self._latest = max(self._latest, index)
+            # drop frames that fell behind the window
+            for key in [
+                _ for _ in self._buffer if _ < self._latest - self.read_ahead
+            ]:
+                del self._buffer[key]
+            self._condition.notify_all()
+            while index in self._reading:
+                self._condition.wait()
+            frame = self._buffer.get(index)
+            if frame is not None:
+                self.hits += 1
+                return frame
+            self.misses += 1
+        return self._read(index)
+
+    def statistics(self) -> dict:
+        """Return the number of buffer hits and misses and the hit
+        rate."""
+        n_requests = self.hits + self.misses
+        return {
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Hit rate": self.hits / n_requests if n_requests else 0.0,
+        }
+
+    def stop(self) -> None:
+        """Stop reading ahead, without closing the wrapped movie."""
+        with self._condition:
+            self._stopped = True
+            self._buffer.clear()
+            self._condition.notify_all()
+        self._thread.join()
+
+    def close(self) -> None:
+        self.stop()
+        self.movie.close()
+
+
+def _contiguous_runs(
+    offsets: list[int], n_bytes: int
+) -> list[tuple[int, int]]:
+    """Merge blocks of ``n_bytes`` at ``offsets`` into runs of adjacent
+    blocks, given as ``(offset, length)``."""
+    runs = []
+    for offset in offsets:
+        if runs and sum(runs[-1]) == offset:
+            runs[-1] = (runs[-1][0], runs[-1][1] + n_bytes)
+        else:
+            runs.append((offset, n_bytes))
+    return runs
+
+
+def _copy_tif_to_raw(path: str, raw_path: str, offset: int) -> None:
+    """Write the frames of the TIFF file ``path`` in little-endian byte
+    order into ``raw_path``, starting at byte ``offset``.
+
+    Uncompressed little-endian frames are copied within the kernel
+    (``os.copy_file_range``, Linux) without passing through Python.
+    Otherwise, or if the file system does not support it, the frames
+    are read and written through a separate file handle."""
+    with TiffMap(path) as tif, open(raw_path, "r+b") as raw_file:
+        if (
+            hasattr(os, "copy_file_range")
+            and tif.compression == 1
+            and tif._tif_byte_order == "<"
+        ):
+            frame_bytes = tif.frame_size * tif.dtype.itemsize
+            runs = _contiguous_runs(tif.image_offsets, frame_bytes)
+            position = offset
+            try:
+                for source, length in runs:
+                    while length > 0:
+                        n = os.copy_file_range(
+                            tif.file.fileno(),
+                            raw_file.fileno(),
+                            length,
+                            source,
+                            position,
+                        )
+                        if n == 0:
+                            raise OSError(f"Unexpected end of file {path}.")
+                        source += n
+                        position += n
+                        length -= n
+                return
+            except OSError:  # e.g., not supported by the file system
+                pass
+        raw_file.seek(offset)
+        tif.tofile(raw_file, "<")
+
+
+def to_raw_combined(
+    basename: str,
+    paths: list[str],
+    virtual: bool = False,
+) -> tuple[TiffMultiMap, list[dict]] | None:
     """Combine multiple TIFF files into a single raw file in the OME
     format.
 
+    Since v0.10.1, the raw file is allocated at its final size and the
+    files are copied in parallel, each to its known offset.
+
     Parameters
     ----------
     basename : str
         The base name for the output raw file.
     paths : list of strs
         List of paths to the TIFF files to be combined.
+    virtual : bool, optional
+        If True, no raw file is written. Instead, the TIFF files are
+        returned as one movie (``TiffMultiMap``), which can be
+        localized like a raw file (since v0.10.1). Default is False.
+
+    Returns
+    -------
+    result : tuple or None
+        ``(movie, info)`` if ``virtual``, see ``load_tif``. None
+        otherwise.
     """
+    from . import resources
+
+    if virtual:
+        movie = TiffMultiMap(paths[0], memmap_frames=True, paths=paths)
+        return movie, [movie.info()]
+
     raw_file_name = basename + ".ome.raw"
+    offsets = []
+    n_bytes = 0
+    for i, path in enumerate(paths):
+        with TiffMap(path) as tif:
+            info_ = tif.info()
+            offsets.append(n_bytes)
+            n_bytes += tif.n_frames * tif.frame_size * tif.dtype.itemsize
+        if i == 0:
+            info = info_
+        else:
+            info["Frames"] += info_["Frames"]
+            if "Comments" in info_:
+                info["Comments"] = info_["Comments"]
     with open(raw_file_name, "wb") as file_handle:
-        with TiffMap(paths[0]) as tif:
-            tif.tofile(file_handle, "<")
-            info = tif.info()
-        for path in paths[1:]:
-            with TiffMap(path) as tif:
-                info_ = tif.info()
-                info["Frames"] += info_["Frames"]
-                if "Comments" in info_:
-                    info["Comments"] = info_["Comments"]
-                tif.tofile(file_handle, "<")
-        info["Generated by"] = f"Picasso ToRaw v{__version__}"
-        info["Byte Order"] = "<"
-        info["Original File"] = os.path.basename(info.pop("File"))
-        info["Raw File"] = os.path.basename(raw_file_name)
-        save_info(basename + ".ome.yaml", [info])
+        file_handle.truncate(n_bytes)
+        if hasattr(os, "posix_fallocate") and n_bytes:
+            try:  # reserve contiguous space
+                os.posix_fallocate(file_handle.fileno(), 0, n_bytes)
+            except OSError:
+                pass
+    n_workers = min(len(paths), resources.n_workers("toraw", processes=False))
+    with ThreadPoolExecutor(n_workers) as executor:
+        futures = [
+            executor.submit(_copy_tif_to_raw, path, raw_file_name, offset)
+            for path, offset in zip(paths, offsets)
+        ]
+        for future in futures:
+            future.result()  # raise errors
+    info["Generated by"] = f"Picasso ToRaw v{__version__}"
+    info["Byte Order"] = "<"
+    info["Original File"] = os.path.basename(info.pop("File"))
+    info["Raw File"] = os.path.basename(raw_file_name)
+    save_info(basename + ".ome.yaml", [info])
 
 
 def get_movie_groups(paths: list[str]) -> dict[str, list[str]]:
@@ -2086,7 +2584,209 @@ def save_datasets(path: str, info: dict, **kwargs) -> None:
     save_info(info_path, info)
 
 
-def save_locs(path: str, locs: pd.DataFrame, info: list[dict]) -> None:
+def _locs_compression(compression: str | None) -> dict:
+    """Keyword arguments of ``h5py.Group.create_dataset`` for the
+    compression filter of a column of localizations. "lz4" and "blosc"
+    require the ``hdf5plugin`` package."""
+    if compression is None:
+        return {}
+    if compression in ("gzip", "lzf"):
+        return {"compression": compression, "shuffle": True}
+    if compression not in ("lz4", "blosc"):
+        raise ValueError(
+            f"Unknown compression {compression!r}, choose from 'gzip', "
+            "'lzf', 'lz4', 'blosc' or None."
+        )
+    try:
+        import hdf5plugin
+    except ModuleNotFoundError:
+        raise ImportError(
+            f"Compression {compression!r} requires the hdf5plugin "
+            "package (pip install hdf5plugin). Use 'gzip' or 'lzf' "
+            "instead."
+        )
+    if compression == "lz4":
+        return dict(hdf5plugin.LZ4())
+    return dict(hdf5plugin.Blosc(cname="lz4"))
+
+
+def _write_locs_columns(
+    locs_file: h5py.File,
+    key: str,
+    locs: pd.DataFrame,
+    compression: str | None,
+) -> None:
+    """Write ``locs`` as a group with one chunked, compressed dataset
+    per column, see ``save_locs``."""
+    filters = _locs_compression(compression)
+    group = locs_file.create_group(key)
+    group.attrs["Layout"] = "columns"
+    group.attrs["Columns"] = [str(column) for column in locs.columns]
+    group.attrs["Compression"] = compression or "none"
+    n_locs = len(locs)
+    for column in locs.columns:
+        values = locs[column].to_numpy()
+        if n_locs:
+            group.create_dataset(
+                str(column),
+                data=values,
+                chunks=(min(_LOCS_CHUNK_ROWS, n_locs),),
+                **filters,
+            )
+        else:  # chunk sizes must be positive
+            group.create_dataset(str(column), data=values)
+
+
+def _read_locs_table(
+    path: str,
+    key: str,
+    columns: list[str] | None = None,
+    frames: tuple[int | None, int | None] | None = None,
+    roi: tuple[tuple[float, float], tuple[float, float]] | None = None,
+) -> pd.DataFrame:
+    """Read the localizations stored under ``key`` in either layout of
+    ``save_locs``, see ``load_locs`` for the selection arguments.
+    Raises KeyError if ``key`` is missing and ValueError if any of
+    ``columns`` is missing."""
+    with h5py.File(path, "r") as locs_file:
+        if key not in locs_file:
+            raise KeyError(f"No object named {key} in the file")
+        table = locs_file[key]
+        is_group = isinstance(table, h5py.Group)
+        _register_locs_filters(table)
+        if is_group or columns is not None or frames or roi:
+            return _select_locs(table, columns, frames, roi)
+    return pd.read_hdf(path, key=key)
+
+
+def _is_sanitized(path: str, key: str) -> bool:
+    """Whether the localizations under ``key`` were checked by
+    ``lib.ensure_sanity`` before saving, see ``save_locs``."""
+    with h5py.File(path, "r") as locs_file:
+        return bool(locs_file[key].attrs.get("Sanitized", False))
+
+
+def _register_locs_filters(table: h5py.Dataset | h5py.Group) -> None:
+    """Import ``hdf5plugin`` if needed to read the localizations."""
+    if isinstance(table, h5py.Group):
+        compression = table.attrs.get("Compression")
+        if compression in ("lz4", "blosc"):
+            _locs_compression(compression)
+
+
+def _locs_table_columns(table: h5py.Dataset | h5py.Group) -> list[str]:
+    """Column names of localizations in either layout of ``save_locs``."""
+    if isinstance(table, h5py.Group):
+        return [str(column) for column in table.attrs["Columns"]]
+    return list(table.dtype.names)
+
+
+def _read_locs_columns(
+    table: h5py.Dataset | h5py.Group,
+    columns: list[str],
+    rows: slice,
+) -> dict[str, np.ndarray]:
+    """Read ``columns`` of the rows ``rows`` (a hyperslab) of the
+    localizations in either layout of ``save_locs``."""
+    if isinstance(table, h5py.Group):
+        return {column: table[column][rows] for column in columns}
+    if not columns:
+        return {}
+    # only the requested fields of the compound dataset are converted
+    data = table.fields(columns)[rows]
+    return {column: data[column] for column in columns}
+
+
+def _locs_table_length(table: h5py.Dataset | h5py.Group) -> int:
+    """Number of localizations in either layout of ``save_locs``."""
+    if isinstance(table, h5py.Group):
+        columns = _locs_table_columns(table)
+        return len(table[columns[0]]) if columns else 0
+    return len(table)
+
+
+def _sorted_frame_rows(
+    frame: h5py.Dataset,
+    n_rows: int,
+    first: int | None,
+    last: int | None,
+) -> tuple[int, int]:
+    """Half-open range of rows of localizations sorted by frame whose
+    frame number lies between ``first`` and ``last`` (inclusive, None
+    for no bound). Bisection reads only O(log n) single values of the
+    frame column."""
+
+    def first_row(frame_number):
+        lo, hi = 0, n_rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if frame[mid] < frame_number:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    start = 0 if first is None else first_row(first)
+    stop = n_rows if last is None else first_row(last + 1)
+    return start, max(start, stop)
+
+
+def _select_locs(
+    table: h5py.Dataset | h5py.Group,
+    columns: list[str] | None,
+    frames: tuple[int | None, int | None] | None,
+    roi: tuple[tuple[float, float], tuple[float, float]] | None,
+) -> pd.DataFrame:
+    """Read selected columns and rows of the localizations, see
+    ``load_locs``."""
+    all_columns = _locs_table_columns(table)
+    if columns is None:
+        columns = all_columns
+    missing = [column for column in columns if column not in all_columns]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in the localizations.")
+    n_rows = _locs_table_length(table)
+    rows = slice(0, n_rows)
+    mask = None
+    if frames:
+        first, last = frames
+        if table.attrs.get("Sorted by frame", False):
+            frame = (
+                table["frame"]
+                if isinstance(table, h5py.Group)
+                else table.fields("frame")
+            )
+            rows = slice(*_sorted_frame_rows(frame, n_rows, first, last))
+        else:
+            frame = _read_locs_columns(table, ["frame"], rows)["frame"]
+            mask = np.ones(n_rows, dtype=bool)
+            if first is not None:
+                mask &= frame >= first
+            if last is not None:
+                mask &= frame <= last
+    if roi:
+        (y_min, x_min), (y_max, x_max) = roi
+        xy = _read_locs_columns(table, ["x", "y"], rows)
+        in_roi = (
+            (xy["y"] >= y_min)
+            & (xy["y"] < y_max)
+            & (xy["x"] >= x_min)
+            & (xy["x"] < x_max)
+        )
+        mask = in_roi if mask is None else mask[rows] & in_roi
+    data = _read_locs_columns(table, columns, rows)
+    if mask is not None:
+        data = {column: values[mask] for column, values in data.items()}
+    return pd.DataFrame(data, columns=columns)
+
+
+def save_locs(
+    path: str,
+    locs: pd.DataFrame,
+    info: list[dict],
+    layout: Literal["records", "columns"] = "records",
+    compression: Literal["gzip", "lzf", "lz4", "blosc"] | None = "gzip",
+) -> None:
     """Save localization data to an HDF5 file.
 
     Parameters
@@ -2098,29 +2798,214 @@ def save_locs(path: str, locs: pd.DataFrame, info: list[dict]) -> None:
     info : list of dict
         Metadata information to be saved alongside the localization
         data.
+    layout : {"records", "columns"}, optional
+        "records" stores the localizations as a single contiguous
+        compound dataset, which can be read by all versions of Picasso.
+        "columns" (since v0.10.1) stores one chunked, compressed
+        dataset per column in the group "locs", which gives smaller
+        files and allows reading single columns. Files with the
+        "columns" layout can only be read by Picasso v0.10.1 and above.
+        Default is "records".
+    compression : {"gzip", "lzf", "lz4", "blosc"} or None, optional
+        Compression filter of the "columns" layout, ignored otherwise.
+        "lz4" and "blosc" require the ``hdf5plugin`` package, also for
+        reading the file. Default is "gzip".
     """
-    locs = lib.ensure_sanity(locs, info)
-    # locs.to_hdf(path, key="locs", mode="w", format="fixed")
-    # cannot use to_hdf for backward compatibility with older Picasso
-    rec_locs = locs.to_records(index=False)
-    with h5py.File(path, "w") as locs_file:
-        locs_file.create_dataset("locs", data=rec_locs)
+    assert layout in [
+        "records",
+        "columns",
+    ], "layout must be 'records' or 'columns'"
+    locs = lib.ensure_sanity(locs, info, copy=False)
+    # records stay readable by older HDF5 (and Picasso) versions
+    libver = _LOCS_COLUMNS_LIBVER if layout == "columns" else None
+    with h5py.File(path, "w", libver=libver) as locs_file:
+        if layout == "columns":
+            _write_locs_columns(locs_file, "locs", locs, compression)
+        else:
+            # locs.to_hdf(path, key="locs", mode="w", format="fixed")
+            # cannot use to_hdf for backward compatibility with older
+            # Picasso
+            rec_locs = locs.to_records(index=False)
+            locs_file.create_dataset("locs", data=rec_locs)
+        # allows reading frame ranges without a full scan, see load_locs
+        # (integer attributes, which older PyTables versions can read)
+        locs_file["locs"].attrs["Sorted by frame"] = int(
+            "frame" in locs.columns and locs["frame"].is_monotonic_increasing
+        )
+        # the checks of lib.ensure_sanity can be skipped when loading
+        locs_file["locs"].attrs["Sanitized"] = 1
     base, ext = os.path.splitext(path)
     info_path = base + ".yaml"
     save_info(info_path, info)
 
 
+def append_locs_checkpoint(
+    path: str,
+    locs: pd.DataFrame,
+    last_frame: int,
+    key: str,
+    online: bool = False,
+) -> None:
+    """Append localizations to a checkpoint file and record the last
+    frame that has been completely localized, see
+    ``load_locs_checkpoint``. The file is created (or overwritten if it
+    was written with a different ``key``) on the first call.
+
+    The localizations are stored in the resizable "locs" dataset, which
+    is read by ``load_locs`` like the one written by ``save_locs``.
+
+    Parameters
+    ----------
+    path : str
+        Path to the checkpoint (.hdf5) file.
+    locs : pd.DataFrame
+        Localizations to be appended.
+    last_frame : int
+        Last frame of the movie that has been localized.
+    key : str
+        Identifies the analysis (movie and parameters), such that only
+        analyses with the same key are resumed.
+    online : bool, optional
+        Whether the movie is localized while it is being acquired (see
+        ``localize.localize_online``), which is recorded to tell such
+        checkpoints apart, see ``is_locs_checkpoint``. Default is False.
+    """
+    mode = "a" if is_locs_checkpoint(path, key) else "w"
+    with h5py.File(path, mode) as locs_file:
+        n_locs = locs_file.attrs.get("Checkpoint locs", 0)
+        if len(locs):
+            rec_locs = locs.to_records(index=False)
+            if "locs" not in locs_file:
+                locs_file.create_dataset(
+                    "locs",
+                    shape=(0,),
+                    maxshape=(None,),
+                    dtype=rec_locs.dtype,
+                    chunks=True,
+                )
+            dataset = locs_file["locs"]
+            dataset.resize((n_locs + len(rec_locs),))
+            dataset[n_locs:] = rec_locs
+            n_locs += len(rec_locs)
+        # attributes are updated last, such that an interrupted write
+        # is discarded when resuming
+        locs_file.attrs["Checkpoint key"] = key
+        locs_file.attrs["Checkpoint locs"] = n_locs
+        locs_file.attrs["Checkpoint last frame"] = last_frame
+        locs_file.attrs["Checkpoint online"] = int(online)
+
+
+def is_locs_checkpoint(
+    path: str, key: str | None = None, online: bool | None = None
+) -> bool:
+    """Check whether a file is a readable checkpoint written by
+    ``append_locs_checkpoint``, i.e., the localization of the movie is
+    still in progress or was interrupted. Checkpoints are replaced by
+    regular localization files once the localization is complete.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .hdf5 file.
+    key : str, optional
+        If given, only checkpoints written with this key are accepted.
+        Default is None.
+    online : bool, optional
+        If True (False), only checkpoints of movies localized while
+        being acquired (of interrupted localizations, e.g., with the
+        ``--checkpoint`` option of the CLI) are accepted. Default is
+        None, i.e., both are accepted.
+
+    Returns
+    -------
+    is_checkpoint : bool
+        Whether ``path`` is a matching checkpoint file.
+    """
+    if not os.path.isfile(path):
+        return False
+    try:
+        with h5py.File(path, "r") as locs_file:
+            attrs = locs_file.attrs
+            if "Checkpoint key" not in attrs:
+                return False
+            if key is not None and attrs["Checkpoint key"] != key:
+                return False
+            if online is not None:
+                return bool(attrs.get("Checkpoint online", 0)) == online
+            return True
+    except OSError:
+        return False
+
+
+def load_locs_checkpoint(
+    path: str, key: str
+) -> tuple[pd.DataFrame | None, int] | None:
+    """Load the localizations and the last completely localized frame
+    from a checkpoint file written by ``append_locs_checkpoint``.
+
+    Parameters
+    ----------
+    path : str
+        Path to the checkpoint (.hdf5) file.
+    key : str
+        Identifies the analysis, see ``append_locs_checkpoint``.
+
+    Returns
+    -------
+    result : tuple or None
+        ``(locs, last_frame)``, where ``locs`` is None if no
+        localizations have been recorded yet. None if the file does not
+        exist, cannot be read or was written with a different key.
+    """
+    if not is_locs_checkpoint(path, key):
+        return None
+    try:
+        with h5py.File(path, "r") as locs_file:
+            last_frame = int(locs_file.attrs["Checkpoint last frame"])
+            n_locs = int(locs_file.attrs["Checkpoint locs"])
+            locs = None
+            if "locs" in locs_file and n_locs:
+                locs = pd.DataFrame(locs_file["locs"][:n_locs])
+    except (OSError, KeyError):  # e.g., corrupted by a crash
+        return None
+    return locs, last_frame
+
+
 def load_locs(
-    path: str, qt_parent: QtWidgets.QWidget | None = None
+    path: str,
+    qt_parent: QtWidgets.QWidget | None = None,
+    columns: list[str] | None = None,
+    frames: tuple[int | None, int | None] | None = None,
+    roi: tuple[tuple[float, float], tuple[float, float]] | None = None,
 ) -> tuple[pd.DataFrame, list[dict]]:
     """Load localization data from an HDF5 file.
 
+    Since v0.10.1, only selected columns and rows can be read from
+    disk. Frame ranges of files sorted by frame (e.g., saved by
+    ``save_locs`` after localization) are read as a contiguous
+    hyperslab.
+
     Parameters
     ----------
     path : str
         The path to the HDF5 file containing localization data.
     qt_parent : QWidget or None, optional
         Parent widget for any Qt-related operations, default is None.
+    columns : list of strs, optional
+        Columns to be loaded. The sanity checks (see
+        ``lib.ensure_sanity``) only apply to the loaded columns. Default
+        is None, i.e., all columns.
+    frames : tuple, optional
+        First and last frame (inclusive) of the localizations to be
+        loaded, either may be None for no bound. Default is None, i.e.,
+        all frames.
+    roi : tuple, optional
+        Region of interest ``((y_min, x_min), (y_max, x_max))`` in
+        camera pixels; only localizations with ``y_min <= y < y_max``
+        and ``x_min <= x < x_max`` are loaded. Default is None, i.e.,
+        the whole field of view.
 
     Returns
     -------
@@ -2135,7 +3020,8 @@ def load_locs(
     ValueError
         If the file path ends with ".csv", indicating that it is a
         ThunderSTORM .csv file, which should be loaded using
-        picasso.io.import_ts instead.
+        picasso.io.import_ts instead. Also if any of ``columns`` is
+        not found in the file.
     KeyError
         If the "locs" dataset is not found in the HDF5 file, indicating
         that the file does not contain the expected localization data.
@@ -2146,7 +3032,9 @@ def load_locs(
             "picasso.io.import_ts instead."
         )
     try:
-        locs = pd.read_hdf(path, key="locs")
+        locs = _read_locs_table(
+            path, "locs", columns=columns, frames=frames, roi=roi
+        )
     except KeyError as e:  # if "locs" key not found
         print(
             f"\nAn error occured. File: {path} does not contain a "
@@ -2160,10 +3048,406 @@ def load_locs(
             )
         raise KeyError(e)
     info = load_info(path, qt_parent=qt_parent)
-    locs = lib.ensure_sanity(locs, info)
+    locs = lib.ensure_sanity(
+        locs, info, copy=False, trusted=_is_sanitized(path, "locs")
+    )
     return locs, info
 
 
+class LocsWriter:
+    """Write localizations block by block into an HDF5 file with the
+    column-oriented layout of ``save_locs`` (``layout="columns"``),
+    such that localizations larger than the RAM can be saved. The
+    metadata (.yaml) is written when the writer is closed.
+
+    All blocks must have the same columns. The blocks are not checked
+    for sanity, see ``lib.ensure_sanity``.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .hdf5 file to be created.
+    info : list of dicts
+        Metadata of the localizations.
+    compression : {"gzip", "lzf", "lz4", "blosc"} or None, optional
+        Compression filter, see ``save_locs``. Default is "gzip".
+    dtypes : dict or None, optional
+        Column names and data types of the localizations (e.g.,
+        ``locs.dtypes.to_dict()``), such that the columns are written
+        even if no localizations are appended. Default is None, i.e.,
+        the columns of the first appended block.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        info: list[dict],
+        compression: Literal["gzip", "lzf", "lz4", "blosc"] | None = "gzip",
+        dtypes: dict | None = None,
+    ) -> None:
+        self.path = path
+        self.info = info
+        self.compression = compression
+        self._filters = _locs_compression(compression)
+        self._file = h5py.File(path, "w", libver=_LOCS_COLUMNS_LIBVER)
+        self._group = None
+        self.n_locs = 0
+        self._last_frame = None
+        self._sorted_by_frame = True
+        if dtypes is not None:
+            self._create_group(
+                pd.DataFrame(
+                    {
+                        column: np.empty(0, dtype=dtype)
+                        for column, dtype in dtypes.items()
+                    }
+                )
+            )
+
+    def __enter__(self) -> LocsWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _create_group(self, locs: pd.DataFrame) -> None:
+        self._group = self._file.create_group("locs")
+        self._group.attrs["Layout"] = "columns"
+        self._group.attrs["Columns"] = [str(c) for c in locs.columns]
+        self._group.attrs["Compression"] = self.compression or "none"
+        for column in locs.columns:
+            self._group.create_dataset(
+                str(column),
+                shape=(0,),
+                maxshape=(None,),
+                dtype=locs[column].dtype,
+                chunks=(_LOCS_CHUNK_ROWS,),
+                **self._filters,
+            )
+
+    def append(self, locs: pd.DataFrame) -> None:
+        """Append a block of localizations to the file."""
+        if self._group is None:
+            self._create_group(locs)
+        columns = _locs_table_columns(self._group)
+        if [str(c) for c in locs.columns] != columns:
+            raise ValueError(
+                f"Expected the columns {columns}, got {list(locs.columns)}."
+            )
+        if not len(locs):
+            return
+        if "frame" in locs.columns:
+            frame = locs["frame"]
+            if not frame.is_monotonic_increasing or (
+                self._last_frame is not None
+                and frame.iloc[0] < self._last_frame
+            ):
+                self._sorted_by_frame = False
+            self._last_frame = frame.iloc[-1]
+        else:
+            self._sorted_by_frame = False
+        n_locs = self.n_locs + len(locs)
+        for column in columns:
+            dataset = self._group[column]
+            dataset.resize((n_locs,))
+            dataset[self.n_locs :] = locs[column].to_numpy()
+        self.n_locs = n_locs
+
+    def close(self) -> None:
+        """Close the .hdf5 file and save the metadata."""
+        if not self._file:  # already closed
+            return
+        if self._group is None:  # nothing was appended, columns unknown
+            self._create_group(pd.DataFrame())
+        self._group.attrs["Sorted by frame"] = int(self._sorted_by_frame)
+        self._file.close()
+        base, ext = os.path.splitext(self.path)
+        save_info(base + ".yaml", self.info)
+
+
+class LazyLocs:
+    """Localizations in an HDF5 file (either layout of ``save_locs``)
+    that are read in blocks of rows instead of at once, for files that
+    do not fit into the RAM.
+
+    The localizations are processed block by block with the existing
+    functions for ``pd.DataFrame``: ``map`` and ``filter`` write their
+    results into a new file and return it as ``LazyLocs``,
+    ``groupby_agg`` combines the aggregates of the blocks. Operations
+    that only involve single localizations or single frames (e.g.,
+    ``postprocess.apply_drift``, ``lib.ensure_sanity`` or filtering by
+    photons) are supported this way, with memory bounded by the block
+    size. Linking uses blocks of whole frames, see
+    ``postprocess.link_lazy``. Other spatial neighborhoods (e.g.,
+    clustering) are not supported.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .hdf5 file, accompanied by the .yaml metadata.
+    block_size : int, optional
+        Number of localizations per block. Default is 2**20.
+
+    Attributes
+    ----------
+    info : list of dicts
+        Metadata of the localizations.
+    columns : list of strs
+        Column names.
+    sorted_by_frame : bool
+        Whether the localizations are sorted by frame, as recorded by
+        ``save_locs`` or ``LocsWriter``.
+
+    Examples
+    --------
+    >>> locs = io.LazyLocs("locs.hdf5")
+    >>> undrifted = locs.map(
+    ...     lambda block: postprocess.apply_drift(
+    ...         block, locs.info, drift=drift
+    ...     ),
+    ...     "locs_undrift.hdf5",
+    ... )
+    >>> bright = undrifted.filter(
+    ...     lambda block: block["photons"] > 1000, "locs_bright.hdf5"
+    ... )
+    >>> photons_per_frame = bright.groupby_agg("frame", ["photons"])
+    """
+
+    def __init__(
+        self, path: str, block_size: int = _LAZY_LOCS_BLOCK_ROWS
+    ) -> None:
+        assert (
+            isinstance(block_size, int) and block_size > 0
+        ), "block_size must be a positive integer"
+        self.path = path
+        self.block_size = block_size
+        self.info = load_info(path)
+        with h5py.File(path, "r") as locs_file:
+            if "locs" not in locs_file:
+                raise KeyError(
+                    f"File: {path} does not contain a 'locs' dataset."
+                )
+            table = locs_file["locs"]
+            self.columns = _locs_table_columns(table)
+            self._n_locs = _locs_table_length(table)
+            self.sorted_by_frame = bool(
+                table.attrs.get("Sorted by frame", False)
+            )
+
+    def __len__(self) -> int:
+        return self._n_locs
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyLocs({self.path!r}, {len(self)} localizations, "
+            f"columns={self.columns})"
+        )
+
+    def iter_blocks(
+        self,
+        columns: list[str] | None = None,
+        by_frame: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over blocks of localizations. The index of each
+        block gives the row numbers in the file.
+
+        Parameters
+        ----------
+        columns : list of strs, optional
+            Columns to be read. Default is None, i.e., all columns.
+        by_frame : bool, optional
+            If True, blocks are extended such that no frame is split
+            between two blocks, which requires the localizations to be
+            sorted by frame. Default is False.
+
+        Yields
+        ------
+        block : pd.DataFrame
+            At least ``block_size`` localizations, except for the last
+            block.
+        """
+        if columns is None:
+            columns = self.columns
+        if by_frame and not self.sorted_by_frame:
+            raise ValueError(
+                f"Localizations in {self.path} are not sorted by frame."
+            )
+        n_locs = len(self)
+        with h5py.File(self.path, "r") as locs_file:
+            table = locs_file["locs"]
+            _register_locs_filters(table)
+            if by_frame:
+                frame = (
+                    table["frame"]
+                    if isinstance(table, h5py.Group)
+                    else table.fields("frame")
+                )
+            start = 0
+            while start < n_locs:
+                stop = min(start + self.block_size, n_locs)
+                if by_frame and stop < n_locs:
+                    # include all localizations of the last frame
+                    _, stop = _sorted_frame_rows(
+                        frame, n_locs, None, frame[stop - 1]
+                    )
+                data = _read_locs_columns(table, columns, slice(start, stop))
+                yield pd.DataFrame(
+                    data, columns=columns, index=pd.RangeIndex(start, stop)
+                )
+                start = stop
+
+    def _empty_block(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Block without localizations but with the data types of the
+        columns."""
+        if columns is None:
+            columns = self.columns
+        with h5py.File(self.path, "r") as locs_file:
+            table = locs_file["locs"]
+            _register_locs_filters(table)
+            data = _read_locs_columns(table, columns, slice(0, 0))
+        return pd.DataFrame(data, columns=columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """Read a single column into memory."""
+        if name not in self.columns:
+            raise ValueError(f"Column {name!r} not found.")
+        with h5py.File(self.path, "r") as locs_file:
+            table = locs_file["locs"]
+            _register_locs_filters(table)
+            return _read_locs_columns(table, [name], slice(None))[name]
+
+    def to_dataframe(
+        self,
+        columns: list[str] | None = None,
+        frames: tuple[int | None, int | None] | None = None,
+        roi: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    ) -> pd.DataFrame:
+        """Load (a selection of) the localizations into memory, see
+        ``load_locs``."""
+        locs, _ = load_locs(self.path, columns=columns, frames=frames, roi=roi)
+        return locs
+
+    def map(
+        self,
+        func: Callable[[pd.DataFrame], pd.DataFrame],
+        path: str,
+        info: list[dict] | None = None,
+        columns: list[str] | None = None,
+        by_frame: bool = False,
+        compression: Literal["gzip", "lzf", "lz4", "blosc"] | None = "gzip",
+    ) -> LazyLocs:
+        """Apply a function to each block of localizations and write the
+        results into a new file (column-oriented layout).
+
+        Parameters
+        ----------
+        func : callable
+            Takes a block of localizations and returns new
+            localizations, which must have the same columns for all
+            blocks.
+        path : str
+            Path to the new .hdf5 file.
+        info : list of dicts, optional
+            Metadata of the new file. Default is None, i.e., the
+            metadata of this file.
+        columns, by_frame : optional
+            See ``iter_blocks``.
+        compression : {"gzip", "lzf", "lz4", "blosc"} or None, optional
+            See ``save_locs``. Default is "gzip".
+
+        Returns
+        -------
+        locs : LazyLocs
+            The new localizations.
+        """
+        if info is None:
+            info = self.info
+        with LocsWriter(path, info, compression=compression) as writer:
+            empty = True
+            for block in self.iter_blocks(columns=columns, by_frame=by_frame):
+                writer.append(func(block))
+                empty = False
+            if empty:
+                # the columns of the result of an empty block
+                writer.append(func(self._empty_block(columns)))
+        return LazyLocs(path, block_size=self.block_size)
+
+    def filter(
+        self,
+        predicate: Callable[[pd.DataFrame], lib.BoolArray1D | pd.Series],
+        path: str,
+        info: list[dict] | None = None,
+        by_frame: bool = False,
+        compression: Literal["gzip", "lzf", "lz4", "blosc"] | None = "gzip",
+    ) -> LazyLocs:
+        """Keep the localizations for which ``predicate`` (applied to
+        each block) is True and write them into a new file, see
+        ``map``."""
+        return self.map(
+            lambda block: block[np.asarray(predicate(block))],
+            path,
+            info=info,
+            by_frame=by_frame,
+            compression=compression,
+        )
+
+    def groupby_agg(
+        self,
+        by: str,
+        columns: list[str],
+        how: Literal["count", "sum", "mean", "min", "max"] = "mean",
+    ) -> pd.DataFrame:
+        """Aggregate columns over groups of localizations (e.g., per
+        frame or per pick group) block by block. Only ``by`` and
+        ``columns`` are read.
+
+        Parameters
+        ----------
+        by : str
+            Column that defines the groups, e.g., "frame" or "group".
+        columns : list of strs
+            Columns to be aggregated.
+        how : {"count", "sum", "mean", "min", "max"}, optional
+            Aggregation. Default is "mean".
+
+        Returns
+        -------
+        result : pd.DataFrame
+            Aggregated columns, indexed by the values of ``by``.
+        """
+        assert how in [
+            "count",
+            "sum",
+            "mean",
+            "min",
+            "max",
+        ], "how must be one of 'count', 'sum', 'mean', 'min' or 'max'"
+        partial_how = ["sum", "count"] if how == "mean" else [how]
+        partials = [
+            block.groupby(by)[columns].agg(partial_how)
+            for block in self.iter_blocks(columns=[by] + columns)
+        ]
+        if not partials:
+            return pd.DataFrame(columns=columns, index=pd.Index([], name=by))
+        combined = pd.concat(partials).groupby(level=0)
+        if how in ["count", "sum", "mean"]:
+            combined = combined.sum()
+        else:
+            combined = combined.agg(how)
+        if how == "mean":
+            result = combined.xs("sum", axis=1, level=1) / combined.xs(
+                "count", axis=1, level=1
+            )
+        else:
+            result = combined.xs(how, axis=1, level=1)
+        result.index.name = by
+        return result[columns]
+
+
 def save_identifications(
     path: str, identifications: pd.DataFrame, info: list[dict]
 ) -> None:
@@ -2247,7 +3531,7 @@ def load_clusters(path: str) -> pd.DataFrame:
     try:
         clusters = pd.read_hdf(path, key="clusters")
     except KeyError:
-        clusters = pd.read_hdf(path, key="locs")
+        clusters = _read_locs_table(path, "locs")
     return clusters
 
 
@@ -2276,7 +3560,7 @@ def load_filter(
         dictionaries containing various metadata fields.
     """
     try:
-        locs = pd.read_hdf(path, key="locs")
+        locs = _read_locs_table(path, "locs")
         info = load_info(path, qt_parent=qt_parent)
     except KeyError:
         try:
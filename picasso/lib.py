@@ -10,11 +10,15 @@ Handy functions and classes.
 
 from __future__ import annotations
 
+import atexit
 import glob
 import collections
 import colorsys
+import concurrent.futures
+import multiprocessing
 import os
 import sys
+import threading
 import time
 import traceback
 import warnings
@@ -22,6 +26,7 @@ from copy import deepcopy
 from typing import Any, TypeAlias, Literal
 from collections.abc import Callable
 from asyncio import Future
+from multiprocessing import shared_memory
 
 import yaml
 import numba
@@ -45,6 +50,10 @@ _dialogs = []
 # StatusDialog is finished
 SOUND_NOTIFICATION_DURATION = 60  # seconds
 
+# Process pool kept alive between calls, see ``get_process_pool``
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
 # Columns that are required for Picasso
 REQUIRED_COLUMNS = ["frame", "x", "y", "z", "lpx", "lpy", "lpz"]
 
@@ -911,7 +920,7 @@ def get_from_metadata(
         return info.get(key, default)
     elif isinstance(info, list):
         for inf in info[::-1]:
-            if val := inf.get(key):
+            if (val := inf.get(key)) is not None:
                 return val
         if raise_error:
             raise KeyError(f"Key '{key}' not found in metadata.")
@@ -1782,7 +1791,70 @@ def _merge_locs(
     return locs
 
 
-def ensure_sanity(locs: pd.DataFrame, info: list[dict]) -> pd.DataFrame:
+# columns that must be non-negative, see ``ensure_sanity``
+_NON_NEGATIVE_COLUMNS = (
+    "x",
+    "y",
+    "lpx",
+    "lpy",
+    "lpz",
+    "photons",
+    "ellipticity",
+    "sx",
+    "sy",
+)
+
+
+@numba.jit(nopython=True, nogil=True)
+def _update_sanity_mask(
+    values: np.ndarray,
+    lower: float,
+    upper: float,
+    mask: BoolArray1D,
+) -> None:
+    """Set ``mask`` to False (in place) where ``values`` are not finite
+    or outside ``[lower, upper)``. Serial on purpose: the loop is bound
+    by memory bandwidth, and a parallel kernel would start numba's
+    thread pool on every load or save of localizations, after which
+    forked worker processes hang."""
+    for i in range(len(values)):
+        value = values[i]
+        if not (np.isfinite(value) and value >= lower and value < upper):
+            mask[i] = False
+
+
+def _sanity_mask(locs: pd.DataFrame, info: list[dict]) -> BoolArray1D:
+    """Boolean mask of the localizations that pass ``ensure_sanity``,
+    computed with one pass over each column."""
+    mask = np.ones(len(locs), dtype=bool)
+    upper_bounds = {
+        "x": get_from_metadata(info, "Width"),
+        "y": get_from_metadata(info, "Height"),
+    }
+    for column in locs.columns:
+        values = locs[column]
+        lower = 0.0 if column in _NON_NEGATIVE_COLUMNS else -np.inf
+        upper = float(upper_bounds.get(column, np.inf))
+        if values.dtype.kind == "f":
+            _update_sanity_mask(values.to_numpy(), lower, upper, mask)
+        elif values.dtype.kind in "iub":  # always finite
+            if np.isfinite(lower) or np.isfinite(upper):
+                values = values.to_numpy()
+                mask &= (values >= lower) & (values < upper)
+        else:  # e.g., strings
+            mask &= values.notna().to_numpy()
+            if column in _NON_NEGATIVE_COLUMNS or column in upper_bounds:
+                values = pd.to_numeric(values, errors="coerce").to_numpy()
+                mask &= (values >= lower) & (values < upper)
+    return mask
+
+
+def ensure_sanity(
+    locs: pd.DataFrame,
+    info: list[dict],
+    copy: bool = True,
+    trusted: bool = False,
+) -> pd.DataFrame:
     """Ensure that localizations are within the image dimensions
     and have positive localization precisions and other parameters.
 
@@ -1790,45 +1862,40 @@ def ensure_sanity(locs: pd.DataFrame, info: list[dict]) -> pd.DataFrame:
     information for processing: Width, Height, Pixelsize and Frames.
     Raises a KeyError if any of the required keys is missing.
 
+    v0.10.1: the checks of all columns are combined into a single
+    boolean mask computed in compiled code, which is applied once.
+
     Parameters
     ----------
     locs : pd.DataFrame
         Localizations.
     info : list of dicts
         Localization metadata.
+    copy : bool, optional
+        If False and all localizations pass the checks, ``locs`` is
+        returned without copying it. Default is True.
+    trusted : bool, optional
+        If True, the localizations are known to be sane (e.g., they
+        were saved by ``io.save_locs``) and only the metadata is
+        checked. Default is False.
 
     Returns
     -------
     locs : pd.DataFrame
         Localizations that pass the sanity checks.
     """
-    locs = locs.copy()  # pandas SettingWithCopyWarning
-    # no inf and nan:
-    locs.replace([np.inf, -np.inf], np.nan, inplace=True)
-    locs.dropna(axis=0, how="any", inplace=True)
-    # other sanity checks:
     required_keys = ["Width", "Height", "Frames"]
     for key in required_keys:
         value = get_from_metadata(info, key)
         if value is None:
             raise KeyError(f"Metadata is missing required key: '{key}'")
-
-    locs = locs[locs["x"] < get_from_metadata(info, "Width")]
-    locs = locs[locs["y"] < get_from_metadata(info, "Height")]
-    for attr in [
-        "x",
-        "y",
-        "lpx",
-        "lpy",
-        "lpz",
-        "photons",
-        "ellipticity",
-        "sx",
-        "sy",
-    ]:
-        if attr in locs.columns:
-            locs = locs[locs[attr] >= 0]
-    return locs
+    if not trusted:
+        mask = _sanity_mask(locs, info)
+        if not mask.all():
+            # copies the remaining rows once; unlike locs[mask], the
+            # result is not flagged as a view of locs
+            return locs.take(np.flatnonzero(mask))
+    return locs.copy() if copy else locs
 
 
 def is_loc_at(x: float, y: float, locs: pd.DataFrame, r: float) -> BoolArray1D:
@@ -2083,6 +2150,243 @@ def n_futures_done(futures: list[Future]) -> int:
     return sum([_.done() for _ in futures])
 
 
+def get_process_pool(
+    n_workers: int,
+) -> concurrent.futures.ProcessPoolExecutor:
+    """Return a process pool with ``n_workers`` workers that is kept
+    alive between calls, so that repeated (batch) analyses do not pay
+    the start-up of worker processes each time. A new pool is created
+    if the number of workers changes or the previous pool broke.
+
+    The workers are started by a fork server (spawned where it is not
+    available, e.g., on Windows) instead of being forked from the
+    current process: once a parallel numba kernel ran, its thread pool
+    does not survive a fork and forked workers hang. Data are passed
+    to the workers through shared memory, see ``fit_spots_shared``.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    executor : concurrent.futures.ProcessPoolExecutor
+        Process pool shared within the current process.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        pool = _process_pool
+        if (
+            pool is None
+            or pool._max_workers != n_workers
+            or pool._broken
+            or pool._shutdown_thread
+        ):
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = concurrent.futures.ProcessPoolExecutor(
+                n_workers, mp_context=process_pool_context()
+            )
+            _process_pool = pool
+        return pool
+
+
+def process_pool_context() -> multiprocessing.context.BaseContext:
+    """Return the multiprocessing context used to start the workers of
+    process pools, see ``get_process_pool``. Pools that are not shared
+    (e.g., in G5M, SPINNA, ``average`` and ``zfit``) must be started
+    with this context too, since they may be created after a parallel
+    numba kernel ran in the same process."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+@atexit.register
+def _shutdown_process_pool() -> None:
+    """Shut down the persistent process pool before the interpreter
+    tears down its modules."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing shared memory block created by the parent
+    process, which is responsible for unlinking it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13, the tracker is shared with parent
+        return shared_memory.SharedMemory(name=name)
+
+
+def _fit_spots_shared_worker(
+    fit_spots: Callable[[FloatArray3D], FloatArray2D],
+    spots_name: str,
+    spots_shape: tuple[int, int, int],
+    spots_dtype: str,
+    theta_name: str,
+    n_params: int,
+    start: int,
+    stop: int,
+) -> None:
+    """Fit spots ``start:stop`` of a spot stack in shared memory and
+    write the parameters to the shared output array."""
+    spots_shm = _attach_shared_memory(spots_name)
+    theta_shm = _attach_shared_memory(theta_name)
+    try:
+        spots = np.ndarray(
+            spots_shape, dtype=spots_dtype, buffer=spots_shm.buf
+        )
+        theta = np.ndarray(
+            (spots_shape[0], n_params), dtype=np.float32, buffer=theta_shm.buf
+        )
+        theta[start:stop] = fit_spots(spots[start:stop])
+        del spots, theta
+    finally:
+        spots_shm.close()
+        theta_shm.close()
+
+
+class _SharedFitJob:
+    """Spot stack and parameter array placed in shared memory for
+    fitting in a process pool, see ``fit_spots_shared``. Shared memory
+    is released once all tasks finished (or were cancelled)."""
+
+    def __init__(self, spots: FloatArray3D, n_params: int) -> None:
+        self.n_params = n_params
+        self.spots_shm = shared_memory.SharedMemory(
+            create=True, size=spots.nbytes
+        )
+        self.theta_shm = shared_memory.SharedMemory(
+            create=True, size=len(spots) * n_params * 4
+        )
+        self.spots = np.ndarray(
+            spots.shape, dtype=spots.dtype, buffer=self.spots_shm.buf
+        )
+        self.spots[:] = spots
+        self.theta = np.ndarray(
+            (len(spots), n_params), dtype=np.float32, buffer=self.theta_shm.buf
+        )
+        self.theta.fill(np.nan)
+        self.n_pending = 0
+        self.lock = threading.Lock()
+
+    def submit(
+        self,
+        executor: concurrent.futures.ProcessPoolExecutor,
+        fit_spots: Callable[[FloatArray3D], FloatArray2D],
+        start: int,
+        stop: int,
+    ) -> concurrent.futures.Future:
+        """Fit spots ``start:stop`` in the executor. The returned future
+        resolves to the fitted parameters of these spots. ``n_pending``
+        must account for all tasks before the first one is submitted."""
+        future = executor.submit(
+            _fit_spots_shared_worker,
+            fit_spots,
+            self.spots_shm.name,
+            self.spots.shape,
+            self.spots.dtype.str,
+            self.theta_shm.name,
+            self.n_params,
+            start,
+            stop,
+        )
+        result = _ChainedFuture(future)
+
+        def on_done(f):
+            try:
+                if result.done():  # cancelled by the caller
+                    return
+                if f.cancelled():
+                    result.cancel()
+                elif f.exception() is not None:
+                    result.set_exception(f.exception())
+                else:
+                    result.set_result(np.array(self.theta[start:stop]))
+            finally:
+                self._release()
+
+        future.add_done_callback(on_done)
+        return result
+
+    def _release(self) -> None:
+        with self.lock:
+            self.n_pending -= 1
+            if self.n_pending > 0:
+                return
+        del self.spots, self.theta
+        for shm in (self.spots_shm, self.theta_shm):
+            shm.close()
+            shm.unlink()
+
+
+class _ChainedFuture(concurrent.futures.Future):
+    """Future mirroring another future; cancelling it cancels the
+    underlying task."""
+
+    def __init__(self, future: concurrent.futures.Future) -> None:
+        super().__init__()
+        self._future = future
+
+    def cancel(self) -> bool:
+        self._future.cancel()
+        return super().cancel()
+
+
+def fit_spots_shared(
+    fit_spots: Callable[[FloatArray3D], FloatArray2D],
+    spots: FloatArray3D,
+    n_params: int,
+    n_workers: int,
+    n_tasks: int,
+) -> list[concurrent.futures.Future]:
+    """Fit spots in a persistent process pool (see
+    ``get_process_pool``) with the spot stack and the output parameters
+    in shared memory, so that tasks only carry index ranges instead of
+    pickled spots and parameters.
+
+    Parameters
+    ----------
+    fit_spots : callable
+        Module-level function fitting a stack of spots, returns an
+        array of shape (n_spots, n_params), e.g.,
+        ``gausslq.fit_spots``.
+    spots : FloatArray3D
+        Spots to be fitted, shape (n_spots, box, box).
+    n_params : int
+        Number of fitted parameters per spot.
+    n_workers : int
+        Number of worker processes.
+    n_tasks : int
+        Number of tasks the spots are split into.
+
+    Returns
+    -------
+    fs : list of concurrent.futures.Future
+        One future per task, resolving to the fitted parameters of
+        its spots (in order).
+    """
+    spots = np.ascontiguousarray(spots)
+    n_spots = len(spots)
+    if n_spots == 0:
+        f = concurrent.futures.Future()
+        f.set_result(np.empty((0, n_params), dtype=np.float32))
+        return [f]
+    n_tasks = min(n_tasks, n_spots)
+    bounds = np.linspace(0, n_spots, n_tasks + 1).astype(int)
+    executor = get_process_pool(n_workers)
+    job = _SharedFitJob(spots, n_params)
+    job.n_pending = n_tasks
+    return [
+        job.submit(executor, fit_spots, start, stop)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
 def remove_from_rec(rec_array: np.recarray, name: str) -> np.recarray:
     """Remove a column from the existing recarray.
 
@@ -2116,6 +2420,7 @@ def locs_glob_map(
     args: list = [],
     kwargs: dict = {},
     extension: str = "",
+    columns: list[str] | None = None,
 ) -> None:
     """Map a function to localization files, specified by the unix style
     path pattern.
@@ -2142,10 +2447,13 @@ def locs_glob_map(
         dict, and a new locs file will be saved with this extension.
         If not provided, the function is expected to modify locs and
         info in place.
+    columns : list of strs, optional
+        Columns to be loaded, see ``io.load_locs``. Default is None,
+        i.e., all columns.
     """
     paths = glob.glob(pattern)
     for path in paths:
-        locs, info = io.load_locs(path)
+        locs, info = io.load_locs(path, columns=columns)
         result = func(locs, info, path, *args, **kwargs)
         if extension:
             base, ext = os.path.splitext(path)
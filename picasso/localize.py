@@ -13,6 +13,7 @@ sequence.
 from __future__ import annotations
 
 import os
+import json
 import multiprocessing
 import threading
 import time
@@ -40,6 +41,7 @@ from . import (
     gaussmle,
     avgroi,
     postprocess,
+    resources,
     zfit,
     __version__,
 )
@@ -48,6 +50,8 @@ plt.style.use("ggplot")
 
 
 MAX_LOCS = int(1e6)
+# frames per chunk in localize_3D
+_LOCALIZE_3D_CHUNK_SIZE = 1000
 # The columns under base are always available and the keys such as "3D
 # only" will be displayed in the save columns dialog in the GUI for
 # clarity
@@ -67,7 +71,8 @@ LOCALIZATION_COLUMNS = {
     ],
     "3D only": ["z", "d_zcalib", "lpz"],
     "Picked spots only": ["n_id"],
-    "MLE only": ["log_likelihood", "iterations"],
+    "MLE only": ["log_likelihood", "iterations", "converged"],
+    "Multi-emitter MLE only": ["n_emitters"],
 }
 # For database:
 MEAN_COLS = LOCALIZATION_COLUMNS["Base"] + LOCALIZATION_COLUMNS["3D only"]
@@ -274,6 +279,21 @@ def identify_in_image(
         (len(y),).
     """
     y, x = _local_maxima(image, box)
+    uy, ux = _net_gradient_units(box)
+    ng = _net_gradient(image, y, x, box, uy, ux)
+    positives = ng > minimum_ng
+    y = y[positives]
+    x = x[positives]
+    ng = ng[positives]
+    return y, x, ng
+
+
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _net_gradient_units(
+    box: int,
+) -> tuple[lib.FloatArray2D, lib.FloatArray2D]:
+    """Unit vectors pointing from each pixel of the box to its center,
+    used as weights in ``_net_gradient``. Returns ``(uy, ux)``."""
     box_half = int(box / 2)
     # Now comes basically a meshgrid
     ux = np.zeros((box, box), dtype=np.float32)
@@ -284,12 +304,59 @@ def identify_in_image(
     unorm = np.sqrt(ux**2 + uy**2)
     ux /= unorm
     uy /= unorm
-    ng = _net_gradient(image, y, x, box, uy, ux)
-    positives = ng > minimum_ng
-    y = y[positives]
-    x = x[positives]
-    ng = ng[positives]
-    return y, x, ng
+    return uy, ux
+
+
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _grow(array: np.ndarray) -> np.ndarray:
+    """Double the length of a 1D array, keeping its content."""
+    grown = np.empty(2 * len(array), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _identify_in_images(
+    images: lib.FloatArray3D,
+    minimum_ng: float,
+    box: int,
+) -> tuple[lib.IntArray1D, lib.IntArray1D, lib.IntArray1D, lib.FloatArray1D]:
+    """Batched version of ``identify_in_image`` for a stack of images
+    of shape (N, Y, X). The results of all images are written into the
+    same (growing) arrays.
+
+    Returns
+    -------
+    index : lib.IntArray1D
+        Index of the image in the stack of each identified maximum.
+    y, x : lib.IntArray1D
+        Coordinates of the identified maxima.
+    ng : lib.FloatArray1D
+        Net gradient values at the identified maxima.
+    """
+    uy, ux = _net_gradient_units(box)
+    n_max = 1024
+    index = np.empty(n_max, dtype=np.int64)
+    y_out = np.empty(n_max, dtype=np.int64)
+    x_out = np.empty(n_max, dtype=np.int64)
+    ng_out = np.empty(n_max, dtype=np.float32)
+    n = 0
+    for i in range(len(images)):
+        y, x = _local_maxima(images[i], box)
+        ng = _net_gradient(images[i], y, x, box, uy, ux)
+        for j in range(len(ng)):
+            if ng[j] > minimum_ng:
+                if n == len(ng_out):
+                    index = _grow(index)
+                    y_out = _grow(y_out)
+                    x_out = _grow(x_out)
+                    ng_out = _grow(ng_out)
+                index[n] = i
+                y_out[n] = y[j]
+                x_out[n] = x[j]
+                ng_out[n] = ng[j]
+                n += 1
+    return index[:n], y_out[:n], x_out[:n], ng_out[:n]
 
 
 def identify_in_frame(
@@ -337,6 +404,111 @@ def identify_in_frame(
     return y, x, net_gradient
 
 
+# identifications of a batch of frames, converted into a data frame
+# only once all frames are identified
+_IDENTIFICATIONS_DTYPE = np.dtype(
+    [
+        ("frame", int),
+        ("x", int),
+        ("y", int),
+        ("net_gradient", np.float32),
+    ],
+    align=True,
+)
+# number of pixels (float32) identified at once by a single thread
+_IDENTIFY_BATCH_PIXELS = 2**22
+
+
+def _identify_in_frames(
+    frames: lib.IntArray3D,
+    first_frame: int,
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+) -> np.ndarray:
+    """Identify spots in a block of consecutive frames, the first of
+    which is frame ``first_frame`` of the movie, see
+    ``identify_in_frame``. Returns a structured array with the fields
+    ``frame``, ``x``, ``y`` and ``net_gradient``."""
+    if roi is not None:
+        frames = frames[:, roi[0][0] : roi[1][0], roi[0][1] : roi[1][1]]
+    images = np.ascontiguousarray(frames, dtype=np.float32)
+    index, y, x, ng = _identify_in_images(images, minimum_ng, box)
+    ids = np.empty(len(ng), dtype=_IDENTIFICATIONS_DTYPE)
+    ids["frame"] = index + first_frame
+    ids["x"] = x
+    ids["y"] = y
+    ids["net_gradient"] = ng
+    if roi is not None:
+        ids["y"] += roi[0][0]
+        ids["x"] += roi[0][1]
+    return ids
+
+
+def _identify_batch_size(movie: lib.IntArray3D) -> int:
+    """Number of frames identified at once by a single thread, such
+    that a batch holds about ``_IDENTIFY_BATCH_PIXELS`` pixels."""
+    shape = getattr(movie, "shape", None)
+    if shape is None or len(shape) != 3:
+        return 1
+    n_frames = _IDENTIFY_BATCH_PIXELS // (shape[1] * shape[2])
+    return int(min(64, max(1, n_frames)))
+
+
+def _identify_batch(
+    movie: lib.IntArray3D,
+    start: int,
+    stop: int,
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    frame_bounds: tuple[int, int] | None,
+    lock: threading.Lock | None,
+    cut_spots: bool,
+) -> np.ndarray | tuple[np.ndarray, lib.IntArray3D]:
+    """Identify spots in frames ``start:stop`` of a movie, skipping
+    frames outside of ``frame_bounds``. If ``cut_spots``, the spots are
+    cut out of the loaded frames (in camera units) and returned as
+    well."""
+    first, last = _chunk_frame_range(len(movie), frame_bounds)
+    start, stop = max(start, first), min(stop, last)
+    if stop <= start:
+        ids = np.empty(0, dtype=_IDENTIFICATIONS_DTYPE)
+        if cut_spots:
+            return ids, np.zeros((0, box, box), dtype=movie.dtype)
+        return ids
+    if lock is not None:
+        with lock:
+            frames = _read_frames(movie, start, stop)
+    else:
+        frames = _read_frames(movie, start, stop)
+    ids = _identify_in_frames(frames, start, minimum_ng, box, roi)
+    if cut_spots:
+        spots = _cut_spots_numba(
+            frames, ids["frame"] - start, ids["x"], ids["y"], box
+        )
+        return ids, spots
+    return ids
+
+
+def _identifications_to_dataframe(
+    ids: list[np.ndarray] | list[pd.DataFrame],
+) -> tuple[pd.DataFrame, lib.IntArray1D]:
+    """Concatenate identifications of several batches (structured
+    arrays or data frames) into a single data frame sorted by frame.
+    Returns the data frame and the sorting order."""
+    if all(isinstance(_, np.ndarray) for _ in ids):
+        if len(ids):
+            ids = np.concatenate(ids)
+        else:
+            ids = np.empty(0, dtype=_IDENTIFICATIONS_DTYPE)
+        order = np.argsort(ids["frame"], kind="stable")
+        return pd.DataFrame(ids[order]), order
+    ids = pd.concat(ids, ignore_index=True)
+    order = np.argsort(ids["frame"].to_numpy(), kind="stable")
+    return ids.iloc[order].reset_index(drop=True), order
+
+
 def identify_by_frame_number(
     movie: lib.IntArray3D,
     minimum_ng: float,
@@ -391,8 +563,30 @@ def identify_by_frame_number(
             frame = movie[frame_number]
     else:
         frame = movie[frame_number]
+    return _identify_frame(
+        frame,
+        frame_number,
+        len(movie),
+        minimum_ng,
+        box,
+        roi,
+        frame_bounds,
+    )
+
+
+def _identify_frame(
+    frame: lib.IntArray2D,
+    frame_number: int,
+    n_frames: int,
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    frame_bounds: tuple[int, int] | None,
+) -> pd.DataFrame:
+    """Identify spots in an already loaded frame of a movie with
+    ``n_frames`` frames, see ``identify_by_frame_number``."""
     # check frame bounds
-    min_max = (0, len(movie))
+    min_max = (0, n_frames)
     if frame_bounds is not None:
         if frame_bounds[0] is not None:
             min_max = (max(frame_bounds[0], min_max[0]), min_max[1])
@@ -408,17 +602,19 @@ def identify_by_frame_number(
                 }
             )
     # identify
-    y, x, net_gradient = identify_in_frame(frame, minimum_ng, box, roi)
-    frame = frame_number * np.ones(len(x))
-    identifications = pd.DataFrame(
-        {
-            "frame": frame.astype(int),
-            "x": x.astype(int),
-            "y": y.astype(int),
-            "net_gradient": net_gradient.astype(np.float32),
-        }
+    ids = _identify_in_frames(
+        frame[np.newaxis], frame_number, minimum_ng, box, roi
     )
-    return identifications
+    return pd.DataFrame(ids)
+
+
+def _reads_concurrently(movie: lib.IntArray3D) -> bool:
+    """Whether frames of the movie can be read from several threads
+    at once, i.e., without holding a lock, see
+    ``io.AbstractPicassoMovie.concurrent_reads``."""
+    if isinstance(movie, np.ndarray):
+        return True
+    return getattr(movie, "concurrent_reads", False)
 
 
 def _identify_worker(
@@ -429,27 +625,37 @@ def _identify_worker(
     roi: tuple[tuple[int, int], tuple[int, int]] | None,
     frame_bounds: tuple[int, int] | None,
     lock: threading.Lock | None,
-) -> list[pd.DataFrame]:
+    cut_spots: bool = False,
+) -> list[np.ndarray] | list[tuple[np.ndarray, lib.IntArray3D]]:
     """Worker function for identifying local maxima in a movie. This
     function is designed to be run in a separate thread and processes
-    each frame independently."""
+    batches of consecutive frames (see ``_identify_batch``). The
+    identifications of each batch are returned as a structured array;
+    if ``cut_spots``, the spots are cut out of the frames right after
+    identification and ``(identifications, spots)`` are returned per
+    batch, so that the movie is read only once."""
     n_frames = len(movie)
-    identifications = []
+    batch_size = _identify_batch_size(movie)
+    read_lock = None if _reads_concurrently(movie) else lock
+    results = []
     while True:
         with lock:
-            index = current[0]
-            if index == n_frames:
-                return identifications
-            current[0] += 1
-        identifications.append(
-            identify_by_frame_number(
+            start = current[0]
+            if start == n_frames:
+                return results
+            stop = min(start + batch_size, n_frames)
+            current[0] = stop
+        results.append(
+            _identify_batch(
                 movie,
+                start,
+                stop,
                 minimum_ng,
                 box,
-                index,
-                roi=roi,
-                frame_bounds=frame_bounds,
-                lock=lock,
+                roi,
+                frame_bounds,
+                read_lock,
+                cut_spots,
             )
         )
 
@@ -460,6 +666,10 @@ def identifications_from_futures(
     """Collect the results from a list of futures and combines them
     into a single ``DataFrame``.
 
+    Since v0.10.1, the futures returned by ``identify_async`` resolve
+    to structured arrays (one per batch of frames), which are
+    converted into a ``DataFrame`` at once.
+
     Parameters
     ----------
     futures : list of multiprocessing.pool.Future's
@@ -474,11 +684,30 @@ def identifications_from_futures(
     """
     ids_list_of_lists = [_.result() for _ in futures]
     ids_list = list(chain(*ids_list_of_lists))
-    ids = pd.concat(ids_list, ignore_index=True)
-    ids.sort_values(by="frame", kind="quicksort", inplace=True)
+    ids, _ = _identifications_to_dataframe(ids_list)
     return ids
 
 
+def _identifications_spots_from_futures(
+    futures: list[multiprocessing.pool.Future],
+) -> tuple[pd.DataFrame, lib.IntArray3D]:
+    """Collect identifications and spots from the futures returned by
+    ``identify_async(..., return_spots=True)``. Both are sorted by
+    frame, such that rows of the data frame and spots match."""
+    results = list(chain(*[_.result() for _ in futures]))
+    return _concat_identifications_spots(results)
+
+
+def _concat_identifications_spots(
+    results: list[tuple[np.ndarray, lib.IntArray3D]],
+) -> tuple[pd.DataFrame, lib.IntArray3D]:
+    """Combine identifications and spots of several batches of frames,
+    sorted by frame."""
+    ids, order = _identifications_to_dataframe([_[0] for _ in results])
+    spots = np.concatenate([_[1] for _ in results])
+    return ids, spots[order]
+
+
 def identify_async(
     movie: lib.IntArray3D,
     minimum_ng: float,
@@ -486,11 +715,18 @@ def identify_async(
     *,
     roi: tuple[tuple[int, int], tuple[int, int]] | None = None,
     frame_bounds: tuple[int, int] | None = None,
+    return_spots: bool = False,
 ) -> tuple[list[int], list[multiprocessing.pool.Future]]:
     """Asynchronously (i.e., using multithreading) identify local
     maxima in a movie using multiple threads. This function divides the
     work among a specified number of threads.
 
+    Since v0.10.1, frames of movies that support concurrent reads
+    (numpy arrays, TIFF and STK files) are loaded without a global
+    lock. The number of threads is given by
+    ``picasso.resources.n_workers("identify")``, which takes over the
+    former ``cpu_utilization`` user setting.
+
     Parameters
     ----------
     movie : lib.IntArray3D
@@ -507,6 +743,11 @@ def identify_async(
         is to be specified, the other is to be set to None, for example,
         ``(5, None)`` sets minimum frame to 5 without maximum frame.
         Default is None.
+    return_spots : bool, optional
+        If True, the spots are cut out (in camera units) of each frame
+        right after identification, such that the movie is read only
+        once. The futures then resolve to lists of
+        ``(identifications, spots)`` tuples. Default is False.
 
     Returns
     -------
@@ -516,28 +757,7 @@ def identify_async(
     f : list[multiprocessing.pool.Future]
             A list of futures representing the asynchronous tasks.
     """
-    # Use the user settings to define the number of workers that are being used
-    settings = io.load_user_settings()
-
-    # avoid the problem when cpu_utilization is not set
-    try:
-        cpu_utilization = settings["Localize"]["cpu_utilization"]
-    except KeyError:
-        cpu_utilization = 0.8
-
-    if isinstance(cpu_utilization, float):
-        if cpu_utilization >= 1:
-            cpu_utilization = 0.8
-    else:
-        print("CPU utilization was not set. Setting to 0.8")
-        cpu_utilization = 0.8
-    settings["Localize"]["cpu_utilization"] = cpu_utilization
-    io.save_user_settings(settings)
-
-    n_workers = min(
-        60, max(1, int(cpu_utilization * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
-
+    n_workers = resources.n_workers("identify", processes=False)
     lock = threading.Lock()
     current = [0]
     executor = ThreadPoolExecutor(n_workers)
@@ -551,6 +771,7 @@ def identify_async(
             roi,
             frame_bounds,
             lock,
+            return_spots,
         )
         for _ in range(n_workers)
     ]
@@ -566,10 +787,12 @@ def _identify_threaded(
     frame_bounds,
     progress_callback,
     abort_callback,
+    cut_spots=False,
 ):
     """Run identify_async and drive its progress loop.
 
-    Returns the identifications, or None if aborted.
+    Returns the identifications (and spots if ``cut_spots``), or None if
+    aborted.
     """
     N = len(movie)
     use_tqdm = progress_callback == "console"
@@ -579,7 +802,12 @@ def _identify_threaded(
         else None
     )
     current, futures = identify_async(
-        movie, minimum_ng, box, roi=roi, frame_bounds=frame_bounds
+        movie,
+        minimum_ng,
+        box,
+        roi=roi,
+        frame_bounds=frame_bounds,
+        return_spots=cut_spots,
     )
     last = 0
     while current[0] < N:
@@ -598,6 +826,8 @@ def _identify_threaded(
     if use_tqdm:
         iter_range.update(N - last)
         iter_range.close()
+    if cut_spots:
+        return _identifications_spots_from_futures(futures)
     return identifications_from_futures(futures)
 
 
@@ -608,31 +838,40 @@ def _identify_serial(
     roi,
     frame_bounds,
     progress_callback,
+    cut_spots=False,
 ):
-    """Identify spots frame-by-frame in the current thread."""
+    """Identify spots in batches of frames in the current thread. If
+    ``cut_spots``, the spots are returned as well."""
     N = len(movie)
+    batch_size = _identify_batch_size(movie)
     use_tqdm = progress_callback == "console"
-    iter_range = (
-        tqdm(range(N), desc="Identifying spots", unit="frame")
-        if use_tqdm
-        else range(N)
-    )
+    if use_tqdm:
+        pbar = tqdm(total=N, desc="Identifying spots", unit="frame")
     identifications = []
-    for i in iter_range:
+    for start in range(0, N, batch_size):
+        stop = min(start + batch_size, N)
         identifications.append(
-            identify_by_frame_number(
+            _identify_batch(
                 movie,
+                start,
+                stop,
                 minimum_ng,
                 box,
-                i,
-                roi=roi,
-                frame_bounds=frame_bounds,
+                roi,
+                frame_bounds,
+                None,
+                cut_spots,
             )
         )
-        if callable(progress_callback):
-            progress_callback(i)
-    ids = pd.concat(identifications, ignore_index=True)
-    ids.sort_values(by="frame", kind="quicksort", inplace=True)
+        if use_tqdm:
+            pbar.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop - 1)
+    if use_tqdm:
+        pbar.close()
+    if cut_spots:
+        return _concat_identifications_spots(identifications)
+    ids, _ = _identifications_to_dataframe(identifications)
     return ids
 
 
@@ -737,18 +976,27 @@ def identify(
             progress_callback,
         )
     if return_info:
-        info = {
-            "Generated by": f"Picasso: v{__version__} Identify",
-            "Min. Net Gradient": minimum_ng,
-            "Box Size": box,
-            "ROI": roi,
-            "Frame Bounds": frame_bounds,
-        }
-        return ids, info
+        return ids, _identify_info(minimum_ng, box, roi, frame_bounds)
     else:
         return ids
 
 
+def _identify_info(
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    frame_bounds: tuple[int, int] | None,
+) -> dict:
+    """Metadata describing an identification, see ``identify``."""
+    return {
+        "Generated by": f"Picasso: v{__version__} Identify",
+        "Min. Net Gradient": minimum_ng,
+        "Box Size": box,
+        "ROI": roi,
+        "Frame Bounds": frame_bounds,
+    }
+
+
 def picks_to_identifications(
     picks: list[tuple],
     *,
@@ -931,49 +1179,132 @@ def _cut_spots_numba(
     return spots
 
 
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _camera_map_value(camera_map: lib.FloatArray2D, y: int, x: int) -> float:
+    """Value of a camera map at pixel (y, x); maps of shape (1, 1) hold
+    a single value for all pixels."""
+    if camera_map.shape[0] == 1:
+        return camera_map[0, 0]
+    return camera_map[y, x]
+
+
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _cut_spots_photons_numba(
+    movie: lib.IntArray3D,
+    ids_frame: lib.IntArray1D,
+    ids_x: lib.IntArray1D,
+    ids_y: lib.IntArray1D,
+    box: int,
+    offset: lib.FloatArray2D,
+    scale: lib.FloatArray2D,
+) -> lib.FloatArray3D:
+    """Extract the spots out of a movie and convert them to photons in
+    the same pass, see ``_camera_maps``."""
+    n_spots = len(ids_x)
+    r = int(box / 2)
+    spots = np.empty((n_spots, box, box), dtype=np.float32)
+    for id in range(n_spots):
+        frame = ids_frame[id]
+        for i in range(box):
+            y = ids_y[id] - r + i
+            for j in range(box):
+                x = ids_x[id] - r + j
+                spots[id, i, j] = (
+                    movie[frame, y, x] - _camera_map_value(offset, y, x)
+                ) * _camera_map_value(scale, y, x)
+    return spots
+
+
+@numba.jit(nopython=True, nogil=True, cache=False)
+def _spots_to_photons_numba(
+    spots: lib.IntArray3D,
+    ids_x: lib.IntArray1D,
+    ids_y: lib.IntArray1D,
+    offset: lib.FloatArray2D,
+    scale: lib.FloatArray2D,
+) -> lib.FloatArray3D:
+    """Convert spots that were already cut out to photons. The spot
+    positions are only used for per-pixel camera maps."""
+    n_spots, box, _ = spots.shape
+    r = int(box / 2)
+    per_pixel = offset.shape[0] > 1 or scale.shape[0] > 1
+    photons = np.empty((n_spots, box, box), dtype=np.float32)
+    for id in range(n_spots):
+        for i in range(box):
+            for j in range(box):
+                if per_pixel:
+                    y = ids_y[id] - r + i
+                    x = ids_x[id] - r + j
+                else:
+                    y = 0
+                    x = 0
+                photons[id, i, j] = (
+                    spots[id, i, j] - _camera_map_value(offset, y, x)
+                ) * _camera_map_value(scale, y, x)
+    return photons
+
+
+def _spot_frame_index(
+    ids_frame: lib.IntArray1D,
+) -> tuple[lib.IntArray1D, lib.IntArray1D, lib.IntArray1D]:
+    """Index of the spots per frame in compressed sparse row (CSR)
+    layout. The identifications may be in any order.
+
+    Returns
+    -------
+    frames : lib.IntArray1D
+        Sorted frame numbers that contain at least one spot.
+    offsets : lib.IntArray1D
+        The spots ``order[offsets[i] : offsets[i + 1]]`` lie in frame
+        ``frames[i]``. Length ``len(frames) + 1``.
+    order : lib.IntArray1D
+        Indices of the spots sorted by frame.
+    """
+    ids_frame = np.asarray(ids_frame, dtype=np.int64)
+    order = np.argsort(ids_frame, kind="stable")
+    frames, counts = np.unique(ids_frame[order], return_counts=True)
+    offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return frames, offsets, order
+
+
 @numba.jit(nopython=True, cache=False)
 def _cut_spots_frame(
     frame: lib.IntArray2D,
-    frame_number: int,
-    ids_frame: lib.IntArray1D,
+    spot_ids: lib.IntArray1D,
     ids_x: lib.IntArray1D,
     ids_y: lib.IntArray1D,
     r: int,
-    start: int,
-    N: int,
     spots: lib.IntArray3D,
-) -> int:
-    """Extract spots from a movie frame."""
-    for j in range(start, N):
-        if ids_frame[j] > frame_number:
-            break
-        if ids_frame[j] < frame_number:
-            break
+) -> None:
+    """Extract the spots ``spot_ids`` from a movie frame."""
+    for j in spot_ids:
         yc = ids_y[j]
         xc = ids_x[j]
         spots[j] = frame[yc - r : yc + r + 1, xc - r : xc + r + 1]
-    return j
 
 
 @numba.jit(nopython=True, cache=False)
 def _cut_spots_daskmov(
     movie: lib.IntArray3D,
-    l_mov: lib.IntArray1D,
-    ids_frame: lib.IntArray1D,
+    frames: lib.IntArray1D,
+    offsets: lib.IntArray1D,
+    order: lib.IntArray1D,
     ids_x: lib.IntArray1D,
     ids_y: lib.IntArray1D,
     box: int,
     spots: lib.IntArray3D,
 ):
-    """Extract the spots out of a movie frame by frame.
+    """Extract the spots out of a movie frame by frame, visiting only
+    the frames that contain spots.
 
     Parameters
     ----------
     movie : lib.IntArray3D
         The input movie data as a 3D numpy array.
-    l_mov : lib.IntArray1D
-        Length of the movie, a 1D array with a single element.
-    ids_frame, ids_x, ids_y : lib.IntArray1D
+    frames, offsets, order : lib.IntArray1D
+        Index of the spots per frame, see ``_spot_frame_index``.
+    ids_x, ids_y : lib.IntArray1D
         1D arrays containing spot positions in the image data.
     box : int
         Size of the box to cut out around each spot. Should be an odd
@@ -989,19 +1320,13 @@ def _cut_spots_daskmov(
         the number of spots identified.
     """
     r = int(box / 2)
-    N = len(ids_frame)
-    start = 0
-    for frame_number in range(l_mov[0]):
-        frame = movie[frame_number, :, :]
-        start = _cut_spots_frame(
-            frame,
-            frame_number,
-            ids_frame,
+    for i in range(len(frames)):
+        _cut_spots_frame(
+            movie[frames[i], :, :],
+            order[offsets[i] : offsets[i + 1]],
             ids_x,
             ids_y,
             r,
-            start,
-            N,
             spots,
         )
     return spots
@@ -1015,7 +1340,9 @@ def _cut_spots_framebyframe(
     box: int,
     spots: lib.IntArray3D,
 ):
-    """Extract the spots out of a movie frame by frame.
+    """Extract the spots out of a movie frame by frame. Only the frames
+    that contain spots are read, such that cutting a few spots out of a
+    long movie is fast. The identifications may be in any order.
 
     Parameters
     ----------
@@ -1037,18 +1364,16 @@ def _cut_spots_framebyframe(
         the number of spots identified.
     """
     r = int(box / 2)
-    N = len(ids_frame)
-    start = 0
-    for frame_number, frame in enumerate(movie):
-        start = _cut_spots_frame(
-            frame,
-            frame_number,
-            ids_frame,
+    ids_x = np.asarray(ids_x)
+    ids_y = np.asarray(ids_y)
+    frames, offsets, order = _spot_frame_index(ids_frame)
+    for i, frame_number in enumerate(frames):
+        _cut_spots_frame(
+            movie[int(frame_number)],
+            order[offsets[i] : offsets[i + 1]],
             ids_x,
             ids_y,
             r,
-            start,
-            N,
             spots,
         )
     return spots
@@ -1068,14 +1393,15 @@ def _cut_spots(
             box,
         )
     elif isinstance(movie, io.ND2Movie) and movie.use_dask:
-        """Assumes that identifications are in order of frames!"""
         spots = np.zeros((N, box, box), dtype=movie.dtype)
+        frames, offsets, order = _spot_frame_index(ids["frame"].to_numpy())
         spots = da.apply_gufunc(
             _cut_spots_daskmov,
-            "(p,n,m),(b),(k),(k),(k),(),(k,l,l)->(k,l,l)",
+            "(p,n,m),(f),(g),(k),(k),(k),(),(k,l,l)->(k,l,l)",
             movie.data,
-            np.array([len(movie)]),
-            ids["frame"].to_numpy(),
+            frames,
+            offsets,
+            order,
             ids["x"].to_numpy(),
             ids["y"].to_numpy(),
             box,
@@ -1084,8 +1410,24 @@ def _cut_spots(
             allow_rechunk=True,
         ).compute()
         return spots
+    elif isinstance(movie, io.TiffMultiMap) and movie.memmaps is not None:
+        spots = np.zeros((N, box, box), dtype=movie.dtype)
+        frames = ids["frame"].to_numpy()
+        x = ids["x"].to_numpy()
+        y = ids["y"].to_numpy()
+        for memmap, first_frame in zip(movie.memmaps, movie.cum_n_frames):
+            in_map = (frames >= first_frame) & (
+                frames < first_frame + len(memmap)
+            )
+            spots[in_map] = _cut_spots_numba(
+                memmap,
+                frames[in_map] - first_frame,
+                x[in_map],
+                y[in_map],
+                box,
+            )
+        return spots
     else:
-        """Assumes that identifications are in order of frames!"""
         spots = np.zeros((N, box, box), dtype=movie.dtype)
         spots = _cut_spots_framebyframe(
             movie,
@@ -1098,18 +1440,220 @@ def _cut_spots(
         return spots
 
 
+# camera configuration -> (offset, scale), see _camera_maps
+_camera_maps_cache = {}
+# camera configuration -> variance map in photons^2, see _variance_map
+_variance_maps_cache = {}
+_camera_maps_lock = threading.Lock()
+_CAMERA_MAP_KEYS = ("Offset Map", "Gain Map", "Variance Map")
+# number of camera configurations kept in each cache
+_CAMERA_MAPS_CACHE_SIZE = 4
+
+
+def _load_camera_map(value: str | np.ndarray, name: str) -> np.ndarray:
+    """Load a per-pixel camera map given as an array or as the path to
+    a .npy file (memory-mapped)."""
+    if isinstance(value, (str, os.PathLike)):
+        value = np.load(value, mmap_mode="r")
+    camera_map = np.asarray(value, dtype=np.float32)
+    if camera_map.ndim != 2:
+        raise ValueError(
+            f"Camera info '{name}' must be a 2D array, got shape "
+            f"{camera_map.shape}."
+        )
+    return camera_map
+
+
+def _camera_maps_key(camera_info: dict) -> tuple | None:
+    """Hashable key of the camera configuration or None if the
+    per-pixel maps are given as arrays (which are not cached). Maps
+    given as paths are keyed by the path and the modification time of
+    the file, such that rewritten maps are loaded again."""
+    key = [camera_info[_] for _ in ("Baseline", "Sensitivity", "Gain")]
+    for name in _CAMERA_MAP_KEYS:
+        value = camera_info.get(name)
+        if value is None:
+            key.append(None)
+        elif isinstance(value, (str, os.PathLike)):
+            key.append((os.fspath(value), os.stat(value).st_mtime_ns))
+        else:
+            return None
+    return tuple(key)
+
+
+def _cache_camera_maps(
+    cache: dict, key: tuple, value: tuple | np.ndarray
+) -> None:
+    """Store ``value`` in one of the camera map caches, dropping the
+    oldest entries beyond ``_CAMERA_MAPS_CACHE_SIZE``."""
+    with _camera_maps_lock:
+        cache[key] = value
+        while len(cache) > _CAMERA_MAPS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+
+def _camera_maps(
+    camera_info: dict,
+) -> tuple[lib.FloatArray2D, lib.FloatArray2D]:
+    """Offset (ADU) and scale (photons per ADU) that convert the camera
+    signal to photons, ``(signal - offset) * scale``.
+
+    Besides the scalar `Baseline`, `Sensitivity` and `Gain`, the camera
+    info may contain the per-pixel maps of an sCMOS camera, `Offset Map`
+    (ADU) and `Gain Map` (ADU per electron), either as 2D arrays of the
+    size of the camera chip or as paths to .npy files. The offset map
+    replaces `Baseline` and the gain map replaces `Sensitivity`.
+    Scalars are returned as arrays of shape (1, 1).
+
+    The result is computed once per camera configuration, unless the
+    maps are given as arrays.
+
+    Since v0.10.1.
+    """
+    key = _camera_maps_key(camera_info)
+    if key is not None:
+        with _camera_maps_lock:
+            if key in _camera_maps_cache:
+                return _camera_maps_cache[key]
+    gain = camera_info["Gain"]
+    if camera_info.get("Offset Map") is not None:
+        offset = _load_camera_map(camera_info["Offset Map"], "Offset Map")
+    else:
+        offset = np.full((1, 1), camera_info["Baseline"], dtype=np.float32)
+    if camera_info.get("Gain Map") is not None:
+        gain_map = _load_camera_map(camera_info["Gain Map"], "Gain Map")
+        scale = (1 / (gain_map * gain)).astype(np.float32)
+    else:
+        # since v0.6.0: remove quantum efficiency to better reflect
+        # precision
+        sensitivity = camera_info["Sensitivity"]
+        scale = np.full((1, 1), sensitivity / gain, dtype=np.float32)
+    if offset.size > 1 and scale.size > 1 and offset.shape != scale.shape:
+        raise ValueError(
+            "Camera info 'Offset Map' and 'Gain Map' must have the same "
+            f"shape, got {offset.shape} and {scale.shape}."
+        )
+    if key is not None:
+        _cache_camera_maps(_camera_maps_cache, key, (offset, scale))
+    return offset, scale
+
+
+def _has_camera_maps(camera_info: dict) -> bool:
+    """Whether the camera info contains per-pixel camera maps."""
+    return any(camera_info.get(_) is not None for _ in _CAMERA_MAP_KEYS)
+
+
+def _frame_shape(movie, camera_info: dict) -> tuple[int, int] | None:
+    """Shape (height, width) of the movie frames, which the per-pixel
+    camera maps must have. None if the camera info has no maps. Movies
+    without a ``shape`` (e.g., ``io.TiffMap``) are read from their
+    ``info()``."""
+    if not _has_camera_maps(camera_info):
+        return None
+    shape = getattr(movie, "shape", None)
+    if shape is not None:
+        return tuple(shape[1:])
+    info = movie.info()
+    return info["Height"], info["Width"]
+
+
+def _frame_camera_maps(
+    camera_info: dict, shape: tuple[int, int] | None
+) -> tuple[lib.FloatArray2D, lib.FloatArray2D]:
+    """``_camera_maps`` for a movie with frames of shape ``shape``
+    (height, width, see ``_frame_shape``). Raises a ValueError if
+    `Offset Map` or `Gain Map` does not have this shape."""
+    offset, scale = _camera_maps(camera_info)
+    for name, camera_map in (("Offset Map", offset), ("Gain Map", scale)):
+        if camera_info.get(name) is None:
+            continue
+        if camera_map.shape != tuple(shape):
+            raise ValueError(
+                f"Camera info '{name}' must have the shape of the movie "
+                f"frames {tuple(shape)}, got {camera_map.shape}."
+            )
+    return offset, scale
+
+
+def _variance_map(camera_info: dict) -> lib.FloatArray2D | None:
+    """Per-pixel read noise variance of an sCMOS camera in photons^2,
+    computed once per camera configuration from the camera info
+    `Variance Map` (ADU^2, as a 2D array or a path to a .npy file) and
+    the photon conversion, see ``_camera_maps``. None if the camera
+    info has no variance map.
+
+    Since v0.10.1.
+    """
+    if camera_info.get("Variance Map") is None:
+        return None
+    key = _camera_maps_key(camera_info)
+    if key is not None:
+        with _camera_maps_lock:
+            if key in _variance_maps_cache:
+                return _variance_maps_cache[key]
+    _, scale = _camera_maps(camera_info)
+    variance = _load_camera_map(camera_info["Variance Map"], "Variance Map")
+    if scale.size > 1 and scale.shape != variance.shape:
+        raise ValueError(
+            "Camera info 'Variance Map' and 'Gain Map' must have the same "
+            f"shape, got {variance.shape} and {scale.shape}."
+        )
+    variance = np.ascontiguousarray(variance * scale**2, dtype=np.float32)
+    if key is not None:
+        _cache_camera_maps(_variance_maps_cache, key, variance)
+    return variance
+
+
+def _cut_variances(
+    camera_info: dict,
+    identifications: pd.DataFrame,
+    box: int,
+    shape: tuple[int, int] | None,
+) -> lib.FloatArray3D | None:
+    """Cut the per-pixel camera variance (photons^2) out at the
+    position of each spot, see ``_variance_map``. None if the camera
+    info has no variance map. Raises a ValueError if the variance map
+    does not have the shape of the movie frames, ``shape``."""
+    variance = _variance_map(camera_info)
+    if variance is None:
+        return None
+    if variance.shape != tuple(shape):
+        raise ValueError(
+            "Camera info 'Variance Map' must have the shape of the movie "
+            f"frames {tuple(shape)}, got {variance.shape}."
+        )
+    return _cut_spots_numba(
+        variance[np.newaxis],
+        np.zeros(len(identifications), dtype=np.int64),
+        identifications["x"].to_numpy(),
+        identifications["y"].to_numpy(),
+        box,
+    )
+
+
 def _to_photons(
-    spots: lib.FloatArray3D, camera_info: dict
+    spots: lib.FloatArray3D,
+    camera_info: dict,
+    identifications: pd.DataFrame | None = None,
 ) -> lib.FloatArray3D:
     """Convert the cut spots to photon counts based on camera
-    information."""
-    spots = np.float32(spots)
-    baseline = camera_info["Baseline"]
-    sensitivity = camera_info["Sensitivity"]
-    gain = camera_info["Gain"]
-    # since v0.6.0: remove quantum efficiency to better reflect precision
-    # qe = camera_info["Qe"]
-    return (spots - baseline) * sensitivity / (gain)
+    information. The result is computed in a single pass into a
+    float32 array. The positions of the spots (`identifications`) are
+    needed if the camera info contains per-pixel maps, see
+    ``_camera_maps``."""
+    offset, scale = _camera_maps(camera_info)
+    if identifications is None:
+        if offset.size > 1 or scale.size > 1:
+            raise ValueError(
+                "Spot positions are needed to apply per-pixel camera maps."
+            )
+        ids_x = ids_y = np.zeros(len(spots), dtype=np.int32)
+    else:
+        ids_x = identifications["x"].to_numpy()
+        ids_y = identifications["y"].to_numpy()
+    return _spots_to_photons_numba(
+        np.ascontiguousarray(spots), ids_x, ids_y, offset, scale
+    )
 
 
 def get_spots(
@@ -1133,7 +1677,10 @@ def get_spots(
         integer.
     camera_info : dict
         A dictionary containing camera information such as
-        `Baseline`, `Sensitivity`, and `Gain`.
+        `Baseline`, `Sensitivity`, and `Gain`. Since v0.10.1, may also
+        contain the per-pixel sCMOS maps `Offset Map` (ADU) and
+        `Gain Map` (ADU per electron) as 2D arrays or paths to .npy
+        files of the shape of the movie frames.
 
     Returns
     -------
@@ -1141,8 +1688,21 @@ def get_spots(
         A 3D numpy array containing the extracted spots, with shape
         (k, box, box), where k is the number of spots identified.
     """
+    offset, scale = _frame_camera_maps(
+        camera_info, _frame_shape(movie, camera_info)
+    )
+    if isinstance(movie, np.ndarray):
+        return _cut_spots_photons_numba(
+            movie,
+            identifications["frame"].to_numpy(),
+            identifications["x"].to_numpy(),
+            identifications["y"].to_numpy(),
+            box,
+            offset,
+            scale,
+        )
     spots = _cut_spots(movie, identifications, box)
-    return _to_photons(spots, camera_info)
+    return _to_photons(spots, camera_info, identifications)
 
 
 def fit(
@@ -1348,7 +1908,12 @@ def fit2D(
     identifications: pd.DataFrame,
     box: int,
     fitting_method: Literal[
-        "gausslq", "gausslq-gpu", "gaussmle", "avg"
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
     ] = "gausslq",
     eps: float = 0.001,
     max_it: int = 100,
@@ -1358,6 +1923,8 @@ def fit2D(
         Callable[[int], None] | Literal["console"] | None
     ) = None,
     abort_callback: Callable[[], bool] | None = None,
+    mle_warm_start: Literal["gausslq", "previous"] | None = None,
+    mle_converge_all: bool = False,
 ) -> tuple[pd.DataFrame | None, dict]:
     """Fit 2D localizations to a movie, given positions of the detected
     spots (identifications).
@@ -1370,19 +1937,28 @@ def fit2D(
         Movie metadata.
     camera_info : dict
         A dictionary containing camera information: "Baseline",
-        "Sensitivity", "Gain" and "Pixelsize".
+        "Sensitivity", "Gain" and "Pixelsize". Since v0.10.1, may also
+        contain the per-pixel calibration of an sCMOS camera: "Offset
+        Map" (ADU), "Gain Map" (ADU per electron) and "Variance Map"
+        (ADU^2), each as a 2D array of the shape of the movie frames or
+        as the path to a .npy file (loaded memory-mapped). The variance
+        map is used by "gaussmle" and "gaussmle-multi" fitting.
     identifications : pd.DataFrame
         Data frame containing the identified spots. Contains fields
         `frame`, `x`, `y`, and `net_gradient`.
     box : int
         Size of the box to cut out around each spot. Should be an odd
         integer.
-    fitting_method : {"gausslq", "gausslq-gpu", "gaussmle" or "avg"}, \
-            optional
+    fitting_method : {"gausslq", "gausslq-batch", "gausslq-gpu", \
+            "gaussmle", "gaussmle-multi" or "avg"}, optional
         Which 2D fitting algorithm to use. "gausslq" for least-squares
-        fitting of a 2D Gaussian. "gausslq-gpu" for its GPU
-        implemntation (if available). "gaussmle" for MLE 2D Gaussian
-        fitting. "avg" for taking the average of each spot.
+        fitting of a 2D Gaussian. "gausslq-batch" for the same model
+        fitted with a compiled, multithreaded solver (CPU). "gausslq-gpu"
+        for its GPU implementation (if available). "gaussmle" for MLE 2D
+        Gaussian fitting. "gaussmle-multi" for MLE fitting of up to 3
+        emitters per spot in dense frames (since v0.10.1), see
+        ``gaussmle.gaussmle_multi``. "avg" for taking the average of
+        each spot.
     eps : float, optional
         The convergence criterion for MLE fitting. Ignored for other
         methods. Default is 0.001.
@@ -1404,6 +1980,19 @@ def fit2D(
         callable provided, it must accept no input and return a boolean
         indicating whether the fitting should be aborted. Default is
         None.
+    mle_warm_start : {"gausslq", "previous"} or None, optional
+        Initial parameters of MLE fitting. "gausslq" starts from
+        least-squares fits (``gausslq.fit_spots_batch``), "previous"
+        from the fit of the spot at the same pixel in the previous
+        frame (e.g., during binding events lasting several frames). None
+        uses the default estimates. Ignored for other methods. Default
+        is None. Since v0.10.1.
+    mle_converge_all : bool, optional
+        If True, MLE fits converge only once all parameters (not only
+        the positions) settled, see ``gaussmle.gaussmle``, e.g., to
+        compare warm and cold starts. The localizations then contain
+        the column `converged`. Ignored for other methods. Default is
+        False. Since v0.10.1.
 
     Returns
     -------
@@ -1411,7 +2000,8 @@ def fit2D(
         Data frame containing the localized spots. Returns None if
         fitting was aborted.
     new_info : dict
-        New metadata.
+        New metadata. For MLE fitting, it includes the statistics of the
+        number of iterations, see ``gaussmle.iteration_statistics``.
     """
     accepted_movie_types = (io.AbstractPicassoMovie, np.memmap)
     if bitplane.IMSWRITER:
@@ -1428,9 +2018,16 @@ def fit2D(
         identifications, pd.DataFrame
     ), "identifications must be a DataFrame"
     assert isinstance(box, int) and box > 0, "box must be a positive integer"
-    assert fitting_method in ["gausslq", "gausslq-gpu", "gaussmle", "avg"], (
-        "fitting_method must be one of 'gausslq', 'gausslq-gpu',"
-        " 'gaussmle', or 'avg'"
+    assert fitting_method in [
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
+    ], (
+        "fitting_method must be one of 'gausslq', 'gausslq-batch',"
+        " 'gausslq-gpu', 'gaussmle', 'gaussmle-multi', or 'avg'"
     )
     assert (
         isinstance(eps, (int, float)) and eps > 0
@@ -1442,6 +2039,14 @@ def fit2D(
         "sigma",
         "sigmaxy",
     ], "mle_method must be 'sigma' or 'sigmaxy'"
+    assert mle_warm_start in [
+        None,
+        "gausslq",
+        "previous",
+    ], "mle_warm_start must be None, 'gausslq' or 'previous'"
+    assert isinstance(
+        mle_converge_all, bool
+    ), "mle_converge_all must be a boolean"
     assert isinstance(multiprocess, bool), "multiprocess must be a boolean"
     if "Pixelsize" not in camera_info:
         warnings.warn(
@@ -1452,6 +2057,63 @@ def fit2D(
         camera_info["Pixelsize"] = 130
 
     spots = get_spots(movie, identifications, box, camera_info)
+    locs = _fit_spots_2d(
+        spots=spots,
+        identifications=identifications,
+        box=box,
+        camera_info=camera_info,
+        frame_shape=_frame_shape(movie, camera_info),
+        fitting_method=fitting_method,
+        eps=eps,
+        max_it=max_it,
+        mle_method=mle_method,
+        multiprocess=multiprocess,
+        progress_callback=progress_callback,
+        abort_callback=abort_callback,
+        mle_warm_start=mle_warm_start,
+        mle_converge_all=mle_converge_all,
+    )
+    new_info = _fit2d_info(
+        camera_info,
+        fitting_method,
+        eps,
+        max_it,
+        mle_warm_start,
+        mle_converge_all,
+    )
+    _add_iteration_statistics(new_info, locs, max_it)
+    return locs, new_info
+
+
+def _fit_spots_2d(
+    spots: lib.FloatArray3D,
+    identifications: pd.DataFrame,
+    box: int,
+    camera_info: dict,
+    frame_shape: tuple[int, int],
+    fitting_method: Literal[
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
+    ] = "gausslq",
+    eps: float = 0.001,
+    max_it: int = 100,
+    mle_method: Literal["sigma", "sigmaxy"] = "sigmaxy",
+    multiprocess: bool = True,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+    abort_callback: Callable[[], bool] | None = None,
+    mle_warm_start: Literal["gausslq", "previous"] | None = None,
+    mle_converge_all: bool = False,
+) -> pd.DataFrame | None:
+    """Fit already extracted spots (in photons) with the chosen 2D
+    fitting method. Assumes validated inputs, see ``fit2D`` for
+    details. ``frame_shape`` is the shape of the movie frames the
+    spots were cut from."""
     em = camera_info["Gain"] > 1
     if fitting_method == "gausslq":
         locs = _fit2d_gausslq(
@@ -1463,6 +2125,14 @@ def fit2D(
             progress_callback=progress_callback,
             abort_callback=abort_callback,
         )
+    elif fitting_method == "gausslq-batch":
+        locs = _fit2d_gausslq_batch(
+            spots=spots,
+            identifications=identifications,
+            box=box,
+            em=em,
+            progress_callback=progress_callback,
+        )
     elif fitting_method == "gausslq-gpu":
         if callable(progress_callback):
             progress_callback(1)
@@ -1483,6 +2153,26 @@ def fit2D(
             multiprocess=multiprocess,
             progress_callback=progress_callback,
             abort_callback=abort_callback,
+            warm_start=mle_warm_start,
+            converge_all=mle_converge_all,
+            variances=_cut_variances(
+                camera_info, identifications, box, frame_shape
+            ),
+        )
+    elif fitting_method == "gaussmle-multi":
+        locs = _fit2d_gaussmle_multi(
+            spots=spots,
+            identifications=identifications,
+            box=box,
+            eps=eps,
+            max_it=max_it,
+            multiprocess=multiprocess,
+            progress_callback=progress_callback,
+            abort_callback=abort_callback,
+            converge_all=mle_converge_all,
+            variances=_cut_variances(
+                camera_info, identifications, box, frame_shape
+            ),
         )
     elif fitting_method == "avg":
         locs = _fit2d_avg(
@@ -1494,16 +2184,65 @@ def fit2D(
             progress_callback,
             abort_callback,
         )
-    # updated metadata
+    return locs
+
+
+def _fit2d_info(
+    camera_info: dict,
+    fitting_method: str,
+    eps: float,
+    max_it: int,
+    mle_warm_start: str | None = None,
+    mle_converge_all: bool = False,
+) -> dict:
+    """Metadata describing a 2D fit, see ``fit2D``."""
     localize_info = {
         "Generated by": f"Picasso: v{__version__} Fit 2D",
         "Fit method": fitting_method,
     }
-    if fitting_method == "gaussmle":
+    if fitting_method in ("gaussmle", "gaussmle-multi"):
         localize_info["Convergence criterion"] = eps
         localize_info["Max iterations"] = max_it
-    new_info = localize_info | camera_info
-    return locs, new_info
+        if mle_warm_start is not None:
+            localize_info["Warm start"] = mle_warm_start
+        if mle_converge_all:
+            localize_info["Converge all parameters"] = True
+    # per-pixel camera maps given as arrays are not stored in the
+    # metadata, only their paths
+    camera_info = {
+        key: (
+            (
+                "array"
+                if isinstance(value, np.ndarray)
+                else value if value is None else os.fspath(value)
+            )
+            if key in _CAMERA_MAP_KEYS
+            else value
+        )
+        for key, value in camera_info.items()
+    }
+    return localize_info | camera_info
+
+
+def _add_iteration_statistics(
+    fit_info: dict, locs: pd.DataFrame | None, max_it: int
+) -> None:
+    """Add the statistics of the number of MLE iterations (see
+    ``gaussmle.iteration_statistics``) to the fitting metadata."""
+    if fit_info["Fit method"] not in ("gaussmle", "gaussmle-multi"):
+        return
+    if locs is None:
+        return
+    if "iterations" not in locs.columns:
+        return
+    converged = None
+    if "converged" in locs.columns:
+        converged = locs["converged"].to_numpy()
+    fit_info.update(
+        gaussmle.iteration_statistics(
+            locs["iterations"].to_numpy(), max_it, converged=converged
+        )
+    )
 
 
 def _fit2d_gausslq(
@@ -1538,6 +2277,21 @@ def _fit2d_gausslq(
     return locs
 
 
+def _fit2d_gausslq_batch(
+    spots: lib.FloatArray3D,
+    identifications: pd.DataFrame,
+    box: int,
+    em: bool,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+) -> pd.DataFrame:
+    """Fit 2D Gaussians using the compiled least squares batch solver
+    (multithreaded). See ``fit_2D`` for more details."""
+    theta = gausslq.fit_spots_batch(spots, progress_callback=progress_callback)
+    return gausslq.locs_from_fits(identifications, theta, box, em)
+
+
 def _fit2d_gausslq_gpu(
     spots: lib.FloatArray3D,
     identifications: pd.DataFrame,
@@ -1563,18 +2317,46 @@ def _fit2d_gaussmle(
         Callable[[int], None] | Literal["console"] | None
     ) = None,
     abort_callback: Callable[[], bool] | None = None,
+    warm_start: Literal["gausslq", "previous"] | None = None,
+    converge_all: bool = False,
+    variances: lib.FloatArray3D | None = None,
 ) -> pd.DataFrame | None:
     """Fit 2D Gaussians using MLE fitting. See ``fit_2D`` for more
-    details."""
+    details. ``converge_all`` and ``variances`` (the per-pixel sCMOS
+    read noise variance of the spots in photons^2) are passed to
+    ``gaussmle.gaussmle``; the column `converged` is only added with
+    ``converge_all``."""
     N = len(identifications)
+    init_thetas = previous = None
+    if warm_start == "gausslq":
+        init_thetas = gausslq.fit_spots_batch(spots)
+        # gausslq positions are relative to the box center
+        init_thetas[:, :2] += int(box / 2)
+    elif warm_start == "previous":
+        previous = gaussmle.previous_frame_spots(identifications)
     # MLE API is a bit different (at least for now) so we cannot use
     # _process_fitting_futures here
     use_tqdm = progress_callback == "console"
     if use_tqdm:
         iter_range = tqdm(total=N, desc="Fitting", unit="spot")
     if multiprocess:
-        curr, thetas, CRLBs, llhoods, iterations = gaussmle.gaussmle_async(
-            spots, eps, max_it, method=mle_method
+        (
+            curr,
+            thetas,
+            CRLBs,
+            llhoods,
+            iterations,
+            converged,
+        ) = gaussmle.gaussmle_async(
+            spots,
+            eps,
+            max_it,
+            method=mle_method,
+            init_thetas=init_thetas,
+            previous=previous,
+            variances=variances,
+            converge_all=converge_all,
+            return_converged=True,
         )
         last = 0
         while curr[0] < N:
@@ -1595,8 +2377,17 @@ def _fit2d_gaussmle(
             iter_range.update(N - last)
             iter_range.close()
     else:
-        thetas, CRLBs, llhoods, iterations = gaussmle.gaussmle(
-            spots, eps, max_it, mle_method, progress_callback
+        thetas, CRLBs, llhoods, iterations, converged = gaussmle.gaussmle(
+            spots,
+            eps,
+            max_it,
+            mle_method,
+            progress_callback,
+            init_thetas=init_thetas,
+            previous=previous,
+            variances=variances,
+            converge_all=converge_all,
+            return_converged=True,
         )
     locs = gaussmle.locs_from_fits(
         identifications,
@@ -1605,10 +2396,62 @@ def _fit2d_gaussmle(
         llhoods,
         iterations,
         box,
+        converged=converged if converge_all else None,
     )
     return locs
 
 
+def _fit2d_gaussmle_multi(
+    spots: lib.FloatArray3D,
+    identifications: pd.DataFrame,
+    box: int,
+    eps: float = 0.001,
+    max_it: int = 100,
+    multiprocess: bool = True,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+    abort_callback: Callable[[], bool] | None = None,
+    converge_all: bool = False,
+    variances: lib.FloatArray3D | None = None,
+) -> pd.DataFrame | None:
+    """Fit up to 3 emitters per spot using MLE fitting, see
+    ``gaussmle.gaussmle_multi``. ``abort_callback`` is checked between
+    blocks of spots. ``variances`` is the per-pixel sCMOS read noise
+    variance of the spots in photons^2. The column `converged` is only
+    added with ``converge_all``."""
+    (
+        thetas,
+        CRLBs,
+        llhoods,
+        iterations,
+        n_emitters,
+        converged,
+    ) = gaussmle.gaussmle_multi(
+        spots,
+        eps,
+        max_it,
+        parallel=multiprocess,
+        progress_callback=progress_callback,
+        abort_callback=abort_callback,
+        variances=variances,
+        converge_all=converge_all,
+        return_converged=True,
+    )
+    if callable(abort_callback) and abort_callback():
+        return
+    return gaussmle.locs_from_multi_fits(
+        identifications,
+        thetas,
+        CRLBs,
+        llhoods,
+        iterations,
+        n_emitters,
+        box,
+        converged=converged if converge_all else None,
+    )
+
+
 def _fit2d_avg(
     spots: lib.FloatArray3D,
     identifications: pd.DataFrame,
@@ -1622,14 +2465,12 @@ def _fit2d_avg(
 ) -> pd.DataFrame | None:
     """Take localizations at the average value of the spots, see
     ``fit_2D`` for more details."""
-    N = len(identifications)
+    if callable(abort_callback) and abort_callback():
+        return
     if multiprocess:
-        fs = avgroi.fit_spots_parallel(spots, asynch=True)
-        theta = _process_fitting_futures(
-            fs, N, progress_callback, abort_callback
+        theta = avgroi.fit_spots_batch(
+            spots, progress_callback=progress_callback
         )
-        if theta is None:
-            return
     else:
         theta = avgroi.fit_spots(spots, progress_callback)
     locs = avgroi.locs_from_fits(
@@ -1688,11 +2529,18 @@ def localize(
     frame_bounds: tuple[int, int] | None = None,
     movie_info: list[dict] | None = None,
     fitting_method: Literal[
-        "gausslq", "gausslq-gpu", "gaussmle", "avg"
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
     ] = "gausslq",
     eps: float = 0.001,
     max_it: int = 100,
     mle_method: Literal["sigma", "sigmaxy"] = "sigmaxy",
+    mle_warm_start: Literal["gausslq", "previous"] | None = None,
+    mle_converge_all: bool = False,
     threaded: bool = True,
     identification_progress_callback: (
         Callable[[int], None] | Literal["console"] | None
@@ -1700,6 +2548,8 @@ def localize(
     fit_progress_callback: (
         Callable[[int], None] | Literal["console"] | None
     ) = None,
+    chunk_size: int | None = None,
+    checkpoint_path: str | None = None,
     return_info: bool = None,  # TODO: change to bool in v0.11.0
 ) -> pd.DataFrame | tuple[pd.DataFrame, list[dict]]:
     """Localize (i.e., identify and fit) spots in 2D in a movie using
@@ -1708,6 +2558,14 @@ def localize(
     Since v0.10.0: support for frame bounds and ROI for identification +
     all fitting methods.
 
+    Since v0.10.1: streaming mode (``chunk_size``), where the movie is
+    processed in blocks of frames such that peak memory depends on the
+    chunk size rather than on the movie length. Identification (and
+    cutting of spots) of the next chunk runs in a background thread
+    while the current chunk is being fitted. Movies that are not numpy
+    arrays (e.g., TIFF, ND2) are read only once, as spots are cut out
+    during identification.
+
     Parameters
     ----------
     movie : lib.IntArray3D
@@ -1733,8 +2591,8 @@ def localize(
     frame_bounds : tuple, optional
         Minimum and maximum frame numbers to consider for the
         identification. If None, all frames are used. Default is None.
-    fitting_method : {"gausslq", "gausslq-gpu", "gaussmle" or "avg"}, \
-            optional
+    fitting_method : {"gausslq", "gausslq-batch", "gausslq-gpu", \
+            "gaussmle", "gaussmle-multi" or "avg"}, optional
         Which 2D fitting algorithm to use. Default is "gausslq".
     eps : float, optional
         The convergence criterion for MLE fitting. Default is 0.001.
@@ -1743,6 +2601,13 @@ def localize(
         100.
     mle_method : Literal["sigma", "sigmaxy"], optional
         The method used for MLE fitting. Default is "sigmaxy".
+    mle_warm_start : {"gausslq", "previous"} or None, optional
+        Initial parameters of MLE fitting, see ``fit2D``. In streaming
+        mode, spots are only linked to the previous frame within a
+        chunk. Default is None.
+    mle_converge_all : bool, optional
+        Whether all parameters of MLE fits must converge, see
+        ``fit2D``. Default is False.
     identification_progress_callback : callable or "console" or None
         A callback for progress updates during identification. If
         "console", progress will be printed to the console. If None,
@@ -1751,6 +2616,20 @@ def localize(
         A callback for progress updates during fitting. If "console",
         progress will be printed to the console. If None, progress is
         not reported. Default is None.
+    chunk_size : int, optional
+        If given, the movie is localized in chunks of this many frames
+        (streaming mode). Progress callbacks then receive the number of
+        processed frames (identification) and the number of fitted
+        spots (fitting), both accumulated over all chunks. If None, the
+        whole movie is identified first and then fitted. Default is
+        None.
+    checkpoint_path : str, optional
+        Only used in streaming mode. If given, the localizations of
+        each chunk are appended to this .hdf5 file together with the
+        last localized frame (see ``io.append_locs_checkpoint``). If
+        the file holds a checkpoint of the same movie and parameters,
+        e.g., of an interrupted run, localization resumes after the
+        last localized frame. Default is None.
     return_info : bool, optional
         Whether to return additional information about the fitting
         process. Default is None, which is treated as False. If True,
@@ -1783,6 +2662,58 @@ def localize(
     if movie_info is None:
         movie_info = []
 
+    if chunk_size is not None:
+        locs, identify_info, fit_info = _localize_chunked(
+            movie=movie,
+            camera_info=camera_info,
+            parameters=parameters,
+            roi=roi,
+            frame_bounds=frame_bounds,
+            fitting_method=fitting_method,
+            eps=eps,
+            max_it=max_it,
+            mle_method=mle_method,
+            mle_warm_start=mle_warm_start,
+            mle_converge_all=mle_converge_all,
+            threaded=threaded,
+            chunk_size=chunk_size,
+            identification_progress_callback=(
+                identification_progress_callback
+            ),
+            fit_progress_callback=fit_progress_callback,
+            checkpoint_path=checkpoint_path,
+            movie_info=movie_info,
+        )
+        info = movie_info + [identify_info] + [fit_info]
+        if return_info:
+            return locs, info
+        return locs
+
+    if not isinstance(movie, np.ndarray):
+        # Cut spots during identification to read the movie only once
+        locs, identify_info, fit_info = _localize_single_pass(
+            movie=movie,
+            camera_info=camera_info,
+            parameters=parameters,
+            roi=roi,
+            frame_bounds=frame_bounds,
+            fitting_method=fitting_method,
+            eps=eps,
+            max_it=max_it,
+            mle_method=mle_method,
+            mle_warm_start=mle_warm_start,
+            mle_converge_all=mle_converge_all,
+            threaded=threaded,
+            identification_progress_callback=(
+                identification_progress_callback
+            ),
+            fit_progress_callback=fit_progress_callback,
+        )
+        info = movie_info + [identify_info] + [fit_info]
+        if return_info:
+            return locs, info
+        return locs
+
     # Identify spots
     identifications, identify_info = identify(
         movie,
@@ -1808,6 +2739,8 @@ def localize(
         mle_method=mle_method,
         multiprocess=threaded,
         progress_callback=fit_progress_callback,
+        mle_warm_start=mle_warm_start,
+        mle_converge_all=mle_converge_all,
     )
     info = movie_info + [identify_info] + [fit_info]
     if return_info:
@@ -1815,6 +2748,639 @@ def localize(
     return locs
 
 
+def _localize_single_pass(
+    movie: lib.IntArray3D,
+    camera_info: dict,
+    parameters: dict,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    frame_bounds: tuple[int, int] | None,
+    fitting_method: Literal[
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
+    ],
+    eps: float,
+    max_it: int,
+    mle_method: Literal["sigma", "sigmaxy"],
+    mle_warm_start: Literal["gausslq", "previous"] | None,
+    mle_converge_all: bool,
+    threaded: bool,
+    identification_progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ),
+    fit_progress_callback: Callable[[int], None] | Literal["console"] | None,
+) -> tuple[pd.DataFrame, dict, dict]:
+    """Version of ``localize`` for movies read from disk frame by frame
+    (e.g., TIFF or ND2), where spots are cut out during identification
+    instead of reading the movie a second time. Returns the
+    localizations, identification and fitting metadata."""
+    minimum_ng = parameters["Min. Net Gradient"]
+    box = parameters["Box Size"]
+    if "Pixelsize" not in camera_info:
+        warnings.warn(
+            "Camera info in picasso.localize.localize does not contain "
+            "'Pixelsize', i.e., effective camera pixel size in nm. "
+            "Assuming 130."
+        )
+        camera_info["Pixelsize"] = 130
+    # check the camera maps before identifying, see _to_photons
+    frame_shape = _frame_shape(movie, camera_info)
+    _frame_camera_maps(camera_info, frame_shape)
+    if threaded:
+        identifications, spots = _identify_threaded(
+            movie,
+            minimum_ng,
+            box,
+            roi,
+            frame_bounds,
+            identification_progress_callback,
+            None,
+            cut_spots=True,
+        )
+    else:
+        identifications, spots = _identify_serial(
+            movie,
+            minimum_ng,
+            box,
+            roi,
+            frame_bounds,
+            identification_progress_callback,
+            cut_spots=True,
+        )
+    locs = _fit_spots_2d(
+        spots=_to_photons(spots, camera_info, identifications),
+        identifications=identifications,
+        box=box,
+        camera_info=camera_info,
+        frame_shape=frame_shape,
+        fitting_method=fitting_method,
+        eps=eps,
+        max_it=max_it,
+        mle_method=mle_method,
+        multiprocess=threaded,
+        progress_callback=fit_progress_callback,
+        mle_warm_start=mle_warm_start,
+        mle_converge_all=mle_converge_all,
+    )
+    identify_info = _identify_info(minimum_ng, box, roi, frame_bounds)
+    fit_info = _fit2d_info(
+        camera_info,
+        fitting_method,
+        eps,
+        max_it,
+        mle_warm_start,
+        mle_converge_all,
+    )
+    _add_iteration_statistics(fit_info, locs, max_it)
+    return locs, identify_info, fit_info
+
+
+def _chunk_frame_range(
+    n_frames: int, frame_bounds: tuple[int, int] | None
+) -> tuple[int, int]:
+    """Convert (inclusive) frame bounds into a half-open range of frames
+    to be processed, see ``identify_by_frame_number``."""
+    start, stop = 0, n_frames
+    if frame_bounds is not None:
+        if frame_bounds[0] is not None:
+            start = max(frame_bounds[0], 0)
+        if frame_bounds[1] is not None:
+            stop = min(frame_bounds[1] + 1, n_frames)
+    return start, max(start, stop)
+
+
+def _read_frames(
+    movie: lib.IntArray3D, start: int, stop: int
+) -> lib.IntArray3D:
+    """Load frames ``start:stop`` of a movie into memory."""
+    if isinstance(movie, np.ndarray):
+        frames = np.asarray(movie[start:stop])
+        if not frames.dtype.isnative:  # e.g., big-endian .raw movies
+            frames = frames.astype(frames.dtype.newbyteorder("="))
+        return frames
+    elif isinstance(movie, io.TiffMultiMap) and movie.memmaps is not None:
+        return movie[start:stop]
+    return np.stack([movie[i] for i in range(start, stop)])
+
+
+def _identify_and_cut_chunk(
+    movie: lib.IntArray3D,
+    start: int,
+    stop: int,
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    camera_info: dict,
+    executor: ThreadPoolExecutor | None,
+) -> tuple[pd.DataFrame, lib.FloatArray3D]:
+    """Identify spots in frames ``start:stop`` and cut them out (in
+    photons). Batches of frames are distributed over the executor's
+    threads, if given."""
+    frames = _read_frames(movie, start, stop)
+    batch_size = _identify_batch_size(frames)
+
+    def identify_batch(i):
+        return _identify_in_frames(
+            frames[i : i + batch_size], i, minimum_ng, box, roi
+        )
+
+    batch_starts = range(0, len(frames), batch_size)
+    if executor is None:
+        results = list(map(identify_batch, batch_starts))
+    else:
+        results = list(executor.map(identify_batch, batch_starts))
+    ids, _ = _identifications_to_dataframe(results)
+    offset, scale = _frame_camera_maps(camera_info, frames.shape[1:])
+    spots = _cut_spots_photons_numba(
+        frames,
+        ids["frame"].to_numpy(),
+        ids["x"].to_numpy(),
+        ids["y"].to_numpy(),
+        box,
+        offset,
+        scale,
+    )
+    ids["frame"] += start
+    return ids, spots
+
+
+def _iter_localize_chunks(
+    movie: lib.IntArray3D,
+    start: int,
+    stop: int,
+    chunk_size: int,
+    minimum_ng: float,
+    box: int,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    camera_info: dict,
+    threaded: bool,
+):
+    """Yield ``(identifications, spots, n_frames)`` for consecutive
+    chunks of the movie. The next chunk is read, identified and cut in
+    a background thread while the caller processes the current one, so
+    at most two chunks are held in memory at a time."""
+    chunk_starts = list(range(start, stop, chunk_size))
+    if not chunk_starts:
+        return
+    n_workers = resources.n_workers("identify", processes=False)
+    identifier = ThreadPoolExecutor(n_workers) if threaded else None
+    reader = ThreadPoolExecutor(1)
+
+    def submit(chunk_start):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        future = reader.submit(
+            _identify_and_cut_chunk,
+            movie,
+            chunk_start,
+            chunk_stop,
+            minimum_ng,
+            box,
+            roi,
+            camera_info,
+            identifier,
+        )
+        return future, chunk_stop - chunk_start
+
+    try:
+        future, n_frames = submit(chunk_starts[0])
+        for chunk_start in chunk_starts[1:]:
+            identifications, spots = future.result()
+            future_next, n_frames_next = submit(chunk_start)
+            yield identifications, spots, n_frames
+            future, n_frames = future_next, n_frames_next
+        identifications, spots = future.result()
+        yield identifications, spots, n_frames
+    finally:
+        reader.shutdown(wait=True, cancel_futures=True)
+        if identifier is not None:
+            identifier.shutdown(wait=True)
+
+
+def _localize_chunked(
+    movie: lib.IntArray3D,
+    camera_info: dict,
+    parameters: dict,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None,
+    frame_bounds: tuple[int, int] | None,
+    fitting_method: Literal[
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
+    ],
+    eps: float,
+    max_it: int,
+    mle_method: Literal["sigma", "sigmaxy"],
+    mle_warm_start: Literal["gausslq", "previous"] | None,
+    mle_converge_all: bool,
+    threaded: bool,
+    chunk_size: int,
+    identification_progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ),
+    fit_progress_callback: Callable[[int], None] | Literal["console"] | None,
+    checkpoint_path: str | None = None,
+    movie_info: list[dict] | None = None,
+    fit_z: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+) -> tuple[pd.DataFrame, dict, dict]:
+    """Streaming version of ``localize``, see there for details.
+    Returns the localizations, identification and fitting metadata.
+    ``fit_z`` (see ``zfit._z_fitter``) adds z coordinates to the
+    localizations of each chunk right after their 2D fit."""
+    assert (
+        isinstance(chunk_size, int) and chunk_size > 0
+    ), "chunk_size must be a positive integer"
+    minimum_ng = parameters["Min. Net Gradient"]
+    box = parameters["Box Size"]
+    if "Pixelsize" not in camera_info:
+        warnings.warn(
+            "Camera info in picasso.localize.localize does not contain "
+            "'Pixelsize', i.e., effective camera pixel size in nm. "
+            "Assuming 130."
+        )
+        camera_info["Pixelsize"] = 130
+
+    identify_info = _identify_info(minimum_ng, box, roi, frame_bounds)
+    identify_info["Chunk Size"] = chunk_size
+    fit_info = _fit2d_info(
+        camera_info,
+        fitting_method,
+        eps,
+        max_it,
+        mle_warm_start,
+        mle_converge_all,
+    )
+
+    frame_shape = _frame_shape(movie, camera_info)
+    start, stop = _chunk_frame_range(len(movie), frame_bounds)
+    locs = []
+    n_frames_done = 0
+    n_spots_done = 0
+    if checkpoint_path is not None:
+        checkpoint_key = _checkpoint_key(
+            movie, movie_info, identify_info, fit_info
+        )
+        checkpoint = io.load_locs_checkpoint(checkpoint_path, checkpoint_key)
+        if checkpoint is not None:
+            checkpoint_locs, last_frame = checkpoint
+            if checkpoint_locs is not None:
+                locs.append(checkpoint_locs)
+                n_spots_done = len(checkpoint_locs)
+            n_frames_done = max(last_frame + 1 - start, 0)
+            warnings.warn(
+                f"Resuming localization from {checkpoint_path} after frame"
+                f" {last_frame}."
+            )
+    use_tqdm = "console" in (
+        identification_progress_callback,
+        fit_progress_callback,
+    )
+    if use_tqdm:
+        iter_range = tqdm(
+            total=stop - start,
+            initial=n_frames_done,
+            desc="Localizing",
+            unit="frame",
+        )
+    chunks = _iter_localize_chunks(
+        movie,
+        start + n_frames_done,
+        stop,
+        chunk_size,
+        minimum_ng,
+        box,
+        roi,
+        camera_info,
+        threaded,
+    )
+    for identifications, spots, n_frames in chunks:
+        n_frames_done += n_frames
+        if use_tqdm:
+            iter_range.update(n_frames)
+        elif callable(identification_progress_callback):
+            identification_progress_callback(n_frames_done)
+        if not len(identifications):
+            if checkpoint_path is not None:
+                io.append_locs_checkpoint(
+                    checkpoint_path,
+                    pd.DataFrame(),
+                    start + n_frames_done - 1,
+                    checkpoint_key,
+                )
+            continue
+        if callable(fit_progress_callback):
+            offset = n_spots_done
+
+            def chunk_progress_callback(n):
+                fit_progress_callback(offset + n)
+
+        else:
+            chunk_progress_callback = None
+        chunk_locs = _fit_spots_2d(
+            spots=spots,
+            identifications=identifications,
+            box=box,
+            camera_info=camera_info,
+            frame_shape=frame_shape,
+            fitting_method=fitting_method,
+            eps=eps,
+            max_it=max_it,
+            mle_method=mle_method,
+            multiprocess=threaded,
+            progress_callback=chunk_progress_callback,
+            mle_warm_start=mle_warm_start,
+            mle_converge_all=mle_converge_all,
+        )
+        if fit_z is not None:
+            chunk_locs = fit_z(chunk_locs)
+        n_spots_done += len(identifications)
+        if callable(fit_progress_callback):
+            fit_progress_callback(n_spots_done)
+        if checkpoint_path is not None:
+            io.append_locs_checkpoint(
+                checkpoint_path,
+                chunk_locs,
+                start + n_frames_done - 1,
+                checkpoint_key,
+            )
+        locs.append(chunk_locs)
+    if use_tqdm:
+        iter_range.close()
+
+    if locs:
+        locs = pd.concat(locs, ignore_index=True)
+    else:
+        # fit zero spots to obtain the columns of the fitting method
+        locs = _fit_spots_2d(
+            spots=np.zeros((0, box, box), dtype=np.float32),
+            identifications=pd.DataFrame(
+                {
+                    "frame": pd.Series(dtype=int),
+                    "x": pd.Series(dtype=int),
+                    "y": pd.Series(dtype=int),
+                    "net_gradient": pd.Series(dtype=np.float32),
+                }
+            ),
+            box=box,
+            camera_info=camera_info,
+            frame_shape=frame_shape,
+            fitting_method=fitting_method,
+            eps=eps,
+            max_it=max_it,
+            mle_method=mle_method,
+            multiprocess=False,
+        )
+        if fit_z is not None:
+            locs = fit_z(locs)
+    _add_iteration_statistics(fit_info, locs, max_it)
+    return locs, identify_info, fit_info
+
+
+def _checkpoint_key(
+    movie: lib.IntArray3D,
+    movie_info: list[dict] | None,
+    identify_info: dict,
+    fit_info: dict,
+) -> str:
+    """Serialize what determines the localizations of a movie, such
+    that a checkpoint is only resumed for the same analysis."""
+    key = {
+        "Frames": len(movie),
+        "Movie info": movie_info or [],
+        "Identify": identify_info,
+        "Fit": fit_info,
+    }
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+def _load_growing_movie(
+    path: str,
+    loaded: tuple[lib.IntArray3D, list[dict]] | None = None,
+) -> tuple[lib.IntArray3D, list[dict]] | None:
+    """Load the frames that have been written so far to a movie that
+    may still be acquired. ``loaded`` is the result of the previous
+    call, if any, such that only the new part of the movie is read:
+    .raw movies are memory-mapped according to the file size (frames
+    are converted to little-endian byte order chunk by chunk when read,
+    see ``_read_frames``) and only the newly appended IFDs of TIFF
+    movies are read. Returns None if the movie cannot be read (yet)."""
+    if os.path.splitext(path)[1].lower() == ".raw":
+        if loaded is not None:
+            info = loaded[1]
+        elif os.path.isfile(os.path.splitext(path)[0] + ".yaml"):
+            info = io.load_info(path)
+        else:
+            return None
+        dtype = np.dtype(info[0]["Data Type"]).newbyteorder(
+            info[0]["Byte Order"]
+        )
+        frame_bytes = info[0]["Height"] * info[0]["Width"] * dtype.itemsize
+        # floor division, i.e., only completely written frames
+        n_frames = os.path.getsize(path) // frame_bytes
+        if n_frames == 0:
+            return None
+        info[0]["Frames"] = n_frames
+        shape = (n_frames, info[0]["Height"], info[0]["Width"])
+        return np.memmap(path, dtype, "r", shape=shape), info
+    if loaded is not None and hasattr(loaded[0], "refresh"):
+        movie, info = loaded
+        try:
+            movie.refresh()
+        except Exception:  # the IFD is being written, retry next time
+            pass
+        info[0]["Frames"] = len(movie)
+        return movie, info
+    if loaded is not None and hasattr(loaded[0], "close"):
+        loaded[0].close()
+    try:
+        return io.load_movie(path)
+    except Exception:  # the file is being written, e.g., incomplete IFD
+        return None
+
+
+def localize_online(
+    path: str,
+    camera_info: dict,
+    parameters: dict,
+    out_path: str,
+    *,
+    roi: tuple[tuple[int, int], tuple[int, int]] | None = None,
+    fitting_method: Literal[
+        "gausslq",
+        "gausslq-batch",
+        "gausslq-gpu",
+        "gaussmle",
+        "gaussmle-multi",
+        "avg",
+    ] = "gausslq",
+    eps: float = 0.001,
+    max_it: int = 100,
+    mle_method: Literal["sigma", "sigmaxy"] = "sigmaxy",
+    chunk_size: int = 100,
+    poll_interval: float = 2.0,
+    idle_timeout: float = 60.0,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> tuple[pd.DataFrame, list[dict]]:
+    """Localize a movie (``.raw`` or ``.ome.tif``) while it is being
+    acquired. New frames are localized in chunks as soon as they are
+    written and the localizations are appended to ``out_path`` (see
+    ``io.append_locs_checkpoint``), together with a metadata .yaml
+    file, such that intermediate results can be loaded with
+    ``io.load_locs``. Localization ends once the movie has not grown
+    for ``idle_timeout`` seconds. If interrupted, calling this function
+    again resumes after the last localized frame.
+
+    For ``.raw`` movies, the metadata .yaml file must exist from the
+    start of the acquisition; the number of frames is taken from the
+    file size.
+
+    Parameters
+    ----------
+    path : str
+        Path to the movie that is being acquired.
+    camera_info : dict
+        Camera information, see ``localize``.
+    parameters : dict
+        Localization parameters, see ``localize``.
+    out_path : str
+        Path to the output .hdf5 file.
+    roi : tuple, optional
+        Region of interest, see ``localize``. Default is None.
+    fitting_method : {"gausslq", "gausslq-batch", "gausslq-gpu", \
+            "gaussmle", "gaussmle-multi" or "avg"}, optional
+        Which 2D fitting algorithm to use. Default is "gausslq".
+    eps : float, optional
+        The convergence criterion for MLE fitting. Default is 0.001.
+    max_it : int, optional
+        The maximum number of iterations for MLE fitting. Default is
+        100.
+    mle_method : Literal["sigma", "sigmaxy"], optional
+        The method used for MLE fitting. Default is "sigmaxy".
+    chunk_size : int, optional
+        Maximum number of frames localized at once. Default is 100.
+    poll_interval : float, optional
+        Time (seconds) between checks for new frames. Default is 2.
+    idle_timeout : float, optional
+        Time (seconds) after which the acquisition is considered
+        finished if no new frames were written. Default is 60.
+    progress_callback : callable, optional
+        Called with the number of localized frames and the number of
+        localizations after each chunk. Default is None.
+
+    Returns
+    -------
+    locs : pd.DataFrame
+        Localizations of the whole movie.
+    info : list[dict]
+        Movie, identification and fitting metadata.
+    """
+    minimum_ng = parameters["Min. Net Gradient"]
+    box = parameters["Box Size"]
+    camera_info = camera_info | {
+        "Pixelsize": camera_info.get("Pixelsize", 130)
+    }
+    identify_info = _identify_info(minimum_ng, box, roi, None)
+    identify_info["Chunk Size"] = chunk_size
+    fit_info = _fit2d_info(camera_info, fitting_method, eps, max_it)
+    # the movie grows, so only the file and the parameters identify it
+    key = json.dumps(
+        {
+            "Movie": os.path.abspath(path),
+            "Identify": identify_info,
+            "Fit": fit_info,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    info_path = os.path.splitext(out_path)[0] + ".yaml"
+    n_frames_done = 0
+    n_locs = 0
+    checkpoint = io.load_locs_checkpoint(out_path, key)
+    if checkpoint is not None:
+        checkpoint_locs, last_frame = checkpoint
+        n_frames_done = last_frame + 1
+        n_locs = 0 if checkpoint_locs is None else len(checkpoint_locs)
+
+    # frames of .raw movies are complete (the number of frames is
+    # found by floor division of the file size), whereas the last IFD of
+    # a TIFF movie may be written before its image data
+    holds_last_frame = os.path.splitext(path)[1].lower() != ".raw"
+    loaded = None
+    n_frames_seen = 0
+    last_change = time.time()
+    while True:
+        loaded = _load_growing_movie(path, loaded)
+        n_frames = 0 if loaded is None else len(loaded[0])
+        if n_frames > n_frames_seen:
+            n_frames_seen = n_frames
+            last_change = time.time()
+        finished = time.time() - last_change > idle_timeout
+        n_complete = n_frames
+        if holds_last_frame and not finished:
+            n_complete -= 1
+        if n_complete > n_frames_done:
+            movie, movie_info = loaded
+            movie_info = [movie_info[0] | {"Frames": n_complete}]
+            movie_info += loaded[1][1:]
+            chunks = _iter_localize_chunks(
+                movie,
+                n_frames_done,
+                n_complete,
+                chunk_size,
+                minimum_ng,
+                box,
+                roi,
+                camera_info,
+                True,
+            )
+            for identifications, spots, n_chunk_frames in chunks:
+                if len(identifications):
+                    chunk_locs = _fit_spots_2d(
+                        spots=spots,
+                        identifications=identifications,
+                        box=box,
+                        camera_info=camera_info,
+                        frame_shape=_frame_shape(movie, camera_info),
+                        fitting_method=fitting_method,
+                        eps=eps,
+                        max_it=max_it,
+                        mle_method=mle_method,
+                        multiprocess=True,
+                    )
+                else:
+                    chunk_locs = pd.DataFrame()
+                n_frames_done += n_chunk_frames
+                n_locs += len(chunk_locs)
+                io.append_locs_checkpoint(
+                    out_path, chunk_locs, n_frames_done - 1, key, online=True
+                )
+                if callable(progress_callback):
+                    progress_callback(n_frames_done, n_locs)
+            io.save_info(info_path, movie_info + [identify_info, fit_info])
+        elif finished:
+            if loaded is None or n_frames_done == 0:
+                raise FileNotFoundError(f"No frames found in {path}.")
+            break
+        else:
+            time.sleep(poll_interval)
+    if loaded is not None and hasattr(loaded[0], "close"):
+        loaded[0].close()
+
+    checkpoint = io.load_locs_checkpoint(out_path, key)
+    locs = checkpoint[0] if checkpoint is not None else None
+    if locs is None:
+        locs = pd.DataFrame()
+    movie_info = loaded[1]
+    movie_info = [movie_info[0] | {"Frames": n_frames_done}] + movie_info[1:]
+    _add_iteration_statistics(fit_info, locs, max_it)
+    return locs, movie_info + [identify_info, fit_info]
+
+
 def localize_3D(
     movie: lib.IntArray3D,
     *,
@@ -1827,6 +3393,7 @@ def localize_3D(
     frame_bounds: tuple[int, int] | None = None,
     fitting_method: Literal[
         "gausslq",
+        "gausslq-batch",
         "gausslq-gpu",
         "gaussmle",
     ] = "gausslq",
@@ -1843,12 +3410,18 @@ def localize_3D(
     fit_z_progress_callback: (
         Callable[[int], None] | Literal["console"] | None
     ) = None,
+    chunk_size: int = _LOCALIZE_3D_CHUNK_SIZE,
 ) -> tuple[pd.DataFrame, list[dict]]:
     """Localize (i.e., identify and fit) spots in 3D in a movie using
     the specified parameters. First runs 2D localizations, followed
     by z position fitting assuming astigmatism, see Huang, et al.
     Science, 2008.
 
+    Since v0.10.1, the movie is processed in a single pass in chunks of
+    ``chunk_size`` frames (see ``localize``). The z positions of each
+    chunk are fitted right after its 2D fit, with the calibration curve
+    tabulated once for the whole movie.
+
     Parameters
     ----------
     movie : lib.IntArray3D
@@ -1888,12 +3461,13 @@ def localize_3D(
         is to be specified, the other is to be set to None, for example,
         ``(5, None)`` sets minimum frame to 5 without maximum frame.
         Default is None.
-    fitting_method : {"gausslq", "gausslq-gpu", "gaussmle" or "avg"}, \
-            optional
+    fitting_method : {"gausslq", "gausslq-batch", "gausslq-gpu", \
+            "gaussmle" or "avg"}, optional
         Which 2D fitting algorithm to use. "gausslq" for least-squares
-        fitting of a 2D Gaussian. "gausslq-gpu" for its GPU
-        implemntation (if available). "gaussmle" for MLE 2D Gaussian
-        fitting. "avg" for taking the average of each spot.
+        fitting of a 2D Gaussian. "gausslq-batch" for the same model
+        fitted with a compiled, multithreaded solver (CPU). "gausslq-gpu"
+        for its GPU implementation (if available). "gaussmle" for MLE 2D
+        Gaussian fitting. "avg" for taking the average of each spot.
     eps : float, optional
         The convergence criterion for MLE fitting. Ignored for other
         methods. Default is 0.001.
@@ -1906,6 +3480,8 @@ def localize_3D(
     multiprocess: bool, optional
         Whether or not to use multiprocessing. Ignored for GPU fitting.
         Default is True.
+    chunk_size : int, optional
+        Number of frames localized at a time. Default is 1000.
     progress_callbacks : callable, "console" or None, optional
         If a callable provided, it must accept one integer input (number
         of movie frames, or spots for identifying and fitting callbacks,
@@ -1934,9 +3510,13 @@ def localize_3D(
     ), "calibration_3d must be a dict or a path to a YAML file"
     assert fitting_method in [
         "gausslq",
+        "gausslq-batch",
         "gausslq-gpu",
         "gaussmle",
-    ], "fitting_method must be one of 'gausslq', 'gausslq-gpu', or 'gaussmle'"
+    ], (
+        "fitting_method must be one of 'gausslq', 'gausslq-batch',"
+        " 'gausslq-gpu', or 'gaussmle'"
+    )
     assert (
         isinstance(eps, (int, float)) and eps > 0
     ), "eps must be a positive number"
@@ -1948,6 +3528,9 @@ def localize_3D(
         "sigmaxy",
     ], "mle_method must be 'sigma' or 'sigmaxy'"
     assert isinstance(multiprocess, bool), "multiprocess must be a boolean"
+    assert (
+        isinstance(chunk_size, int) and chunk_size > 0
+    ), "chunk_size must be a positive integer"
     return _localize_3D(
         movie=movie,
         movie_info=movie_info,
@@ -1965,6 +3548,7 @@ def localize_3D(
         identification_progress_callback=identification_progress_callback,
         fit_progress_callback=fit_progress_callback,
         fit_z_progress_callback=fit_z_progress_callback,
+        chunk_size=chunk_size,
     )
 
 
@@ -1980,6 +3564,7 @@ def _localize_3D(
     frame_bounds: tuple[int, int] | None = None,
     fitting_method: Literal[
         "gausslq",
+        "gausslq-batch",
         "gausslq-gpu",
         "gaussmle",
     ] = "gausslq",
@@ -1996,9 +3581,50 @@ def _localize_3D(
     fit_z_progress_callback: (
         Callable[[int], None] | Literal["console"] | None
     ) = None,
+    chunk_size: int = _LOCALIZE_3D_CHUNK_SIZE,
 ) -> tuple[pd.DataFrame, list[dict]]:
     """Internal function for `localize_3D`, assumes validated inputs."""
-    locs, info = localize(
+    if isinstance(calibration_3d, str):
+        calibration_3d = io.load_calibration(calibration_3d)
+    assert (
+        "Magnification factor" in calibration_3d
+    ), "Magnification factor is missing in calibration."
+    if "Pixelsize" not in camera_info:
+        warnings.warn(
+            "Camera info in picasso.localize.localize_3D does not contain "
+            "'Pixelsize', i.e., effective camera pixel size in nm. "
+            "Assuming 130."
+        )
+        camera_info["Pixelsize"] = 130
+    fitting_method_3d = (
+        "gausslq"
+        if fitting_method in ["gausslq", "gausslq-batch", "gausslq-gpu"]
+        else "gaussmle"
+    )
+    z_fitter = zfit._z_fitter(
+        calibration_3d,
+        camera_info["Pixelsize"],
+        fitting_method_3d,
+        threaded=multiprocess,
+    )
+    n_z_fitted = 0
+    # the number of localizations is not known in advance
+    use_tqdm = fit_z_progress_callback == "console"
+    if use_tqdm:
+        pbar = tqdm(desc="Fitting z", unit="loc")
+
+    def fit_z(locs):
+        # runs right after the 2D fit of each chunk
+        nonlocal n_z_fitted
+        locs = z_fitter(locs)
+        n_z_fitted += len(locs)
+        if use_tqdm:
+            pbar.update(len(locs))
+        elif callable(fit_z_progress_callback):
+            fit_z_progress_callback(n_z_fitted)
+        return locs
+
+    locs, identify_info, fit_info = _localize_chunked(
         movie=movie,
         camera_info=camera_info,
         parameters={
@@ -2007,30 +3633,24 @@ def _localize_3D(
         },
         roi=roi,
         frame_bounds=frame_bounds,
-        movie_info=movie_info,
         fitting_method=fitting_method,
         eps=eps,
         max_it=max_it,
         mle_method=mle_method,
+        mle_warm_start=None,
+        mle_converge_all=False,
         threaded=multiprocess,
+        chunk_size=chunk_size,
         identification_progress_callback=identification_progress_callback,
         fit_progress_callback=fit_progress_callback,
-        return_info=True,  # TODO: remove in v0.12.0
-    )
-    fitting_method_3d = (
-        "gausslq"
-        if fitting_method in ["gausslq", "gausslq-gpu"]
-        else "gaussmle"
-    )
-    locs, info = zfit.zfit(
-        locs=locs,
-        info=info,
-        calibration=calibration_3d,
-        fitting_method=fitting_method_3d,
-        filter=0,
-        multiprocess=multiprocess,
-        progress_callback=fit_z_progress_callback,
+        movie_info=movie_info,
+        fit_z=fit_z,
     )
+    if use_tqdm:
+        pbar.close()
+    info = movie_info + [identify_info, fit_info]
+    locs = lib.ensure_sanity(locs, info)
+    info = info + [zfit._zfit_info(calibration_3d, 0)]
     return locs, info
 
 
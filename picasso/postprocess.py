@@ -12,7 +12,6 @@ Data analysis of localization lists.
 from __future__ import annotations
 
 import itertools
-import multiprocessing
 import os
 import warnings
 from collections import OrderedDict
@@ -31,7 +30,16 @@ from scipy.optimize import curve_fit, OptimizeWarning
 from scipy.spatial import distance, KDTree
 from tqdm import tqdm, trange
 
-from . import io, lib, clusterer, render, imageprocess, masking, __version__
+from . import (
+    io,
+    lib,
+    clusterer,
+    render,
+    imageprocess,
+    masking,
+    resources,
+    __version__,
+)
 
 
 def get_index_blocks(
@@ -1028,9 +1036,7 @@ def distance_histogram(
         locs, info, r_max
     )
     N = len(locs)
-    n_threads = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
+    n_threads = resources.n_workers("postprocess", processes=False)
     chunk = int(N / n_threads)
     starts = range(0, N, chunk)
     args = [
@@ -1048,7 +1054,7 @@ def distance_histogram(
         )
         for start in starts
     ]
-    with _ThreadPoolExecutor() as executor:
+    with _ThreadPoolExecutor(n_threads) as executor:
         futures = [executor.submit(_distance_histogram, *_) for _ in args]
     results = [future.result() for future in futures]
     dh = np.sum(results, axis=0)
@@ -1605,9 +1611,7 @@ def compute_local_density(
         get_index_blocks(locs, info, radius)
     )
     N = len(locs)
-    n_threads = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
+    n_threads = resources.n_workers("postprocess", processes=False)
     chunk = int(N / n_threads)
     starts = range(0, N, chunk)
     args = [
@@ -1624,7 +1628,7 @@ def compute_local_density(
         )
         for start in starts
     ]
-    with _ThreadPoolExecutor() as executor:
+    with _ThreadPoolExecutor(n_threads) as executor:
         futures = [executor.submit(_local_density, *_) for _ in args]
     density = np.sum([future.result() for future in futures], axis=0)
     locs["density"] = density
@@ -2011,10 +2015,20 @@ def link(
     max_dark_time: int = 3,
     combine_mode: Literal["average", "refit"] = "average",
     remove_ambiguous_lengths: bool = True,
+    *,
+    movie: lib.IntArray3D | None = None,
+    camera_info: dict | None = None,
+    box: int | None = None,
+    fitting_method: Literal["gaussmle", "gausslq"] = "gaussmle",
+    chunk_size: int = 100_000,
 ) -> pd.DataFrame:
     """Link localizations, i.e., group them into binding events based
     on their spatiotemporal proximity.
 
+    Since v0.10.1: ``combine_mode="refit"`` sums the raw spots of all
+    frames of a binding event and fits the sum once, which is more
+    precise than averaging the per-frame fits.
+
     Parameters
     ----------
     locs : pd.DataFrame
@@ -2028,12 +2042,31 @@ def link(
     combine_mode : {'average', 'refit'}, optional
         Mode for combining linked localizations. 'average' calculates
         the average position and properties of the linked localizations,
-        while 'refit' would refit the linked localizations to a model.
-        'refit' is not implemented yet. Default is 'average'.
+        while 'refit' sums the spots of the linked localizations (cut
+        out of ``movie`` at the average position) and fits a 2D Gaussian
+        to the sum. In this case, the columns `x`, `y`, `photons`, `sx`,
+        `sy`, `bg`, `lpx`, `lpy`, `ellipticity` and `photon_rate` are
+        taken from the fit, as are `log_likelihood` and `iterations` for
+        'gaussmle'; `net_gradient` and `converged` are removed. The
+        other columns (e.g., `z`) are averaged. Default is 'average'.
     remove_ambiguous_lengths : bool, optional
         If True, removes linked localizations with ambiguous lengths,
         i.e., localizations that are linked to multiple binding events
         with different lengths. Default is True.
+    movie : lib.IntArray3D, optional
+        The movie the localizations were obtained from (see
+        ``io.load_movie``). Required for the 'refit' mode.
+    camera_info : dict, optional
+        `Baseline`, `Sensitivity` and `Gain` of the camera for the
+        'refit' mode. Default is None, i.e., taken from ``info``.
+    box : int, optional
+        Box size (pixels) of the refit spots. Default is None, i.e.,
+        `Box Size` from ``info``.
+    fitting_method : {'gaussmle', 'gausslq'}, optional
+        Fitting method for the 'refit' mode. Default is 'gaussmle'.
+    chunk_size : int, optional
+        Number of binding events refit at once in the 'refit' mode,
+        which limits the memory used for spots. Default is 100,000.
 
     Returns
     -------
@@ -2066,12 +2099,289 @@ def link(
                 remove_ambiguous_lengths=remove_ambiguous_lengths,
             )
         elif combine_mode == "refit":
-            raise NotImplementedError(
-                "Refit mode is not implemented yet. Please use 'average' mode."
+            if movie is None:
+                raise ValueError("combine_mode='refit' requires the movie.")
+            linked_locs = _link_loc_groups(
+                locs,
+                info,
+                link_group,
+                remove_ambiguous_lengths=remove_ambiguous_lengths,
+            )
+            linked_locs = _refit_link_groups(
+                linked_locs,
+                locs,
+                info,
+                link_group,
+                movie,
+                camera_info,
+                box,
+                fitting_method,
+                chunk_size,
+            )
+        else:
+            raise ValueError(
+                "combine_mode must be 'average' or 'refit', got "
+                f"{combine_mode!r}."
             )
     return linked_locs
 
 
+def link_lazy(
+    locs: io.LazyLocs,
+    path: str,
+    r_max: float = 0.05,
+    max_dark_time: int = 3,
+    remove_ambiguous_lengths: bool = True,
+    info: list[dict] | None = None,
+    compression: Literal["gzip", "lzf", "lz4", "blosc"] | None = "gzip",
+) -> io.LazyLocs:
+    """Link localizations that do not fit into the RAM block by block
+    and write the binding events into a new file, see ``link`` (with
+    ``combine_mode="average"``) and ``io.LazyLocs``.
+
+    The localizations are read in blocks of whole frames, see
+    ``io.LazyLocs.iter_blocks``. Binding events whose last localization
+    lies within ``max_dark_time`` frames of the end of a block may
+    continue in the next block; their localizations are carried over
+    and linked again with the next block. The binding events are the
+    same as those of ``link`` and written in the order of their first
+    localization. The memory used is bounded by the block size and the
+    localizations carried over.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    locs : io.LazyLocs
+        Localizations, sorted by frame.
+    path : str
+        Path to the new .hdf5 file.
+    r_max, max_dark_time, remove_ambiguous_lengths : optional
+        See ``link``.
+    info : list of dicts, optional
+        Metadata of the new file. Default is None, i.e., the metadata
+        of ``locs`` with the linking parameters.
+    compression : {"gzip", "lzf", "lz4", "blosc"} or None, optional
+        See ``io.save_locs``. Default is "gzip".
+
+    Returns
+    -------
+    linked_locs : io.LazyLocs
+        Linked localizations, i.e., binding events with their
+        properties.
+    """
+    if info is None:
+        info = locs.info + [
+            {
+                "Maximum Distance": r_max,
+                "Maximum Transient Dark Time": max_dark_time,
+                "Generated by": f"Picasso v{__version__} Link",
+            }
+        ]
+    carry = locs._empty_block()  # localizations of unfinished events
+    pending = []  # finished events after the first unfinished event
+
+    def link_block(block, final):
+        """Link a block, return the finished binding events (with the
+        row of their first localization in the file) and the
+        localizations of the unfinished ones."""
+        n_locs = len(block)
+        if "group" in block.columns:
+            group = block["group"].to_numpy()
+        else:
+            group = np.zeros(n_locs, dtype=np.int32)
+        frame = block["frame"].to_numpy()
+        link_group = _get_link_groups(
+            frame,
+            block["x"].to_numpy(),
+            block["y"].to_numpy(),
+            r_max,
+            max_dark_time,
+            group,
+        )
+        n_groups = link_group.max() + 1
+        first_row, _ = _link_group_min_max(
+            block.index.to_numpy(), link_group, n_locs, n_groups
+        )
+        _, last_frame = _link_group_min_max(
+            frame, link_group, n_locs, n_groups
+        )
+        if final:
+            unfinished = np.zeros(n_groups, dtype=bool)
+        else:
+            unfinished = last_frame.astype(np.int64) + max_dark_time >= (
+                frame[-1]
+            )
+        events = _link_loc_groups(
+            block,
+            locs.info,
+            link_group,
+            remove_ambiguous_lengths=remove_ambiguous_lengths,
+        )
+        finished = ~unfinished[events.index.to_numpy()]
+        events = events[finished]
+        rows = first_row[events.index.to_numpy()]
+        first_unfinished = (
+            first_row[unfinished].min() if unfinished.any() else None
+        )
+        return events, rows, first_unfinished, block[unfinished[link_group]]
+
+    with io.LocsWriter(path, info, compression=compression) as writer:
+        for block in locs.iter_blocks(by_frame=True):
+            block = pd.concat([carry, block]) if len(carry) else block
+            events, rows, first_unfinished, carry = link_block(block, False)
+            pending.append(events.set_index(rows))
+            pending = [pd.concat(pending).sort_index()]
+            # events are written once all earlier ones are finished
+            if first_unfinished is None:
+                ready = np.ones(len(pending[0]), dtype=bool)
+            else:
+                ready = pending[0].index.to_numpy() < first_unfinished
+            writer.append(pending[0][ready])
+            pending = [pending[0][~ready]]
+        if len(carry):
+            events, rows, _, _ = link_block(carry, True)
+            pending.append(events.set_index(rows))
+        if pending:
+            writer.append(pd.concat(pending).sort_index())
+        else:  # no localizations, the columns of link
+            writer.append(link(locs._empty_block(), locs.info))
+    return io.LazyLocs(path, block_size=locs.block_size)
+
+
+# columns of linked localizations that are replaced by the refit
+_REFIT_COLUMNS = (
+    "x",
+    "y",
+    "photons",
+    "sx",
+    "sy",
+    "bg",
+    "lpx",
+    "lpy",
+    "ellipticity",
+)
+# columns of linked localizations that describe the per-frame fits
+# and are removed by the refit; MLE refits add their own
+_REFIT_DROP_COLUMNS = (
+    "net_gradient",
+    "likelihood",
+    "log_likelihood",
+    "iterations",
+    "converged",
+)
+_REFIT_MLE_COLUMNS = ("log_likelihood", "iterations")
+
+
+def _refit_link_groups(
+    linked_locs: pd.DataFrame,
+    locs: pd.DataFrame,
+    info: list[dict],
+    link_group: lib.IntArray1D,
+    movie: lib.IntArray3D,
+    camera_info: dict | None,
+    box: int | None,
+    fitting_method: Literal["gaussmle", "gausslq"],
+    chunk_size: int,
+) -> pd.DataFrame:
+    """Refit binding events (``combine_mode="refit"`` in ``link``).
+
+    For each binding event (row of ``linked_locs``, whose index is the
+    link group), the spots of all its localizations (``locs``, sorted
+    by frame, and ``link_group``) are cut out around the rounded
+    average position, converted to photons, summed and fitted. Events
+    are processed in chunks of ``chunk_size``; since link groups are
+    numbered by their first frame, each chunk reads a window of
+    frames. The index of ``linked_locs`` is kept."""
+    from . import gausslq, gaussmle, localize
+
+    assert fitting_method in [
+        "gaussmle",
+        "gausslq",
+    ], "fitting_method must be 'gaussmle' or 'gausslq'"
+    if camera_info is None:
+        camera_info = {
+            key: lib.get_from_metadata(info, key, raise_error=True)
+            for key in ("Baseline", "Sensitivity", "Gain")
+        }
+    if box is None:
+        box = lib.get_from_metadata(info, "Box Size", raise_error=True)
+    r = int(box / 2)
+    width = lib.get_from_metadata(info, "Width", raise_error=True)
+    height = lib.get_from_metadata(info, "Height", raise_error=True)
+
+    groups = linked_locs.index.to_numpy()
+    n_events = len(groups)
+    linked_locs = linked_locs.drop(
+        columns=[_ for _ in _REFIT_DROP_COLUMNS if _ in linked_locs.columns]
+    )
+    if not n_events:
+        return linked_locs
+    # box centers, such that the boxes lie within the frames
+    center_x = np.clip(
+        np.round(linked_locs["x"].to_numpy()), r, width - 1 - r
+    ).astype(np.int64)
+    center_y = np.clip(
+        np.round(linked_locs["y"].to_numpy()), r, height - 1 - r
+    ).astype(np.int64)
+
+    # localizations of each event, sorted by event (CSR layout)
+    event = np.full(link_group.max() + 1, -1, dtype=np.int64)
+    event[groups] = np.arange(n_events)
+    loc_event = event[link_group]
+    order = np.argsort(loc_event, kind="stable")
+    order = order[loc_event[order] >= 0]
+    loc_event = loc_event[order]
+    loc_frame = locs["frame"].to_numpy()[order]
+    offsets = np.zeros(n_events + 1, dtype=np.int64)
+    np.cumsum(np.bincount(loc_event, minlength=n_events), out=offsets[1:])
+
+    em = camera_info["Gain"] > 1
+    fits = []
+    for start in range(0, n_events, chunk_size):
+        stop = min(start + chunk_size, n_events)
+        first, last = offsets[start], offsets[stop]
+        ids = pd.DataFrame(
+            {
+                "frame": loc_frame[first:last],
+                "x": center_x[loc_event[first:last]],
+                "y": center_y[loc_event[first:last]],
+            }
+        )
+        spots = localize.get_spots(movie, ids, box, camera_info)
+        summed = np.add.reduceat(
+            spots, offsets[start:stop] - first, axis=0
+        ).astype(np.float32)
+        event_ids = pd.DataFrame(
+            {
+                "frame": linked_locs["frame"].to_numpy()[start:stop],
+                "x": center_x[start:stop],
+                "y": center_y[start:stop],
+                "net_gradient": np.zeros(stop - start, dtype=np.float32),
+                "n_id": np.arange(start, stop),
+            }
+        )
+        if fitting_method == "gaussmle":
+            thetas, CRLBs, likelihoods, iterations = gaussmle.gaussmle(
+                summed, 0.001, 100
+            )
+            chunk_fits = gaussmle.locs_from_fits(
+                event_ids, thetas, CRLBs, likelihoods, iterations, box
+            )
+        else:
+            theta = gausslq.fit_spots_batch(summed)
+            chunk_fits = gausslq.locs_from_fits(event_ids, theta, box, em)
+        fits.append(chunk_fits)
+    fits = pd.concat(fits, ignore_index=True)
+    for column in _REFIT_COLUMNS + _REFIT_MLE_COLUMNS:
+        if column in fits.columns:
+            linked_locs[column] = fits[column].to_numpy()
+    linked_locs["photon_rate"] = np.float32(
+        linked_locs["photons"] / linked_locs["n"]
+    )
+    return linked_locs
+
+
 def combine_locs_in_picks(
     locs: pd.DataFrame,
     info: list[dict],
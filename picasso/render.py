@@ -172,6 +172,35 @@ def render(
         raise Exception("blur_method not understood.")
 
 
+def render_columns(
+    blur_method: (
+        Literal["gaussian", "gaussian_iso", "smooth", "convolve"] | None
+    ),
+) -> list[str]:
+    """Columns of the localizations that ``render`` reads with the
+    given blur method and without rotation, e.g., to load only these
+    columns with ``io.load_locs``.
+
+    Since v0.10.1.
+
+    Parameters
+    ----------
+    blur_method : {"gaussian", "gaussian_iso", "smooth", "convolve"} or None
+        Blur method, see ``render``.
+
+    Returns
+    -------
+    columns : list of str
+        The names of the columns.
+    """
+    if blur_method in (None, "smooth"):
+        return ["x", "y"]
+    if blur_method in ("gaussian", "gaussian_iso", "convolve"):
+        # blurred with the localization precision
+        return ["x", "y", "lpx", "lpy"]
+    raise ValueError("blur_method not understood.")
+
+
 @numba.njit
 def _render_setup(
     x: lib.FloatArray1D,
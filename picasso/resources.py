@@ -0,0 +1,407 @@
+"""
+picasso.resources
+~~~~~~~~~~~~~~~~~
+
+Number of workers and task granularity of the parallel stages of
+Picasso (identification, fitting, z fitting, ...).
+
+For each stage, the number of workers is taken from (in this order):
+
+1. The environment variable ``PICASSO_WORKERS_<STAGE>`` (for example,
+   ``PICASSO_WORKERS_FIT``) or ``PICASSO_WORKERS`` for all stages. The
+   value is either a number of workers (e.g., ``96``) or a fraction of
+   the available CPUs (e.g., ``0.5``).
+2. A calibration run (``calibrate``, also available as ``picasso
+   calibrate`` from the command line, or ``autotune``), which is stored
+   in the user settings. The fraction of CPUs used for spot
+   identification set before v0.10.1 (``cpu_utilization`` in the
+   Localize user settings) is taken over as a calibration result.
+3. A default fraction of the available CPUs.
+
+Similarly, the number of tasks per worker can be set with
+``PICASSO_TASKS_PER_WORKER_<STAGE>`` or calibrated (``autotune_tasks``).
+
+The available CPUs respect the CPU affinity of the process (e.g., set
+by a cluster scheduler). Only process pools on Windows are limited to
+61 workers; threads and process pools on Linux and macOS may use all
+cores.
+
+:author: Rafal Kowalewski, 2026
+:copyright: Copyright (c) 2026 Jungmann Lab, MPI of Biochemistry
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import io
+
+
+# stage: (default fraction of the available CPUs, tasks per worker)
+STAGES = {
+    "identify": (0.8, 1),
+    "fit": (0.75, 100),
+    "zfit": (0.75, 100),
+    "average": (0.75, 1),
+    "postprocess": (0.75, 1),
+    "spinna": (0.75, 1),
+    "g5m": (0.35, 1),
+    "nanotron": (0.75, 1),
+    "toraw": (0.25, 1),
+}
+# ProcessPoolExecutor on Windows waits on at most 63 handles
+_MAX_PROCESS_WORKERS_WINDOWS = 61
+
+# calibration results, loaded from the user settings on first use
+_calibration = None
+_calibration_lock = threading.Lock()
+
+
+def available_cpus() -> int:
+    """Number of CPUs the current process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def _max_workers(processes: bool) -> int | None:
+    if processes and sys.platform == "win32":
+        return _MAX_PROCESS_WORKERS_WINDOWS
+    return None
+
+
+def _env_value(name: str, stage: str) -> float | None:
+    """Read ``<name>_<STAGE>`` or ``<name>`` from the environment."""
+    for key in (f"{name}_{stage.upper()}", name):
+        value = os.environ.get(key)
+        if value:
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(
+                    f"Environment variable {key} must be a number, got "
+                    f"{value!r}."
+                )
+            if value > 0:
+                return value
+    return None
+
+
+def _get_calibration() -> dict:
+    global _calibration
+    with _calibration_lock:
+        if _calibration is None:
+            settings = io.load_user_settings()
+            _calibration = dict(settings["Resources"] or {})
+            if _migrate_cpu_utilization(settings, _calibration):
+                settings["Resources"] = _calibration
+                io.save_user_settings(settings)
+        return _calibration
+
+
+def _migrate_cpu_utilization(settings: dict, calibration: dict) -> bool:
+    """Map the fraction of CPUs used for spot identification, stored as
+    ``cpu_utilization`` in the Localize user settings before v0.10.1,
+    to the number of identification workers. Returns whether the
+    settings were changed."""
+    if "cpu_utilization" not in settings["Localize"]:
+        return False
+    value = settings["Localize"].pop("cpu_utilization")
+    if (
+        isinstance(value, (int, float))
+        and 0 < value < 1
+        and "Workers" not in calibration.get("identify", {})
+    ):
+        calibration["identify"] = {
+            **calibration.get("identify", {}),
+            "Workers": float(value),
+        }
+    return True
+
+
+def _check_stage(stage: str) -> None:
+    if stage not in STAGES:
+        raise ValueError(
+            f"Unknown stage {stage!r}, choose from {list(STAGES)}."
+        )
+
+
+def n_workers(stage: str, processes: bool = True) -> int:
+    """Number of workers (processes or threads) to use in a parallel
+    stage, see the module docstring.
+
+    Parameters
+    ----------
+    stage : str
+        One of ``STAGES``, e.g., "identify" or "fit".
+    processes : bool, optional
+        Whether the workers are processes (True) or threads (False).
+        Default is True.
+
+    Returns
+    -------
+    n_workers : int
+        Number of workers, at least 1.
+    """
+    _check_stage(stage)
+    cpus = available_cpus()
+    value = _env_value("PICASSO_WORKERS", stage)
+    if value is None:
+        calibrated = _get_calibration().get(stage, {})
+        value = calibrated.get("Workers")
+    if value is None:
+        value = STAGES[stage][0]
+    if value <= 1 and not float(value).is_integer():
+        value = value * cpus  # fraction of the CPUs
+    n = max(1, int(value))
+    max_workers = _max_workers(processes)
+    if max_workers is not None:
+        n = min(n, max_workers)
+    return n
+
+
+def n_tasks(stage: str, n_workers: int) -> int:
+    """Number of tasks that the work of a stage is split into, given
+    the number of workers. More tasks balance the load better but add
+    scheduling overhead.
+
+    Parameters
+    ----------
+    stage : str
+        One of ``STAGES``.
+    n_workers : int
+        Number of workers, see ``n_workers``.
+
+    Returns
+    -------
+    n_tasks : int
+        Number of tasks, at least ``n_workers``.
+    """
+    _check_stage(stage)
+    per_worker = _env_value("PICASSO_TASKS_PER_WORKER", stage)
+    if per_worker is None:
+        calibrated = _get_calibration().get(stage, {})
+        per_worker = calibrated.get("Tasks per worker", STAGES[stage][1])
+    return max(1, int(per_worker)) * n_workers
+
+
+def _candidates(processes: bool) -> list[int]:
+    """Worker counts tried by ``autotune``: powers of two and the
+    number of available CPUs."""
+    cpus = available_cpus()
+    max_workers = _max_workers(processes) or cpus
+    candidates = {min(cpus, max_workers)}
+    n = 1
+    while n < min(cpus, max_workers):
+        candidates.add(n)
+        n *= 2
+    return sorted(candidates)
+
+
+def autotune(
+    stage: str,
+    benchmark: Callable[[int], None],
+    candidates: list[int] | None = None,
+    processes: bool = True,
+    tolerance: float = 0.05,
+    save: bool = True,
+) -> int:
+    """Choose the number of workers of a stage by timing a benchmark.
+
+    The benchmark is run once per candidate worker count (after a
+    warm-up run). The smallest worker count whose run time is within
+    ``tolerance`` of the fastest run is chosen, so that no cores are
+    occupied without a speed-up.
+
+    Parameters
+    ----------
+    stage : str
+        One of ``STAGES``.
+    benchmark : callable
+        Runs a representative, small workload with the given number of
+        workers.
+    candidates : list of ints, optional
+        Worker counts to be tested. Default is powers of two up to the
+        number of available CPUs.
+    processes : bool, optional
+        Whether the workers are processes (True) or threads (False).
+        Default is True.
+    tolerance : float, optional
+        Relative slow-down accepted in favor of fewer workers. Default
+        is 0.05.
+    save : bool, optional
+        Whether to store the result in the user settings. Default is
+        True.
+
+    Returns
+    -------
+    n_workers : int
+        The chosen number of workers.
+    """
+    _check_stage(stage)
+    if candidates is None:
+        candidates = _candidates(processes)
+    best = _fewest_within_tolerance(benchmark, candidates, tolerance)
+    _store_calibration(stage, "Workers", best, save)
+    return best
+
+
+def autotune_tasks(
+    stage: str,
+    benchmark: Callable[[int], None],
+    candidates: list[int] | None = None,
+    tolerance: float = 0.05,
+    save: bool = True,
+) -> int:
+    """Choose the number of tasks per worker of a stage (see
+    ``n_tasks``) by timing a benchmark, analogous to ``autotune``. The
+    smallest number of tasks per worker whose run time is within
+    ``tolerance`` of the fastest run is chosen, which minimizes the
+    scheduling overhead.
+
+    Parameters
+    ----------
+    stage : str
+        One of ``STAGES``.
+    benchmark : callable
+        Runs a representative, small workload split into the given
+        number of tasks per worker.
+    candidates : list of ints, optional
+        Numbers of tasks per worker to be tested. Default is 1, 4, 16,
+        64 and 256.
+    tolerance : float, optional
+        Relative slow-down accepted in favor of fewer tasks. Default is
+        0.05.
+    save : bool, optional
+        Whether to store the result in the user settings. Default is
+        True.
+
+    Returns
+    -------
+    tasks_per_worker : int
+        The chosen number of tasks per worker.
+    """
+    _check_stage(stage)
+    if candidates is None:
+        candidates = [1, 4, 16, 64, 256]
+    best = _fewest_within_tolerance(benchmark, candidates, tolerance)
+    _store_calibration(stage, "Tasks per worker", best, save)
+    return best
+
+
+def _fewest_within_tolerance(
+    benchmark: Callable[[int], None], candidates: list[int], tolerance: float
+) -> int:
+    """Time the benchmark for each candidate (after a warm-up run) and
+    return the smallest candidate within ``tolerance`` of the fastest
+    run."""
+    timings = {}
+    for n in candidates:
+        benchmark(n)  # warm-up, e.g., compilation or starting processes
+        t0 = time.perf_counter()
+        benchmark(n)
+        timings[n] = time.perf_counter() - t0
+    fastest = min(timings.values())
+    return min(n for n, t in timings.items() if t <= fastest * (1 + tolerance))
+
+
+def _store_calibration(stage: str, name: str, value: int, save: bool) -> None:
+    calibration = _get_calibration()
+    with _calibration_lock:
+        calibration[stage] = {**calibration.get(stage, {}), name: value}
+    if save:
+        settings = io.load_user_settings()
+        settings["Resources"] = calibration
+        io.save_user_settings(settings)
+
+
+def reset_calibration(save: bool = True) -> None:
+    """Discard the results of ``calibrate`` and ``autotune``, such
+    that the default worker counts are used again."""
+    global _calibration
+    with _calibration_lock:
+        _calibration = {}
+    if save:
+        settings = io.load_user_settings()
+        settings["Resources"] = {}
+        io.save_user_settings(settings)
+
+
+def calibrate(
+    stages: tuple[str, ...] = ("identify", "fit"),
+    save: bool = True,
+) -> dict[str, int]:
+    """Quick calibration run with synthetic data that chooses the
+    number of workers of spot identification (threads) and LQ fitting
+    (processes) on this machine, see ``autotune``, as well as the
+    number of tasks per fitting worker, see ``autotune_tasks``. Takes
+    up to a few minutes, depending on the number of cores. Available
+    from the command line as ``picasso calibrate``.
+
+    Parameters
+    ----------
+    stages : tuple of strs, optional
+        Stages to be calibrated, any of "identify" and "fit". Default
+        is both.
+    save : bool, optional
+        Whether to store the results in the user settings. Default is
+        True.
+
+    Returns
+    -------
+    calibration : dict
+        Chosen number of workers (and tasks per worker) per stage, see
+        ``n_workers`` and ``n_tasks``.
+    """
+    from . import gausslq, lib, localize
+
+    rng = np.random.default_rng(0)
+    result = {}
+    if "identify" in stages:
+        frames = rng.poisson(100, (256, 256, 256)).astype(np.uint16)
+        batch_size = localize._identify_batch_size(frames)
+
+        def identify(n):
+            with ThreadPoolExecutor(n) as executor:
+                list(
+                    executor.map(
+                        lambda i: localize._identify_in_frames(
+                            frames[i : i + batch_size], i, 5000, 7, None
+                        ),
+                        range(0, len(frames), batch_size),
+                    )
+                )
+
+        result["identify"] = {
+            "Workers": autotune(
+                "identify", identify, processes=False, save=save
+            )
+        }
+    if "fit" in stages:
+        spots = rng.poisson(100, (50_000, 7, 7)).astype(np.float32)
+        spots[:, 2:5, 2:5] += 500
+
+        def fit(n, tasks_per_worker=None):
+            if tasks_per_worker is None:
+                tasks = n_tasks("fit", n)
+            else:
+                tasks = n * tasks_per_worker
+            fs = lib.fit_spots_shared(gausslq.fit_spots, spots, 6, n, tasks)
+            gausslq.fits_from_futures(fs)
+
+        workers = autotune("fit", fit, processes=True, save=save)
+        tasks_per_worker = autotune_tasks(
+            "fit", lambda t: fit(workers, t), save=save
+        )
+        result["fit"] = {
+            "Workers": workers,
+            "Tasks per worker": tasks_per_worker,
+        }
+    return result
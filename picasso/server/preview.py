@@ -16,7 +16,8 @@ def load_file(path: str):
     Args:
         path (str): Path to file.
     """
-    locs, info = io.load_locs(path)
+    # only the columns needed for rendering, see picasso_render
+    locs, info = io.load_locs(path, columns=render.render_columns("smooth"))
     return locs, info
 
 
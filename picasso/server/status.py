@@ -1,6 +1,6 @@
 import streamlit as st
-from helper import fetch_db
-from picasso import localize
+from helper import fetch_db, fetch_watcher
+from picasso import io, localize
 import pandas as pd
 from sqlalchemy import create_engine
 import os
@@ -76,6 +76,46 @@ def status():  # noqa: C901
             )
             st.write("Database is empty.")
 
+    with st.expander("Acquisitions in progress"):
+        st.write(
+            "Movies that are localized online by a watcher while they are "
+            "being acquired (`Online localization`). The statistics are "
+            "updated with each refresh of this page."
+        )
+        in_progress = []
+        watchers = fetch_watcher()
+        folders = watchers["folder"].unique() if len(watchers) > 0 else []
+        for folder in folders:
+            if not os.path.isdir(folder):
+                continue
+            for file in os.listdir(folder):
+                file_hdf = os.path.join(folder, file)
+                # checkpoints of interrupted localizations (CLI option
+                # --checkpoint) are not acquisitions in progress
+                if file.endswith("_locs.hdf5") and io.is_locs_checkpoint(
+                    file_hdf, online=True
+                ):
+                    in_progress.append(file_hdf)
+        if len(in_progress) > 0:
+            for file_hdf in in_progress:
+                try:
+                    locs, info = io.load_locs(file_hdf)
+                except Exception:  # no frames localized yet
+                    st.write(f"{escape_markdown(file_hdf)}: starting.")
+                    continue
+                n_frames = info[0]["Frames"]
+                summary = {
+                    "Frames": n_frames,
+                    "Localizations": len(locs),
+                    "Locs/Frame": len(locs) / max(n_frames, 1),
+                }
+                if len(locs) > 0:
+                    summary["NeNA (px)"] = localize.check_nena(locs, info)
+                st.write(escape_markdown(file_hdf))
+                st.write(pd.DataFrame([summary]))
+        else:
+            st.write("None")
+
     with st.expander("Manually add file to database."):
         st.write(
             "Here, you can manually add files to the database."
@@ -14,6 +14,8 @@ from picasso.__main__ import _localize
 DEFAULT_UPDATE_TIME = 1
 
 FILETYPES = (".raw", ".ome.tif", ".ims")
+# file types that can be localized while they are being acquired
+ONLINE_FILETYPES = (".raw", ".ome.tif")
 
 
 class aclass:
@@ -156,6 +158,7 @@ def check_new_and_process(  # noqa: C901
     logfile: str,
     existing: list,
     update_time: int,
+    online: bool = False,
 ):
     """
     Checks a folder for new files and processes them with defined settigns.
@@ -166,6 +169,8 @@ def check_new_and_process(  # noqa: C901
         logfile (str): Path to logfile.
         existing (list): existing files
         update_time (int): Refresh every x minutes
+        online (bool): Localize files while they are being acquired
+            (first parameter group only).
     """
 
     print_to_file(logfile, f"{datetime.now()} Started watcher for {path}.")
@@ -182,10 +187,13 @@ def check_new_and_process(  # noqa: C901
         if len(new) > 0:
             file = os.path.abspath(new[0])
             print_to_file(logfile, f"{datetime.now()} New file {file}")
-            children = wait_for_completion(file)
-            print_to_file(logfile, f"{datetime.now()} Children {children}")
+            online_file = online and file.endswith(ONLINE_FILETYPES)
+            children = []
+            if not online_file:
+                children = wait_for_completion(file)
+                print_to_file(logfile, f"{datetime.now()} Children {children}")
             try:
-                for settings in settings_list:
+                for j, settings in enumerate(settings_list):
 
                     if len(settings_list) > 1:
                         print_to_file(
@@ -197,10 +205,18 @@ def check_new_and_process(  # noqa: C901
                         )
 
                     settings["files"] = file
+                    # the movie is complete after the first group
+                    settings["online"] = online_file and j == 0
 
                     args_ = aclass(**settings)
                     _localize(args_)
 
+                    if settings["online"]:
+                        children = wait_for_completion(file)
+                        print_to_file(
+                            logfile, f"{datetime.now()} Children {children}"
+                        )
+
                 if command != "":
 
                     if "$FILENAME" in command:
@@ -406,6 +422,15 @@ def watcher():  # noqa: C901
                 "Update time (scan every x-th minute):", DEFAULT_UPDATE_TIME
             )
 
+            online = st.checkbox(
+                "Online localization",
+                help=(
+                    f"Localize {ONLINE_FILETYPES} files while they are "
+                    "being acquired. Intermediate results are shown in "
+                    "the Status page."
+                ),
+            )
+
             logfile_dir = os.path.dirname(localize._db_filename())
             now_str = datetime.now().strftime("%Y-%m-%d %H_%M_%S")
             logfile = os.path.join(logfile_dir, f"{now_str}_watcher.log")
@@ -463,6 +488,7 @@ def watcher():  # noqa: C901
                         logfile,
                         existing,
                         update_time,
+                        online,
                     ),
                 )
                 p.start()
@@ -16,7 +16,6 @@ import time
 import warnings
 from typing import Literal
 from concurrent import futures
-from multiprocessing import cpu_count
 from itertools import product as it_prod
 from copy import deepcopy
 from numbers import Number
@@ -35,7 +34,7 @@ from sklearn.gaussian_process.kernels import Matern
 from sklearn.exceptions import ConvergenceWarning
 from tqdm import tqdm
 
-from . import io, lib, masking, render, __version__
+from . import io, lib, masking, render, resources, __version__
 
 
 NN_COLORS = ["#2880C4", "#97D8C4", "#F4B942", "#363636"]
@@ -3295,9 +3294,7 @@ class SPINNA:
             Contain the scoring for each combination of structures
         """
         # get number of threads and tasks
-        n_workers = min(
-            60, max(1, int(0.75 * cpu_count()))
-        )  # Python crashes when using >64 cores
+        n_workers = resources.n_workers("spinna")
 
         # split N_structures into groups that are tested by each Process
         # separately
@@ -3308,7 +3305,9 @@ class SPINNA:
         ]
         start_indices = np.cumsum([0] + structures_per_task[:-1])
         fs = []
-        executor = futures.ProcessPoolExecutor(n_workers)
+        executor = futures.ProcessPoolExecutor(
+            n_workers, mp_context=lib.process_pool_context()
+        )
         # call NN_scorer for each group of N_structures
         for i, n_neighbors_task in zip(start_indices, structures_per_task):
             fs.append(
@@ -11,8 +11,6 @@ Fitting z coordinates using astigmatism.
 from __future__ import annotations
 
 import os
-import multiprocessing
-import time
 from concurrent import futures
 from concurrent.futures import ProcessPoolExecutor
 from typing import Callable, Literal
@@ -23,9 +21,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from tqdm import tqdm
-from scipy.optimize import minimize_scalar
 
-from . import lib, gausslq, gaussmle, __version__
+from . import lib, gausslq, gaussmle, resources, __version__
 
 
 plt.style.use("ggplot")
@@ -269,6 +266,127 @@ def _fit_z_target(
     return (sx**0.5 - wx**0.5) ** 2 + (sy**0.5 - wy**0.5) ** 2
 
 
+# The z coordinate is searched within +/- _Z_BOUND (nm) on a grid with
+# spacing _Z_GRID_STEP (nm) and refined by golden-section search
+# within +/- one grid step around the best grid point.
+_Z_BOUND = 1000.0
+_Z_GRID_STEP = 5.0
+_Z_REFINE_ITERATIONS = 40
+_GOLDEN_RATIO = 0.5 * (np.sqrt(5.0) - 1.0)
+# number of localizations fitted between progress updates
+_Z_BLOCK_SIZE = 100_000
+
+
+def _calibration_lut(
+    cx: lib.FloatArray1D, cy: lib.FloatArray1D
+) -> tuple[lib.FloatArray1D, lib.FloatArray1D, lib.FloatArray1D]:
+    """Tabulate the square root of the calibration curves (spot width
+    and height) on a dense grid of z values. Negative widths are set to
+    NaN and are never chosen."""
+    n_steps = int(round(2 * _Z_BOUND / _Z_GRID_STEP))
+    z_grid = np.linspace(-_Z_BOUND, _Z_BOUND, n_steps + 1)
+    wx = np.polyval(cx, z_grid)
+    wy = np.polyval(cy, z_grid)
+    sqrt_wx = np.sqrt(np.where(wx >= 0, wx, np.nan))
+    sqrt_wy = np.sqrt(np.where(wy >= 0, wy, np.nan))
+    return z_grid, sqrt_wx, sqrt_wy
+
+
+@numba.jit(nopython=True, nogil=True)
+def _fit_z_single(
+    sx: float,
+    sy: float,
+    cx: lib.FloatArray1D,
+    cy: lib.FloatArray1D,
+    z_grid: lib.FloatArray1D,
+    sqrt_wx: lib.FloatArray1D,
+    sqrt_wy: lib.FloatArray1D,
+) -> tuple[float, float]:
+    """Fit the z coordinate of a single localization: nearest point of
+    the tabulated calibration curve followed by golden-section search
+    of ``_fit_z_target``. Returns z and the value of the target."""
+    sqrt_sx = sx**0.5
+    sqrt_sy = sy**0.5
+    best = np.inf
+    j_best = -1
+    for j in range(len(z_grid)):
+        d = (sqrt_sx - sqrt_wx[j]) ** 2 + (sqrt_sy - sqrt_wy[j]) ** 2
+        if d < best:  # False for NaN
+            best = d
+            j_best = j
+    if j_best < 0:
+        return np.nan, np.nan
+    z_best = z_grid[j_best]
+    step = z_grid[1] - z_grid[0]
+    lo = max(z_grid[0], z_best - step)
+    hi = min(z_grid[-1], z_best + step)
+    c = hi - _GOLDEN_RATIO * (hi - lo)
+    d = lo + _GOLDEN_RATIO * (hi - lo)
+    fc = _fit_z_target(c, sx, sy, cx, cy)
+    fd = _fit_z_target(d, sx, sy, cx, cy)
+    for _ in range(_Z_REFINE_ITERATIONS):
+        if fc < fd:
+            hi = d
+            d = c
+            fd = fc
+            c = hi - _GOLDEN_RATIO * (hi - lo)
+            fc = _fit_z_target(c, sx, sy, cx, cy)
+        else:
+            lo = c
+            c = d
+            fc = fd
+            d = lo + _GOLDEN_RATIO * (hi - lo)
+            fd = _fit_z_target(d, sx, sy, cx, cy)
+    z = 0.5 * (lo + hi)
+    f = _fit_z_target(z, sx, sy, cx, cy)
+    if f <= best:
+        return z, f
+    return z_best, best
+
+
+@numba.jit(nopython=True, nogil=True)
+def _fit_z_batch(
+    sx: lib.FloatArray1D,
+    sy: lib.FloatArray1D,
+    cx: lib.FloatArray1D,
+    cy: lib.FloatArray1D,
+    z_grid: lib.FloatArray1D,
+    sqrt_wx: lib.FloatArray1D,
+    sqrt_wy: lib.FloatArray1D,
+) -> tuple[lib.FloatArray1D, lib.FloatArray1D]:
+    """Fit z coordinates of many localizations, see
+    ``_fit_z_single``."""
+    N = len(sx)
+    z = np.empty(N, dtype=np.float64)
+    fun = np.empty(N, dtype=np.float64)
+    for i in range(N):
+        z[i], fun[i] = _fit_z_single(
+            sx[i], sy[i], cx, cy, z_grid, sqrt_wx, sqrt_wy
+        )
+    return z, fun
+
+
+@numba.njit(parallel=True, nogil=True)
+def _fit_z_batch_parallel(
+    sx: lib.FloatArray1D,
+    sy: lib.FloatArray1D,
+    cx: lib.FloatArray1D,
+    cy: lib.FloatArray1D,
+    z_grid: lib.FloatArray1D,
+    sqrt_wx: lib.FloatArray1D,
+    sqrt_wy: lib.FloatArray1D,
+) -> tuple[lib.FloatArray1D, lib.FloatArray1D]:
+    """Multithreaded version of ``_fit_z_batch``."""
+    N = len(sx)
+    z = np.empty(N, dtype=np.float64)
+    fun = np.empty(N, dtype=np.float64)
+    for i in numba.prange(N):
+        z[i], fun[i] = _fit_z_single(
+            sx[i], sy[i], cx, cy, z_grid, sqrt_wx, sqrt_wy
+        )
+    return z, fun
+
+
 def fit_z(  # TODO: remove in v0.11.0
     locs: pd.DataFrame,
     info: list[dict],
@@ -313,37 +431,95 @@ def _fit_z(
     progress_callback: (
         Callable[[int], None] | Literal["console"] | None
     ) = None,
-) -> pd.DataFrame:
+    threaded: bool = False,
+    abort_callback: Callable[[], bool] | None = None,
+) -> pd.DataFrame | None:
     """Internal function for fitting z coordinates to the localizations.
-    See `zfit` for details."""
-    locs = locs.copy()
-    cx = np.array(calibration["X Coefficients"])
-    cy = np.array(calibration["Y Coefficients"])
+    See `zfit` for details. If ``threaded``, all cores are used.
+    Returns None if aborted."""
+    locs = _add_z(
+        locs.copy(),
+        _prepare_calibration(calibration),
+        magnification_factor,
+        pixelsize,
+        fitting_method,
+        threaded,
+        progress_callback,
+        abort_callback,
+    )
+    if locs is None:
+        return None
+    locs = lib.ensure_sanity(locs, info)
+    return filter_z_fits(locs, filter)
+
+
+def _prepare_calibration(
+    calibration: dict,
+) -> tuple[
+    lib.FloatArray1D,
+    lib.FloatArray1D,
+    lib.FloatArray1D,
+    lib.FloatArray1D,
+    lib.FloatArray1D,
+]:
+    """Calibration curve coefficients and their tabulated square roots
+    (see ``_calibration_lut``), computed once per calibration."""
+    cx = np.array(calibration["X Coefficients"], dtype=np.float64)
+    cy = np.array(calibration["Y Coefficients"], dtype=np.float64)
+    # set bounds to avoid potential gaps in the calibration curve,
+    # credits to Loek Andriessen
+    z_grid, sqrt_wx, sqrt_wy = _calibration_lut(cx, cy)
+    return cx, cy, z_grid, sqrt_wx, sqrt_wy
+
+
+def _add_z(
+    locs: pd.DataFrame,
+    prepared_calibration: tuple[lib.FloatArray1D, ...],
+    magnification_factor: float,
+    pixelsize: float,
+    fitting_method: Literal["gausslq", "gaussmle"],
+    threaded: bool = False,
+    progress_callback: (
+        Callable[[int], None] | Literal["console"] | None
+    ) = None,
+    abort_callback: Callable[[], bool] | None = None,
+) -> pd.DataFrame | None:
+    """Add the columns z, d_zcalib and lpz to ``locs`` (in place),
+    given the output of ``_prepare_calibration``. Neither filters the
+    localizations nor checks their sanity. Returns None if aborted."""
+    cx, cy, z_grid, sqrt_wx, sqrt_wy = prepared_calibration
     # in multiprocessing, pandas Series causes issues!
-    sx = locs["sx"].to_numpy()
-    sy = locs["sy"].to_numpy()
-    z = np.zeros_like(locs["x"])
-    square_d_zcalib = np.zeros_like(z)
+    sx = locs["sx"].to_numpy(dtype=np.float64)
+    sy = locs["sy"].to_numpy(dtype=np.float64)
+    N = len(sx)
+    z = np.zeros(N, dtype=np.float64)
+    square_d_zcalib = np.zeros(N, dtype=np.float64)
+    fit_batch = _fit_z_batch_parallel if threaded else _fit_z_batch
 
     use_tqdm = progress_callback == "console"
     if use_tqdm:
-        iter_range = tqdm(range(len(z)), desc="Fitting z...", unit="locs")
-    else:
-        iter_range = range(len(z))
-
-    for i in iter_range:
-        # set bounds to avoid potential gaps in the calibration curve,
-        # credits to Loek Andriessen
-        result = minimize_scalar(
-            _fit_z_target,
-            bounds=[-1000, 1000],
-            args=(sx[i], sy[i], cx, cy),
+        iter_range = tqdm(total=N, desc="Fitting z...", unit="locs")
+    for start in range(0, N, _Z_BLOCK_SIZE):
+        if abort_callback is not None and abort_callback():
+            if use_tqdm:
+                iter_range.close()
+            return None
+        stop = min(start + _Z_BLOCK_SIZE, N)
+        z[start:stop], square_d_zcalib[start:stop] = fit_batch(
+            sx[start:stop],
+            sy[start:stop],
+            cx,
+            cy,
+            z_grid,
+            sqrt_wx,
+            sqrt_wy,
         )
-        z[i] = result.x
-        square_d_zcalib[i] = result.fun
-
-        if callable(progress_callback):
-            progress_callback(i)
+        if use_tqdm:
+            iter_range.update(stop - start)
+        elif callable(progress_callback):
+            progress_callback(stop)
+    if use_tqdm:
+        iter_range.close()
 
     locs["z"] = z * magnification_factor
     locs["d_zcalib"] = np.sqrt(square_d_zcalib)
@@ -356,8 +532,43 @@ def _fit_z(
         fitting_method,
     )
     locs["lpz"] = lpz
-    locs = lib.ensure_sanity(locs, info)
-    return filter_z_fits(locs, filter)
+    return locs
+
+
+def _z_fitter(
+    calibration: dict,
+    pixelsize: float,
+    fitting_method: Literal["gausslq", "gaussmle"],
+    threaded: bool,
+) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a function that adds z, d_zcalib and lpz to a block of
+    2D localizations, e.g., to each chunk of a movie right after its 2D
+    fit. The calibration is tabulated only once. Localizations are
+    neither filtered nor checked for sanity, see ``_fit_z``."""
+    prepared_calibration = _prepare_calibration(calibration)
+    magnification_factor = calibration["Magnification factor"]
+
+    def fit_z(locs: pd.DataFrame) -> pd.DataFrame:
+        return _add_z(
+            locs,
+            prepared_calibration,
+            magnification_factor,
+            pixelsize,
+            fitting_method,
+            threaded,
+        )
+
+    return fit_z
+
+
+def _zfit_info(calibration: dict, filter: int) -> dict:
+    """Metadata of z fitting, see ``zfit``."""
+    new_info = {
+        "Generated by": f"Picasso v{__version__} Fit 3D",
+        "Calibration path": calibration.get("Path", "N/A"),
+        "Filter range": filter,
+    }
+    return new_info | calibration
 
 
 def fit_z_parallel(  # TODO: remove in v0.11.0
@@ -403,11 +614,9 @@ def _fit_z_parallel(
 ) -> pd.DataFrame | list[futures.Future]:
     """Internal function for fitting z coordinates to the localizations
     using multiprocessing. See `zfit` for details."""
-    n_workers = min(
-        60, max(1, int(0.75 * multiprocessing.cpu_count()))
-    )  # Python crashes when using >64 cores
+    n_workers = resources.n_workers("zfit")
     n_locs = len(locs)
-    n_tasks = 100 * n_workers
+    n_tasks = resources.n_tasks("zfit", n_workers)
     spots_per_task = [
         (
             int(n_locs / n_tasks + 1)
@@ -418,7 +627,9 @@ def _fit_z_parallel(
     ]
     start_indices = np.cumsum([0] + spots_per_task[:-1])
     fs = []
-    executor = ProcessPoolExecutor(n_workers)
+    executor = ProcessPoolExecutor(
+        n_workers, mp_context=lib.process_pool_context()
+    )
     for i, n_locs_task in zip(start_indices, spots_per_task):
         fs.append(
             executor.submit(
@@ -460,6 +671,15 @@ def zfit(
     Replaces `fit_z` (which will become a private function) and
     `fit_z_parallel` in v0.11.0.
 
+    Since v0.10.1, z is found for all localizations at once by looking
+    up the nearest point of the calibration curve tabulated every 5 nm
+    between -1000 and 1000 nm, followed by golden-section refinement,
+    instead of calling ``scipy.optimize.minimize_scalar`` per
+    localization. ``z`` agrees with the previous implementation within
+    0.01 nm (``d_zcalib`` within 1e-6) whenever the latter found the
+    global minimum of the target function; otherwise, the new
+    estimate has the lower ``d_zcalib``.
+
     Parameters
     ----------
     locs : pd.DataFrame
@@ -499,8 +719,8 @@ def zfit(
         If set to 2, the z fits are filtered based on the root mean
         square deviation (RMSD) of the z calibration. Default is 2.
     multiprocess : bool, optional
-        Whether to use multiprocessing for fitting the z coordinates.
-        Default is False.
+        Whether to use all CPU cores for fitting the z coordinates
+        (multithreading since v0.10.1). Default is False.
     progress_callback : callable, "console", or None, optional
         If a callable is provided, it will be called with the current
         progress (number of localizations processed) as an argument. If
@@ -572,54 +792,23 @@ def _zfit(
     """Internal function for fitting z coordinates to the localizations.
     See `zfit` for details."""
     pixelsize = lib.get_from_metadata(info, "Pixelsize", raise_error=True)
-    N = len(locs)
-    if multiprocess:
-        use_tqdm = progress_callback == "console"
-        if use_tqdm:
-            iter_range = tqdm(range(N), desc="Fitting z...", unit="locs")
-
-        fs = _fit_z_parallel(
-            locs=locs,
-            info=info,
-            calibration=calibration,
-            magnification_factor=calibration["Magnification factor"],
-            pixelsize=pixelsize,
-            fitting_method=fitting_method,
-            filter=0,  # will be applied later
-            asynch=True,
-        )
-        n_tasks = len(fs)
-        while lib.n_futures_done(fs) < n_tasks:
-            # check for abort
-            if abort_callback is not None and abort_callback():
-                for f in fs:
-                    f.cancel()
-                return None, None
-
-            n_finished = round(N * lib.n_futures_done(fs) / n_tasks)
-            if use_tqdm:
-                iter_range.update(n_finished - iter_range.n)
-            elif callable(progress_callback):
-                progress_callback(n_finished)
-            time.sleep(0.2)
-        locs = locs_from_futures(fs, filter=filter)
-    else:
-        locs = _fit_z(
-            locs=locs,
-            info=info,
-            calibration=calibration,
-            magnification_factor=calibration["Magnification factor"],
-            pixelsize=pixelsize,
-            fitting_method=fitting_method,
-            filter=filter,
-            progress_callback=progress_callback,
-        )
-    new_info = {
-        "Generated by": f"Picasso v{__version__} Fit 3D",
-        "Calibration path": calibration.get("Path", "N/A"),
-        "Filter range": filter,
-    }
-    new_info = info + [new_info | calibration]
+    # the batched z fit is multithreaded, such that no worker processes
+    # need to be started
+    locs = _fit_z(
+        locs=locs,
+        info=info,
+        calibration=calibration,
+        magnification_factor=calibration["Magnification factor"],
+        pixelsize=pixelsize,
+        fitting_method=fitting_method,
+        filter=filter,
+        progress_callback=progress_callback,
+        threaded=multiprocess,
+        abort_callback=abort_callback,
+    )
+    if locs is None:
+        return None, None
+    new_info = info + [_zfit_info(calibration, filter)]
     return locs, new_info
 
 
@@ -14,7 +14,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from picasso import gausslq
+from picasso import gausslq, lib
 
 from tests.conftest import BOX
 
@@ -117,6 +117,60 @@ class TestFitSpots:
         assert calls == list(range(len(spots)))
 
 
+# ---------------------------------------------------------------------------
+# fit_spots_batch — compiled Levenberg-Marquardt solver
+# ---------------------------------------------------------------------------
+
+
+class TestFitSpotsBatch:
+    """The compiled batch solver must agree with ``fit_spots``."""
+
+    def test_shape_dtype_finite(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        theta = gausslq.fit_spots_batch(spots)
+        assert theta.shape == (len(spots), 6)
+        assert theta.dtype == np.float32
+        assert np.all(np.isfinite(theta))
+
+    def test_recovers_ground_truth(self, synthetic_spots):
+        spots, gt = synthetic_spots
+        theta = gausslq.fit_spots_batch(spots)
+        np.testing.assert_allclose(theta[:, 0], gt.x.values, atol=0.05)
+        np.testing.assert_allclose(theta[:, 1], gt.y.values, atol=0.05)
+        np.testing.assert_allclose(theta[:, 2], gt.photons.values, rtol=0.02)
+        np.testing.assert_allclose(theta[:, 3], gt.bg.values, rtol=0.10)
+        np.testing.assert_allclose(theta[:, 4], gt.sx.values, atol=0.03)
+        np.testing.assert_allclose(theta[:, 5], gt.sy.values, atol=0.03)
+
+    def test_matches_fit_spots_on_noisy_spots(self, synthetic_spots_noisy):
+        spots, _ = synthetic_spots_noisy
+        theta = gausslq.fit_spots(spots)
+        theta_batch = gausslq.fit_spots_batch(spots)
+        # leastsq stops at a relative change of 1e-2
+        np.testing.assert_allclose(theta_batch[:, :2], theta[:, :2], atol=1e-2)
+        np.testing.assert_allclose(theta_batch[:, 2], theta[:, 2], rtol=1e-2)
+        np.testing.assert_allclose(theta_batch[:, 3], theta[:, 3], atol=1.0)
+        np.testing.assert_allclose(theta_batch[:, 4:], theta[:, 4:], rtol=1e-2)
+
+    def test_block_size_does_not_change_result(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        theta = gausslq.fit_spots_batch(spots)
+        theta_blocks = gausslq.fit_spots_batch(spots, block_size=10)
+        np.testing.assert_array_equal(theta, theta_blocks)
+
+    def test_progress_callback_per_block(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        calls = []
+        gausslq.fit_spots_batch(
+            spots, block_size=10, progress_callback=calls.append
+        )
+        assert calls == list(range(10, len(spots), 10)) + [len(spots)]
+
+    def test_empty_input(self):
+        theta = gausslq.fit_spots_batch(np.zeros((0, BOX, BOX), np.float32))
+        assert theta.shape == (0, 6)
+
+
 # ---------------------------------------------------------------------------
 # fit_spots_parallel + fits_from_futures
 # ---------------------------------------------------------------------------
@@ -145,6 +199,24 @@ class TestFitSpotsParallel:
         assert collated.shape == serial.shape
         np.testing.assert_allclose(collated, serial, rtol=1e-4, atol=1e-4)
 
+    def test_process_pool_reused_between_calls(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        gausslq.fit_spots_parallel(spots, asynch=False)
+        pool = lib._process_pool
+        gausslq.fit_spots_parallel(spots, asynch=False)
+        assert lib._process_pool is pool
+
+    def test_process_pool_does_not_fork(self, synthetic_spots):
+        """Forked workers hang once numba's thread pool is running."""
+        spots, _ = synthetic_spots
+        gausslq.fit_spots_batch(spots)  # parallel numba kernel
+        fs = gausslq.fit_spots_parallel(spots, asynch=True)
+        collated = gausslq.fits_from_futures(fs)
+        np.testing.assert_allclose(
+            collated, gausslq.fit_spots(spots), rtol=1e-4, atol=1e-4
+        )
+        assert lib._process_pool._mp_context.get_start_method() != "fork"
+
 
 # ---------------------------------------------------------------------------
 # locs_from_fits
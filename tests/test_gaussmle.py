@@ -14,6 +14,8 @@ not 0). ``locs_from_fits`` later subtracts ``box//2``.
 
 from __future__ import annotations
 
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -114,8 +116,11 @@ class TestGaussmle:
         np.testing.assert_allclose(theta[:, 2], gt.photons.values, rtol=0.10)
         np.testing.assert_allclose(theta[:, 4], gt.sx.values, atol=0.10)
 
-    def test_progress_callback_invoked(self, synthetic_spots):
+    def test_progress_callback_invoked(self, synthetic_spots, monkeypatch):
+        """The callback receives the number of spots fitted so far after
+        each block of spots."""
         spots, _ = synthetic_spots
+        monkeypatch.setattr(gaussmle, "_MLE_PROGRESS_STEP", 24)
         calls = []
         gaussmle.gaussmle(
             spots,
@@ -124,7 +129,7 @@ class TestGaussmle:
             method="sigmaxy",
             progress_callback=calls.append,
         )
-        assert calls == list(range(len(spots)))
+        assert calls == list(range(24, len(spots), 24)) + [len(spots)]
 
     def test_looser_eps_fewer_iterations_on_average(
         self, synthetic_spots_noisy
@@ -174,12 +179,364 @@ class TestGaussmleAsync:
         np.testing.assert_allclose(theta_async, theta_serial, atol=1e-3)
         assert np.all(np.isfinite(crlbs))
 
+    def test_current_counts_finished_fits(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        current, _, crlbs, _, its = gaussmle.gaussmle_async(
+            spots, EPS, MAX_IT, method="sigma"
+        )
+        self._wait_until_done(current, len(spots))
+        # all blocks are claimed once and written before being counted
+        assert current[0] == len(spots)
+        assert np.all(its > 0)
+        assert np.all(np.isfinite(crlbs[:, :5]))
+
+    def test_progress_callback_reports_fitted_spots(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        progress = []
+        gaussmle.gaussmle(
+            spots,
+            EPS,
+            MAX_IT,
+            method="sigmaxy",
+            progress_callback=progress.append,
+        )
+        assert progress[-1] == len(spots)
+        assert progress == sorted(progress)
+
     def test_invalid_method_raises_async(self, synthetic_spots):
         spots, _ = synthetic_spots
         with pytest.raises(ValueError):
             gaussmle.gaussmle_async(spots, EPS, MAX_IT, method="bogus")
 
 
+# ---------------------------------------------------------------------------
+# Warm start and iteration statistics
+# ---------------------------------------------------------------------------
+
+
+def assert_same_fit(theta, expected):
+    """With ``converge_all``, positions and sigmas converge to ``EPS``
+    pixels, photons and background to ``EPS`` relative change per
+    iteration, so two fits of the same spot from different starts agree
+    to a few times that."""
+    for i in (0, 1, 4, 5):
+        np.testing.assert_allclose(theta[:, i], expected[:, i], atol=1e-2)
+    for i in (2, 3):
+        np.testing.assert_allclose(
+            theta[:, i], expected[:, i], rtol=5 * EPS, atol=1e-2
+        )
+
+
+class TestWarmStart:
+    """Starting MLE from given parameters or from the previous frame."""
+
+    def test_start_from_converged_fit(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        kwargs = dict(method="sigmaxy", converge_all=True)
+        theta, _, _, its = gaussmle.gaussmle(spots, EPS, MAX_IT, **kwargs)
+        theta_warm, _, _, its_warm = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, init_thetas=theta, **kwargs
+        )
+        assert_same_fit(theta_warm, theta)
+        assert its_warm.mean() < its.mean()
+
+    def test_implausible_rows_use_default_start(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        theta, _, _, its = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method="sigma"
+        )
+        init = np.full((len(spots), 6), np.nan, dtype=np.float32)
+        init[::2] = [100.0, 100.0, 1000.0, 10.0, 1.0, 1.0]  # outside box
+        theta_warm, _, _, its_warm = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method="sigma", init_thetas=init
+        )
+        np.testing.assert_array_equal(theta_warm, theta)
+        np.testing.assert_array_equal(its_warm, its)
+
+    def test_init_thetas_shape_is_checked(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        with pytest.raises(ValueError, match="init_thetas"):
+            gaussmle.gaussmle(spots, EPS, MAX_IT, init_thetas=np.zeros((1, 6)))
+
+    def test_previous_frame_spots(self):
+        identifications = pd.DataFrame(
+            {
+                "frame": [0, 0, 1, 1, 2, 4],
+                "x": [5, 9, 5, 8, 5, 5],
+                "y": [5, 9, 5, 9, 5, 5],
+            }
+        )
+        previous = gaussmle.previous_frame_spots(identifications)
+        np.testing.assert_array_equal(previous, [-1, -1, 0, -1, 2, -1])
+
+    def test_fit_order_keeps_linked_spots_together(self):
+        previous = np.array([-1, -1, 0, 1, 2, -1])
+        order = gaussmle._fit_order(previous)
+        np.testing.assert_array_equal(order, [0, 2, 4, 1, 3, 5])
+
+    def test_start_from_previous_frame(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        # the same molecule in consecutive frames
+        repeated = np.repeat(spots[:8], 4, axis=0)
+        previous = np.arange(-1, len(repeated) - 1)
+        previous[::4] = -1
+        kwargs = dict(method="sigmaxy", converge_all=True)
+        theta, _, _, its = gaussmle.gaussmle(repeated, EPS, MAX_IT, **kwargs)
+        theta_warm, _, _, its_warm = gaussmle.gaussmle(
+            repeated, EPS, MAX_IT, previous=previous, **kwargs
+        )
+        assert_same_fit(theta_warm, theta)
+        # only the first frame of each event starts from scratch
+        np.testing.assert_array_equal(its_warm[::4], its[::4])
+        assert its_warm.sum() < its.sum()
+
+
+class TestCameraVariance:
+    """Per-pixel sCMOS read noise (Huang, et al. 2013)."""
+
+    def test_zero_variance_matches_default(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        expected = gaussmle.gaussmle(spots, EPS, MAX_IT, method="sigmaxy")
+        result = gaussmle.gaussmle(
+            spots,
+            EPS,
+            MAX_IT,
+            method="sigmaxy",
+            variances=np.zeros_like(spots),
+        )
+        for a, b in zip(result, expected):
+            np.testing.assert_array_equal(a, b)
+
+    @pytest.mark.parametrize("method", ["sigma", "sigmaxy"])
+    def test_variance_keeps_fit_and_widens_crlb(self, synthetic_spots, method):
+        spots, gt = synthetic_spots
+        rng = np.random.default_rng(0)
+        variances = rng.uniform(1.0, 50.0, spots.shape).astype(np.float32)
+        theta, crlbs, _, _ = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method=method
+        )
+        theta_var, crlbs_var, _, _ = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method=method, variances=variances
+        )
+        # noiseless spots: the model is exact at the ground truth
+        np.testing.assert_allclose(
+            theta_var[:, 0] - BOX_HALF, gt.x.values, atol=0.05
+        )
+        np.testing.assert_allclose(
+            theta_var[:, 1] - BOX_HALF, gt.y.values, atol=0.05
+        )
+        assert np.all(crlbs_var[:, 0] > crlbs[:, 0])
+
+    def test_shape_is_checked(self, synthetic_spots):
+        spots, _ = synthetic_spots
+        with pytest.raises(ValueError, match="variances"):
+            gaussmle.gaussmle(
+                spots, EPS, MAX_IT, variances=np.zeros((1, BOX, BOX))
+            )
+
+
+class TestGaussmleMulti:
+    """Fitting several emitters per spot with model selection."""
+
+    BOX = 11
+
+    @pytest.fixture
+    def make_spot(self, synthetic_spot_factory):
+        """Spot with emitters at the given positions (relative to the
+        box center)."""
+
+        def _make_spot(positions, photons=4000.0, bg=10.0, sigma=1.2):
+            spot = np.full((self.BOX, self.BOX), bg, dtype=np.float32)
+            for x, y in positions:
+                spot += synthetic_spot_factory(
+                    self.BOX, x, y, sigma, sigma, photons, 0.0
+                )
+            return spot
+
+        return _make_spot
+
+    def test_single_emitter(self, make_spot):
+        spots = make_spot([(0.3, -0.2)])[np.newaxis]
+        thetas, _, _, _, n_emitters = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT
+        )
+        assert n_emitters[0] == 1
+        half = self.BOX // 2
+        np.testing.assert_allclose(
+            thetas[0, 0, :2] - half, [0.3, -0.2], atol=0.05
+        )
+        assert np.isnan(thetas[0, 1:]).all()
+
+    def test_two_overlapping_emitters(self, make_spot):
+        truth = [(-1.5, 0.5), (1.8, -0.7)]
+        spots = make_spot(truth)[np.newaxis]
+        thetas, crlbs, _, _, n_emitters, converged = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT, return_converged=True
+        )
+        assert n_emitters[0] == 2
+        assert converged[0]
+        *_, n_emitters_all, converged_all = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT, converge_all=True, return_converged=True
+        )
+        assert n_emitters_all[0] == 2
+        assert converged_all[0]
+        half = self.BOX // 2
+        found = thetas[0, :2, :2] - half
+        found = found[np.argsort(found[:, 0])]
+        np.testing.assert_allclose(found, truth, atol=0.1)
+        assert np.all(crlbs[0, :2] > 0)
+
+    def test_parallel_matches_serial(self, make_spot):
+        spots = np.stack(
+            [make_spot([(0.0, 0.0)]), make_spot([(-2.0, 0.0), (2.0, 1.0)])]
+        )
+        serial = gaussmle.gaussmle_multi(spots, EPS, MAX_IT, parallel=False)
+        parallel = gaussmle.gaussmle_multi(spots, EPS, MAX_IT)
+        for a, b in zip(serial, parallel):
+            np.testing.assert_array_equal(a, b)
+
+    def test_variance(self, make_spot):
+        spots = np.stack(
+            [make_spot([(0.3, -0.2)]), make_spot([(-1.5, 0.5), (1.8, -0.7)])]
+        )
+        variances = np.full_like(spots, 30.0)
+        thetas, crlbs, _, _, n_emitters = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT
+        )
+        thetas_var, crlbs_var, _, _, n_emitters_var = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT, variances=variances
+        )
+        np.testing.assert_array_equal(n_emitters_var, n_emitters)
+        np.testing.assert_allclose(
+            thetas_var[0, 0, :2], thetas[0, 0, :2], atol=0.05
+        )
+        assert crlbs_var[0, 0, 0] > crlbs[0, 0, 0]
+        with pytest.raises(ValueError, match="variances"):
+            gaussmle.gaussmle_multi(
+                spots, EPS, MAX_IT, variances=variances[:1]
+            )
+
+    def test_abort_between_blocks(self, make_spot, monkeypatch):
+        monkeypatch.setattr(gaussmle, "_MULTI_BLOCK_SIZE", 2)
+        spots = np.stack([make_spot([(0.0, 0.0)])] * 5)
+        calls = []
+
+        def abort():
+            calls.append(None)
+            return len(calls) > 1
+
+        thetas, _, _, _, n_emitters = gaussmle.gaussmle_multi(
+            spots, EPS, MAX_IT, abort_callback=abort
+        )
+        np.testing.assert_array_equal(n_emitters, [1, 1, 0, 0, 0])
+        assert np.isnan(thetas[2:]).all()
+
+    def test_locs_keep_emitters_in_nearest_box(self, make_spot):
+        # two emitters, each identified and fitted in its own box
+        spots = np.stack(
+            [
+                make_spot([(0.0, 0.0), (2.0, 0.0)]),
+                make_spot([(-2.0, 0.0), (0.0, 0.0)]),
+            ]
+        )
+        identifications = pd.DataFrame(
+            {
+                "frame": [0, 0],
+                "x": [20, 22],
+                "y": [30, 30],
+                "net_gradient": [1000.0, 1000.0],
+            }
+        )
+        results = gaussmle.gaussmle_multi(spots, EPS, MAX_IT)
+        locs = gaussmle.locs_from_multi_fits(
+            identifications, *results, self.BOX
+        )
+        single = gaussmle.locs_from_fits(
+            identifications,
+            results[0][:, 0],
+            results[1][:, 0],
+            results[2],
+            results[3],
+            self.BOX,
+        )
+        assert list(locs.columns) == list(single.columns) + ["n_emitters"]
+        assert len(locs) == 2
+        np.testing.assert_allclose(
+            np.sort(locs["x"].to_numpy()), [20.0, 22.0], atol=0.1
+        )
+
+    def test_invalid_max_emitters(self):
+        with pytest.raises(ValueError, match="max_emitters"):
+            gaussmle.gaussmle_multi(
+                np.zeros((1, 7, 7)), EPS, MAX_IT, max_emitters=0
+            )
+
+    @pytest.mark.slow
+    def test_throughput(self, make_spot, record_property):
+        rng = np.random.default_rng(0)
+        spots = np.stack(
+            [
+                make_spot(rng.uniform(-2.5, 2.5, (n, 2)))
+                for n in rng.integers(1, 3, 2000)
+            ]
+        )
+        spots = rng.poisson(spots).astype(np.float32)
+        gaussmle.gaussmle_multi(spots[:10], EPS, 100)  # compile
+        t0 = time.perf_counter()
+        *_, n_emitters = gaussmle.gaussmle_multi(spots, EPS, 100)
+        throughput = len(spots) / (time.perf_counter() - t0)
+        # recorded only, the throughput depends on the machine
+        record_property("spots_per_second", round(throughput))
+        assert (n_emitters >= 1).all()
+
+
+class TestIterationStatistics:
+    def test_histogram(self):
+        stats = gaussmle.iteration_statistics(np.array([1, 3, 3, 5]), 5)
+        assert stats["Iterations histogram"] == [0, 1, 0, 2, 0, 1]
+        assert stats["Not converged"] == 1
+        assert stats["Mean iterations"] == 3.0
+
+    def test_empty(self):
+        stats = gaussmle.iteration_statistics(np.array([], dtype=int), 5)
+        assert stats["Iterations histogram"] == []
+
+    def test_converged_flag(self):
+        # the last spot converged in its final iteration
+        stats = gaussmle.iteration_statistics(
+            np.array([1, 3, 5, 5]), 5, converged=np.array([1, 1, 0, 1], bool)
+        )
+        assert stats["Not converged"] == 1
+
+    @pytest.mark.parametrize("converge_all", [False, True])
+    @pytest.mark.parametrize("method", ["sigma", "sigmaxy"])
+    def test_return_converged(self, synthetic_spots, method, converge_all):
+        spots, _ = synthetic_spots
+        kwargs = dict(method=method, converge_all=converge_all)
+        *_, its, converged = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, return_converged=True, **kwargs
+        )
+        assert converged.dtype == bool
+        assert converged.all()
+        *_, converged = gaussmle.gaussmle(
+            spots, EPS, 1, return_converged=True, **kwargs
+        )
+        assert not converged.any()
+
+    @pytest.mark.parametrize("method", ["sigma", "sigmaxy"])
+    def test_converge_all_is_stricter(self, synthetic_spots, method):
+        """By default, only the positions (and sigma_x and sigma_y for
+        sigmaxy) are checked; all parameters converge in more
+        iterations, which end at the same positions."""
+        spots, _ = synthetic_spots
+        theta, _, _, its = gaussmle.gaussmle(spots, EPS, MAX_IT, method)
+        theta_all, _, _, its_all = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method, converge_all=True
+        )
+        assert (its_all >= its).all()
+        np.testing.assert_allclose(theta_all[:, :2], theta[:, :2], atol=1e-2)
+
+
 # ---------------------------------------------------------------------------
 # locs_from_fits — MLE-specific output (extra columns vs. gausslq)
 # ---------------------------------------------------------------------------
@@ -233,6 +590,20 @@ class TestLocsFromFits:
         ]:
             assert col in locs.columns
 
+    def test_converged_column(self, synthetic_spots, identifications):
+        spots, _ = synthetic_spots
+        theta, crlbs, lls, its, converged = gaussmle.gaussmle(
+            spots, EPS, MAX_IT, method="sigmaxy", return_converged=True
+        )
+        locs = gaussmle.locs_from_fits(
+            identifications, theta, crlbs, lls, its, BOX
+        )
+        assert "converged" not in locs.columns
+        locs = gaussmle.locs_from_fits(
+            identifications, theta, crlbs, lls, its, BOX, converged=converged
+        )
+        np.testing.assert_array_equal(locs["converged"], converged)
+
     def test_uncertainty_columns_strictly_positive(
         self, fit_results, identifications
     ):
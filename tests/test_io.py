@@ -5,7 +5,7 @@ The bundled ``locs`` and ``movie`` fixtures from ``tests/conftest.py``
 are reused for round-trip checks against real Picasso data.
 
 Skipped functions (need fixtures we don't have bundled): ``load_ims*``,
-``load_nd2``, ``load_stk``, ``load_tif``, ``to_raw``, ``to_raw_combined``.
+``load_nd2``, ``load_stk``, ``load_tif``, ``to_raw``.
 
 :author: Rafal Kowalewski, 2026
 :copyright: Copyright (c) 2026 Jungmann Lab, MPI of Biochemistry
@@ -21,7 +21,7 @@ import pandas as pd
 import pytest
 import yaml
 
-from picasso import io, lib
+from picasso import io, lib, postprocess
 
 from tests.conftest import PIXELSIZE
 
@@ -111,6 +111,169 @@ class TestRawRoundtrip:
         np.testing.assert_array_equal(np.asarray(loaded), movie)
 
 
+# ---------------------------------------------------------------------------
+# TiffMap / ReadAheadMovie
+# ---------------------------------------------------------------------------
+
+
+class TestTiffMap:
+    @pytest.fixture
+    def tif(self, tmp_path):
+        tifffile = pytest.importorskip("tifffile")
+        rng = np.random.default_rng(0)
+        movie = rng.integers(0, 65535, size=(20, 6, 8), dtype=np.uint16)
+        path = tmp_path / "movie.tif"
+        tifffile.imwrite(str(path), movie, photometric="minisblack")
+        return str(path), movie
+
+    def test_frames_roundtrip(self, tif):
+        path, movie = tif
+        with io.TiffMap(path) as tiff_map:
+            assert len(tiff_map) == len(movie)
+            np.testing.assert_array_equal(tiff_map[:], movie)
+            np.testing.assert_array_equal(tiff_map[3, 1:4], movie[3, 1:4])
+
+    def test_concurrent_reads(self, tif):
+        """Frames read from many threads through one file handle."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        path, movie = tif
+        with io.TiffMap(path) as tiff_map:
+            assert tiff_map.concurrent_reads
+            indices = list(range(len(movie))) * 5
+            with ThreadPoolExecutor(8) as executor:
+                frames = list(executor.map(tiff_map.get_frame, indices))
+        np.testing.assert_array_equal(np.array(frames[: len(movie)]), movie)
+        np.testing.assert_array_equal(np.array(frames[-len(movie) :]), movie)
+
+    def test_memmap_frames(self, tif):
+        path, movie = tif
+        with io.TiffMap(path, memmap_frames=True) as tiff_map:
+            assert tiff_map.memmap is not None
+            np.testing.assert_array_equal(tiff_map.memmap, movie)
+            np.testing.assert_array_equal(tiff_map[2:9:3], movie[2:9:3])
+            np.testing.assert_array_equal(tiff_map.get_frame(5), movie[5])
+
+    def test_refresh_reads_appended_frames(self, tif):
+        """Frames appended while the file is open, as during an
+        acquisition, are found by ``refresh``."""
+        tifffile = pytest.importorskip("tifffile")
+        path, movie = tif
+        with io.TiffMap(path, memmap_frames=True) as tiff_map:
+            assert tiff_map.refresh() == 0
+            for frame in movie[:5]:
+                tifffile.imwrite(
+                    path, frame, append=True, photometric="minisblack"
+                )
+            assert tiff_map.refresh() == 5
+            assert len(tiff_map) == len(movie) + 5
+            np.testing.assert_array_equal(tiff_map[len(movie) :], movie[:5])
+
+    def test_big_endian_not_memory_mapped(self, tmp_path):
+        tifffile = pytest.importorskip("tifffile")
+        movie = np.arange(3 * 4 * 5, dtype=np.uint16).reshape(3, 4, 5)
+        path = str(tmp_path / "movie_be.tif")
+        tifffile.imwrite(path, movie, byteorder=">", photometric="minisblack")
+        with io.TiffMap(path, memmap_frames=True) as tiff_map:
+            assert tiff_map.memmap is None
+            np.testing.assert_array_equal(tiff_map[:], movie)
+
+
+class TestToRawCombined:
+    @pytest.fixture
+    def parts(self, tmp_path):
+        tifffile = pytest.importorskip("tifffile")
+        rng = np.random.default_rng(0)
+        movie = rng.integers(0, 65535, size=(30, 6, 8), dtype=np.uint16)
+        paths = [
+            str(tmp_path / "movie.ome.tif"),
+            str(tmp_path / "movie_1.ome.tif"),
+            str(tmp_path / "movie_2.ome.tif"),
+        ]
+        # the big-endian part cannot be copied byte by byte
+        byteorders = ["<", ">", "<"]
+        for path, part, byteorder in zip(
+            paths, np.split(movie, [10, 25]), byteorders
+        ):
+            tifffile.imwrite(
+                path, part, byteorder=byteorder, photometric="minisblack"
+            )
+        return paths, movie
+
+    def test_raw_matches_parts(self, tmp_path, parts):
+        paths, movie = parts
+        basename = str(tmp_path / "movie")
+        io.to_raw_combined(basename, paths)
+        raw, info = io.load_raw(basename + ".ome.raw")
+        assert info[0]["Frames"] == len(movie)
+        np.testing.assert_array_equal(raw, movie)
+
+    def test_virtual(self, tmp_path, parts):
+        paths, movie = parts
+        basename = str(tmp_path / "movie")
+        virtual, info = io.to_raw_combined(basename, paths, virtual=True)
+        assert not os.path.exists(basename + ".ome.raw")
+        assert info[0]["Frames"] == len(movie)
+        with virtual:
+            np.testing.assert_array_equal(virtual[:], movie)
+
+    def test_contiguous_runs(self):
+        runs = io._contiguous_runs([8, 12, 16, 30, 34], 4)
+        assert runs == [(8, 12), (30, 8)]
+
+
+class TestReadAheadMovie:
+    def test_frames_match_in_order(self, picasso_movie, movie):
+        with io.ReadAheadMovie(picasso_movie, read_ahead=8) as read_ahead:
+            for i, frame in enumerate(read_ahead):
+                np.testing.assert_array_equal(frame, movie[i])
+            stats = read_ahead.statistics()
+            assert stats["Hits"] + stats["Misses"] == len(movie)
+            assert stats["Hits"] > 0
+
+    def test_random_access(self, picasso_movie, movie):
+        read_ahead = io.ReadAheadMovie(picasso_movie, read_ahead=4)
+        try:
+            for i in [50, 3, 3, 4, 90, -1]:
+                np.testing.assert_array_equal(read_ahead[i], movie[i])
+            np.testing.assert_array_equal(read_ahead[2:5], movie[2:5])
+        finally:
+            read_ahead.stop()
+
+    def test_failed_read(self, picasso_movie, movie):
+        """A frame that cannot be read in the background is read on
+        request, such that the error reaches the caller."""
+
+        class FailingMovie:
+            def __init__(self, movie):
+                self.movie = movie
+
+            def __len__(self):
+                return len(self.movie)
+
+            def __getitem__(self, it):
+                if it == 5:
+                    raise OSError("frame 5 cannot be read")
+                return self.movie[it]
+
+            def close(self):
+                pass
+
+        read_ahead = io.ReadAheadMovie(
+            FailingMovie(picasso_movie), read_ahead=8
+        )
+        try:
+            np.testing.assert_array_equal(read_ahead[0], movie[0])
+            with pytest.raises(OSError):
+                read_ahead[5]
+            # reading ahead continues after the failed frame
+            for i in range(6, 20):
+                np.testing.assert_array_equal(read_ahead[i], movie[i])
+            assert read_ahead._thread.is_alive()
+        finally:
+            read_ahead.stop()
+
+
 # ---------------------------------------------------------------------------
 # save_drift / load_drift
 # ---------------------------------------------------------------------------
@@ -177,6 +340,19 @@ class TestSaveLoadLocs:
             loaded["x"].to_numpy(), locs["x"].to_numpy()
         )
 
+    def test_unsanitized_file_is_checked(self, tmp_path, locs, info):
+        path = tmp_path / "locs.hdf5"
+        io.save_locs(str(path), locs, info)
+        with h5py.File(path, "r") as f:
+            assert f["locs"].attrs["Sanitized"]
+        # e.g., written by an older Picasso version or another program
+        bad = locs.copy()
+        bad.loc[bad.index[0], "x"] = np.nan
+        with h5py.File(path, "w") as f:
+            f.create_dataset("locs", data=bad.to_records(index=False))
+        loaded, _ = io.load_locs(str(path))
+        assert len(loaded) == len(locs) - 1
+
     def test_csv_extension_raises(self, tmp_path):
         # ThunderSTORM .csv files must go through import_ts, not load_locs
         path = tmp_path / "locs.csv"
@@ -185,6 +361,213 @@ class TestSaveLoadLocs:
             io.load_locs(str(path))
 
 
+class TestColumnsLayout:
+    @pytest.mark.parametrize("compression", ["gzip", "lzf", None])
+    def test_roundtrip(self, tmp_path, locs, info, compression):
+        path = tmp_path / "locs.hdf5"
+        io.save_locs(
+            str(path), locs, info, layout="columns", compression=compression
+        )
+        loaded, _ = io.load_locs(str(path))
+        assert list(loaded.columns) == list(locs.columns)
+        for column in locs.columns:
+            np.testing.assert_array_equal(
+                loaded[column].to_numpy(), locs[column].to_numpy()
+            )
+            assert loaded[column].dtype == locs[column].dtype
+
+    def test_one_dataset_per_column(self, tmp_path, locs, info):
+        path = tmp_path / "locs.hdf5"
+        io.save_locs(str(path), locs, info, layout="columns")
+        with h5py.File(path, "r") as f:
+            assert isinstance(f["locs"], h5py.Group)
+            assert f["locs/x"].compression == "gzip"
+            assert f["locs/x"].chunks is not None
+            assert f["locs/x"].shape == (len(locs),)
+
+    @pytest.mark.parametrize("n_locs", [None, 200_000])
+    def test_smaller_than_records(self, tmp_path, locs, info, n_locs):
+        if n_locs is not None:
+            # a realistic number of localizations with noisy values
+            rng = np.random.default_rng(0)
+            locs = locs.sample(n_locs, replace=True, random_state=0)
+            locs = locs.sort_values("frame", ignore_index=True)
+            for column in locs.columns:
+                if locs[column].dtype == np.float32:
+                    noise = rng.normal(1, 0.01, n_locs).astype(np.float32)
+                    locs[column] *= noise
+        records = tmp_path / "records.hdf5"
+        columns = tmp_path / "columns.hdf5"
+        io.save_locs(str(records), locs, info)
+        io.save_locs(str(columns), locs, info, layout="columns")
+        assert os.path.getsize(columns) < os.path.getsize(records)
+
+    def test_empty_locs(self, tmp_path, locs, info):
+        path = tmp_path / "locs.hdf5"
+        io.save_locs(str(path), locs.iloc[:0], info, layout="columns")
+        loaded, _ = io.load_locs(str(path))
+        assert len(loaded) == 0
+        assert list(loaded.columns) == list(locs.columns)
+
+    def test_load_filter(self, tmp_path, locs, info):
+        path = tmp_path / "locs.hdf5"
+        io.save_locs(str(path), locs, info, layout="columns")
+        loaded, _ = io.load_filter(str(path))
+        assert len(loaded) == len(locs)
+
+    def test_unknown_compression(self, tmp_path, locs, info):
+        with pytest.raises(ValueError, match="Unknown compression"):
+            io.save_locs(
+                str(tmp_path / "locs.hdf5"),
+                locs,
+                info,
+                layout="columns",
+                compression="zstd",
+            )
+
+
+class TestLoadLocsSelection:
+    @pytest.fixture(params=["records", "columns"])
+    def path(self, request, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        io.save_locs(path, locs, info, layout=request.param)
+        return path
+
+    def test_columns(self, path, locs):
+        loaded, _ = io.load_locs(path, columns=["frame", "x", "y"])
+        assert list(loaded.columns) == ["frame", "x", "y"]
+        np.testing.assert_array_equal(
+            loaded["x"].to_numpy(), locs["x"].to_numpy()
+        )
+
+    def test_missing_column(self, path):
+        with pytest.raises(ValueError, match="not_a_column"):
+            io.load_locs(path, columns=["x", "not_a_column"])
+
+    def test_frames(self, path, locs):
+        first, last = 10, 20
+        loaded, _ = io.load_locs(path, frames=(first, last))
+        expected = locs[locs["frame"].between(first, last)]
+        assert len(loaded) == len(expected)
+        np.testing.assert_array_equal(
+            loaded["x"].to_numpy(), expected["x"].to_numpy()
+        )
+        loaded, _ = io.load_locs(path, frames=(None, last))
+        assert len(loaded) == (locs["frame"] <= last).sum()
+
+    def test_frames_unsorted_file(self, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        shuffled = locs.sample(frac=1, random_state=0)
+        io.save_locs(path, shuffled, info)
+        with h5py.File(path, "r") as f:
+            assert not f["locs"].attrs["Sorted by frame"]
+        loaded, _ = io.load_locs(path, frames=(10, 20))
+        assert len(loaded) == locs["frame"].between(10, 20).sum()
+
+    def test_roi(self, path, locs):
+        roi = ((5, 10), (20, 25))
+        loaded, _ = io.load_locs(
+            path, columns=["x", "y"], frames=(0, None), roi=roi
+        )
+        in_roi = (
+            (locs["y"] >= 5)
+            & (locs["y"] < 20)
+            & (locs["x"] >= 10)
+            & (locs["x"] < 25)
+        )
+        assert len(loaded) == in_roi.sum()
+        assert loaded["x"].between(10, 25).all()
+
+
+class TestLazyLocs:
+    @pytest.fixture(params=["records", "columns"])
+    def lazy_locs(self, request, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        io.save_locs(path, locs, info, layout=request.param)
+        return io.LazyLocs(path, block_size=100)
+
+    def test_blocks_cover_all_locs(self, lazy_locs, locs):
+        blocks = list(lazy_locs.iter_blocks())
+        assert len(lazy_locs) == len(locs)
+        assert all(len(block) == 100 for block in blocks[:-1])
+        loaded = pd.concat(blocks)
+        assert list(loaded.columns) == list(locs.columns)
+        np.testing.assert_array_equal(
+            loaded["x"].to_numpy(), locs["x"].to_numpy()
+        )
+
+    def test_blocks_by_frame(self, lazy_locs):
+        if not lazy_locs.sorted_by_frame:
+            pytest.skip("test data is not sorted by frame")
+        frames = [
+            set(block["frame"])
+            for block in lazy_locs.iter_blocks(["frame"], by_frame=True)
+        ]
+        for previous, current in zip(frames[:-1], frames[1:]):
+            assert not previous & current
+
+    def test_map_matches_dataframe(self, tmp_path, lazy_locs, locs, info):
+        n_frames = info[0]["Frames"]
+        drift = np.column_stack([np.linspace(0, 1, n_frames)] * 2)
+        undrifted = lazy_locs.map(
+            lambda block: postprocess.apply_drift(block, info, drift=drift),
+            str(tmp_path / "locs_undrift.hdf5"),
+        )
+        expected = postprocess.apply_drift(locs.copy(), info, drift=drift)
+        np.testing.assert_allclose(
+            undrifted.column("x"), expected["x"].to_numpy()
+        )
+        assert os.path.isfile(tmp_path / "locs_undrift.yaml")
+
+    def test_filter(self, tmp_path, lazy_locs, locs):
+        threshold = locs["photons"].median()
+        bright = lazy_locs.filter(
+            lambda block: block["photons"] > threshold,
+            str(tmp_path / "locs_bright.hdf5"),
+        )
+        assert len(bright) == (locs["photons"] > threshold).sum()
+        loaded, _ = io.load_locs(bright.path)
+        assert (loaded["photons"] > threshold).all()
+
+    @pytest.mark.parametrize("how", ["count", "sum", "mean", "min", "max"])
+    def test_groupby_agg(self, lazy_locs, locs, how):
+        result = lazy_locs.groupby_agg("frame", ["photons", "sx"], how=how)
+        expected = locs.groupby("frame")[["photons", "sx"]].agg(how)
+        np.testing.assert_allclose(
+            result.to_numpy(dtype=float), expected.to_numpy(dtype=float)
+        )
+
+    def test_writer_rejects_other_columns(self, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        with io.LocsWriter(path, info) as writer:
+            writer.append(locs.iloc[:10])
+            with pytest.raises(ValueError, match="Expected the columns"):
+                writer.append(locs.iloc[10:20][["x", "y"]])
+            writer.append(locs.iloc[10:20])
+        loaded, _ = io.load_locs(path)
+        assert len(loaded) == 20
+
+    def test_writer_without_blocks_keeps_columns(self, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        with io.LocsWriter(path, info, dtypes=locs.dtypes.to_dict()):
+            pass
+        loaded, _ = io.load_locs(path)
+        assert len(loaded) == 0
+        assert list(loaded.columns) == list(locs.columns)
+        pd.testing.assert_series_equal(loaded.dtypes, locs.dtypes)
+
+    def test_map_empty_keeps_columns(self, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        io.save_locs(path, locs.iloc[:0], info, layout="columns")
+        lazy_locs = io.LazyLocs(path)
+        mapped = lazy_locs.map(
+            lambda block: block.assign(x2=block["x"] * 2),
+            str(tmp_path / "locs_x2.hdf5"),
+        )
+        assert len(mapped) == 0
+        assert mapped.columns == list(locs.columns) + ["x2"]
+
+
 class TestSaveDatasets:
     def test_writes_named_datasets(self, tmp_path):
         path = tmp_path / "datasets.hdf5"
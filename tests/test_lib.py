@@ -43,6 +43,11 @@ class TestGetFromMetadata:
         info = [{"Pixelsize": 130}, {"Pixelsize": 160}]
         assert lib.get_from_metadata(info, "Pixelsize") == 160
 
+    def test_list_input_falsy_value(self):
+        # e.g. a camera baseline of 0 is found, not skipped
+        info = [{"Baseline": 100}, {"Baseline": 0}]
+        assert lib.get_from_metadata(info, "Baseline", raise_error=True) == 0
+
     def test_list_input_default(self):
         info = [{"Width": 32}, {"Height": 32}]
         assert lib.get_from_metadata(info, "Pixelsize", default=130) == 130
@@ -365,6 +370,36 @@ class TestEnsureSanity:
         with pytest.raises(KeyError):
             lib.ensure_sanity(locs, info)
 
+    def test_drops_nan_and_inf(self):
+        locs = pd.DataFrame(
+            {
+                "frame": [0, 1, 2, 3],
+                "x": [1.0, np.nan, 2.0, 3.0],
+                "y": [1.0, 2.0, np.inf, 3.0],
+                "bg": np.array([1.0, 1.0, 1.0, -np.inf], dtype=np.float32),
+            }
+        )
+        info = [{"Width": 32, "Height": 32, "Frames": 4}]
+        out = lib.ensure_sanity(locs, info)
+        assert out["frame"].tolist() == [0]
+
+    def test_copy(self):
+        locs = pd.DataFrame(
+            {"frame": [0, 1], "x": [1.0, 2.0], "y": [1.0, 2.0]}
+        )
+        info = [{"Width": 32, "Height": 32, "Frames": 2}]
+        assert lib.ensure_sanity(locs, info, copy=False) is locs
+        out = lib.ensure_sanity(locs, info)
+        out["x"] += 1
+        assert locs["x"].tolist() == [1.0, 2.0]
+
+    def test_trusted_skips_checks(self):
+        locs = pd.DataFrame({"frame": [0], "x": [100.0], "y": [1.0]})
+        info = [{"Width": 32, "Height": 32, "Frames": 1}]
+        assert len(lib.ensure_sanity(locs, info, trusted=True)) == 1
+        with pytest.raises(KeyError):
+            lib.ensure_sanity(locs, info[:0], trusted=True)
+
 
 # ---------------------------------------------------------------------------
 # Distance / containment
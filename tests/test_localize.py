@@ -11,6 +11,7 @@ Tests for ``gausslq``, ``gaussmle`` and ``zfit`` live in their own files
 
 from __future__ import annotations
 
+import os
 import time
 
 import h5py
@@ -18,7 +19,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from picasso import io, localize
+from picasso import avgroi, io, localize, zfit
 
 from tests.conftest import BOX, CALIB_3D, CAMERA_INFO, MIN_NG, PIXELSIZE
 
@@ -269,6 +270,39 @@ class TestIdentifyInFrame:
         assert len(y) == 0 and len(x) == 0 and len(ng) == 0
 
 
+# ---------------------------------------------------------------------------
+# _identify_in_frames — batched identification
+# ---------------------------------------------------------------------------
+
+
+class TestIdentifyInFrames:
+    """Batched identification into a single structured array."""
+
+    def test_matches_identify_in_frame(self, movie):
+        roi = ((5, 3), (30, 28))
+        frames = np.asarray(movie[10:30])
+        ids = localize._identify_in_frames(frames, 10, MIN_NG, BOX, roi)
+        assert (np.diff(ids["frame"]) >= 0).all()
+        for i, frame in enumerate(frames):
+            y, x, ng = localize.identify_in_frame(frame, MIN_NG, BOX, roi)
+            in_frame = ids[ids["frame"] == 10 + i]
+            np.testing.assert_array_equal(in_frame["y"], y)
+            np.testing.assert_array_equal(in_frame["x"], x)
+            np.testing.assert_allclose(in_frame["net_gradient"], ng)
+
+    def test_many_maxima_grow_buffers(self):
+        """More maxima than the initial buffer size are all kept."""
+        rng = np.random.default_rng(0)
+        frames = rng.integers(0, 1000, (8, 128, 128)).astype(np.uint16)
+        ids = localize._identify_in_frames(frames, 0, -1e9, 3, None)
+        n_expected = sum(
+            len(localize.identify_in_frame(frame, -1e9, 3)[0])
+            for frame in frames
+        )
+        assert n_expected > 1024
+        assert len(ids) == n_expected
+
+
 # ---------------------------------------------------------------------------
 # _to_photons
 # ---------------------------------------------------------------------------
@@ -312,6 +346,142 @@ class TestToPhotons:
         out = localize._to_photons(spots, CAMERA_INFO)
         assert out.dtype == np.float32
 
+    def test_camera_maps(self):
+        rng = np.random.default_rng(0)
+        movie = rng.integers(100, 1000, (3, 20, 20)).astype(np.uint16)
+        offset = rng.uniform(90, 110, (20, 20))
+        gain = rng.uniform(1.5, 2.5, (20, 20))
+        cam = {
+            "Baseline": 0,
+            "Sensitivity": 1,
+            "Gain": 2,
+            "Offset Map": offset,
+            "Gain Map": gain,
+        }
+        ids = pd.DataFrame({"frame": [0, 2], "x": [5, 14], "y": [8, 10]})
+        r = BOX // 2
+        expected = np.stack(
+            [
+                (
+                    movie[f, y - r : y + r + 1, x - r : x + r + 1]
+                    - offset[y - r : y + r + 1, x - r : x + r + 1]
+                )
+                / (gain[y - r : y + r + 1, x - r : x + r + 1] * 2)
+                for f, x, y in zip(ids["frame"], ids["x"], ids["y"])
+            ]
+        )
+        out = localize.get_spots(movie, ids, BOX, cam)
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out, expected, rtol=1e-5)
+        raw = localize._cut_spots(movie, ids, BOX)
+        out = localize._to_photons(raw, cam, ids)
+        np.testing.assert_allclose(out, expected, rtol=1e-5)
+        with pytest.raises(ValueError, match="positions"):
+            localize._to_photons(raw, cam)
+
+    def test_camera_maps_from_files_are_cached(self, tmp_path):
+        path = tmp_path / "offset.npy"
+        np.save(path, np.full((20, 20), 100.0))
+        cam = {
+            "Baseline": 0,
+            "Sensitivity": 1,
+            "Gain": 1,
+            "Offset Map": str(path),
+        }
+        offset, scale = localize._camera_maps(cam)
+        np.testing.assert_allclose(offset, 100.0)
+        assert scale.shape == (1, 1)
+        assert localize._camera_maps(dict(cam))[0] is offset
+        # a rewritten map is loaded again
+        np.save(path, np.full((20, 20), 50.0))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+        np.testing.assert_allclose(localize._camera_maps(cam)[0], 50.0)
+
+    def test_camera_maps_cache_is_bounded(self, tmp_path):
+        for i in range(2 * localize._CAMERA_MAPS_CACHE_SIZE):
+            path = tmp_path / f"offset_{i}.npy"
+            np.save(path, np.full((20, 20), float(i)))
+            localize._camera_maps(CAMERA_INFO | {"Offset Map": str(path)})
+        assert (
+            len(localize._camera_maps_cache)
+            <= localize._CAMERA_MAPS_CACHE_SIZE
+        )
+
+    def test_movie_without_shape(self, tmp_path):
+        """TiffMap has no ``shape``, the frame shape is read from its
+        info for checking the camera maps."""
+        tifffile = pytest.importorskip("tifffile")
+        movie = np.full((2, 32, 24), 200, dtype=np.uint16)
+        path = str(tmp_path / "movie.tif")
+        tifffile.imwrite(path, movie, photometric="minisblack")
+        ids = pd.DataFrame({"frame": [1], "x": [10], "y": [12]})
+        with io.TiffMap(path) as tiff_map:
+            assert not hasattr(tiff_map, "shape")
+            expected = localize.get_spots(movie, ids, BOX, CAMERA_INFO)
+            spots = localize.get_spots(tiff_map, ids, BOX, CAMERA_INFO)
+            np.testing.assert_allclose(spots, expected)
+            cam = CAMERA_INFO | {"Offset Map": np.zeros((32, 24))}
+            localize.get_spots(tiff_map, ids, BOX, cam)
+            cam = CAMERA_INFO | {"Offset Map": np.zeros((24, 32))}
+            with pytest.raises(ValueError, match="Offset Map"):
+                localize.get_spots(tiff_map, ids, BOX, cam)
+
+    def test_variance_map_in_photons(self):
+        variance = np.arange(400, dtype=np.float32).reshape(20, 20)
+        cam = {
+            "Baseline": 0,
+            "Sensitivity": 1,
+            "Gain": 1,
+            "Gain Map": np.full((20, 20), 2.0),
+            "Variance Map": variance,
+        }
+        ids = pd.DataFrame({"frame": [0, 1], "x": [5, 12], "y": [6, 10]})
+        variances = localize._cut_variances(cam, ids, BOX, (20, 20))
+        r = BOX // 2
+        np.testing.assert_allclose(
+            variances[1], variance[7 : 7 + BOX, 12 - r : 12 + r + 1] / 4
+        )
+        assert localize._cut_variances(CAMERA_INFO, ids, BOX, (20, 20)) is None
+        with pytest.raises(ValueError, match="Variance Map"):
+            localize._cut_variances(cam, ids, BOX, (32, 32))
+
+    @pytest.mark.parametrize("name", ["Offset Map", "Gain Map"])
+    def test_camera_map_shape_must_match_movie(self, name):
+        movie = np.full((2, 32, 32), 200, dtype=np.uint16)
+        cam = CAMERA_INFO | {name: np.ones((20, 20))}
+        # the spot lies outside of the map
+        ids = pd.DataFrame({"frame": [0], "x": [25], "y": [25]})
+        with pytest.raises(ValueError, match=name):
+            localize.get_spots(movie, ids, BOX, cam)
+        with pytest.raises(ValueError, match=name):
+            localize._identify_and_cut_chunk(
+                movie, 0, 2, MIN_NG, BOX, None, cam, None
+            )
+
+    def test_camera_maps_are_not_stored_in_metadata(self, tmp_path):
+        path = tmp_path / "variance.npy"
+        cam = CAMERA_INFO | {
+            "Offset Map": np.zeros((20, 20)),
+            "Variance Map": path,
+        }
+        info = localize._fit2d_info(cam, "gaussmle", 0.001, 100)
+        assert info["Offset Map"] == "array"
+        assert info["Variance Map"] == str(path)
+
+    def test_get_spots_matches_cut_and_convert(self):
+        rng = np.random.default_rng(1)
+        movie = rng.integers(0, 1000, (4, 16, 16)).astype(np.uint16)
+        ids = pd.DataFrame(
+            {"frame": [3, 0, 1], "x": [4, 8, 11], "y": [9, 5, 4]}
+        )
+        cam = {"Baseline": 100, "Sensitivity": 0.5, "Gain": 2}
+        expected = (
+            np.float32(localize._cut_spots(movie, ids, BOX)) - 100
+        ) * 0.25
+        out = localize.get_spots(movie, ids, BOX, cam)
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out, expected, rtol=1e-6)
+
 
 # ---------------------------------------------------------------------------
 # identify
@@ -678,6 +848,38 @@ class TestGetSpots:
         spots_x2 = localize.get_spots(movie, real_identifications, BOX, cam_x2)
         np.testing.assert_allclose(spots_x2, spots_x1 / 2, rtol=1e-5)
 
+    def test_identifications_in_any_order(
+        self, movie, picasso_movie, real_identifications
+    ):
+        """Frame-by-frame cutting (movies read from disk) does not need
+        the identifications sorted by frame."""
+        shuffled = real_identifications.sample(frac=1, random_state=0)
+        expected = localize._cut_spots(movie, shuffled, BOX)
+        spots = localize._cut_spots(picasso_movie, shuffled, BOX)
+        np.testing.assert_array_equal(spots, expected)
+
+    def test_reads_only_frames_with_spots(
+        self, picasso_movie, real_identifications, monkeypatch
+    ):
+        ids = real_identifications.iloc[[-1, 0]]
+        read = []
+        getitem = type(picasso_movie).__getitem__
+        monkeypatch.setattr(
+            type(picasso_movie),
+            "__getitem__",
+            lambda self, it: read.append(it) or getitem(self, it),
+        )
+        localize._cut_spots(picasso_movie, ids, BOX)
+        assert read == sorted(set(ids["frame"]))
+
+    def test_spot_frame_index(self):
+        frames, offsets, order = localize._spot_frame_index(
+            np.array([7, 2, 7, 2, 9])
+        )
+        np.testing.assert_array_equal(frames, [2, 7, 9])
+        np.testing.assert_array_equal(offsets, [0, 2, 4, 5])
+        np.testing.assert_array_equal(order, [1, 3, 0, 2, 4])
+
 
 # ---------------------------------------------------------------------------
 # fit + fit_async (MLE wrapper)
@@ -744,11 +946,8 @@ class TestFit:
             BOX,
             method="sigmaxy",
         )
-        # `current[0]` is incremented *before* the per-spot fit runs (see
-        # ``gaussmle._worker``), so polling it can let the loop exit while
-        # the last few worker writes are still in flight. ``iterations``
-        # is zero-initialised and only written when a fit completes —
-        # poll on that for a race-free completion signal.
+        # ``iterations`` is zero-initialised and only written when a fit
+        # completes — poll on that as an independent completion signal.
         t0 = time.time()
         while (iterations == 0).any():
             assert time.time() - t0 < 30, "fit_async timed out"
@@ -869,6 +1068,37 @@ class TestFit2D:
         # camera_info keys merged into new_info
         assert new_info["Pixelsize"] == 130
 
+    def test_gausslq_batch_matches_gausslq(
+        self, picasso_movie, real_identifications, movie_info
+    ):
+        locs, _ = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gausslq",
+            multiprocess=False,
+        )
+        locs_batch, new_info = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gausslq-batch",
+        )
+        assert new_info["Fit method"] == "gausslq-batch"
+        assert list(locs.columns) == list(locs_batch.columns)
+        keys = ["frame", "net_gradient"]
+        locs = locs.sort_values(keys)
+        locs_batch = locs_batch.sort_values(keys)
+        for col in ["x", "y"]:
+            np.testing.assert_allclose(locs_batch[col], locs[col], atol=1e-2)
+        np.testing.assert_allclose(
+            locs_batch["photons"], locs["photons"], rtol=1e-2
+        )
+
     def test_gaussmle_returns_locs(
         self, picasso_movie, real_identifications, movie_info
     ):
@@ -886,6 +1116,68 @@ class TestFit2D:
         assert new_info["Fit method"] == "gaussmle"
         assert new_info["Convergence criterion"] == 0.001
         assert new_info["Max iterations"] == 100
+        assert sum(new_info["Iterations histogram"]) == len(locs)
+        assert "Warm start" not in new_info
+        assert "converged" not in locs.columns
+
+    @pytest.mark.parametrize("warm_start", ["gausslq", "previous"])
+    def test_gaussmle_warm_start(
+        self, picasso_movie, real_identifications, movie_info, warm_start
+    ):
+        locs_cold, _ = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gaussmle",
+            multiprocess=False,
+            mle_converge_all=True,
+        )
+        locs, new_info = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gaussmle",
+            multiprocess=False,
+            mle_warm_start=warm_start,
+            mle_converge_all=True,
+        )
+        assert new_info["Warm start"] == warm_start
+        assert new_info["Converge all parameters"]
+        # both starts converge to the same maximum (eps = 0.001 px)
+        converged = locs["converged"] & locs_cold["converged"]
+        np.testing.assert_allclose(
+            locs["x"][converged], locs_cold["x"][converged], atol=0.01
+        )
+
+    def test_gaussmle_multi_returns_locs(
+        self, picasso_movie, real_identifications, movie_info
+    ):
+        locs_single, _ = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gaussmle",
+            multiprocess=False,
+        )
+        locs, new_info = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            real_identifications,
+            BOX,
+            fitting_method="gaussmle-multi",
+        )
+        assert new_info["Fit method"] == "gaussmle-multi"
+        assert "Mean iterations" in new_info
+        assert list(locs.columns) == list(locs_single.columns) + ["n_emitters"]
+        assert locs["n_emitters"].between(1, 3).all()
+        assert len(locs) >= 0.9 * len(real_identifications)
 
     def test_avg_returns_locs(
         self, picasso_movie, real_identifications, movie_info
@@ -904,6 +1196,26 @@ class TestFit2D:
         assert len(locs) == len(real_identifications)
         assert new_info["Fit method"] == "avg"
 
+    def test_avg_batch_matches_serial(self, real_spots):
+        theta = avgroi.fit_spots(real_spots)
+        theta_batch = avgroi.fit_spots_batch(real_spots, block_size=10)
+        np.testing.assert_array_equal(theta_batch, theta)
+        np.testing.assert_allclose(
+            theta[:, 2], real_spots.sum(axis=(1, 2)), rtol=1e-5
+        )
+        np.testing.assert_array_equal(theta[:, [0, 1]], 0)
+
+    def test_avg_progress_counts_fitted_spots(self, real_spots):
+        calls = []
+        avgroi.fit_spots(real_spots, progress_callback=calls.append)
+        assert calls == [len(real_spots)]
+        calls = []
+        avgroi.fit_spots_batch(
+            real_spots, block_size=10, progress_callback=calls.append
+        )
+        assert calls[-1] == len(real_spots)
+        assert calls == sorted(calls)
+
     def test_invalid_fitting_method_raises(
         self, picasso_movie, real_identifications, movie_info
     ):
@@ -1069,6 +1381,281 @@ class TestLocalize:
         assert isinstance(result, pd.DataFrame)
 
 
+class TestLocalizeSinglePass:
+    """Movies that are not numpy arrays are identified and cut in a
+    single pass over the movie."""
+
+    @pytest.mark.parametrize("threaded", [False, True])
+    def test_matches_identify_plus_fit2d(
+        self, picasso_movie, movie_info, threaded
+    ):
+        ids = localize.identify(
+            picasso_movie, MIN_NG, BOX, threaded=False, return_info=False
+        )
+        locs_direct, _ = localize.fit2D(
+            picasso_movie,
+            movie_info,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            ids,
+            BOX,
+            fitting_method="gausslq",
+            multiprocess=False,
+        )
+        locs = localize.localize(
+            picasso_movie,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            movie_info=movie_info,
+            fitting_method="gausslq",
+            threaded=threaded,
+            return_info=False,
+        )
+        keys = ["frame", "y", "x"]
+        locs = locs.sort_values(keys).reset_index(drop=True)
+        locs_direct = locs_direct.sort_values(keys).reset_index(drop=True)
+        pd.testing.assert_frame_equal(locs, locs_direct, rtol=1e-4)
+
+    def test_identify_async_returns_matching_spots(self, picasso_movie):
+        current, futures = localize.identify_async(
+            picasso_movie, MIN_NG, BOX, return_spots=True
+        )
+        for f in futures:
+            f.result()
+        ids, spots = localize._identifications_spots_from_futures(futures)
+        assert (np.diff(ids["frame"].to_numpy()) >= 0).all()
+        expected = localize._cut_spots(picasso_movie, ids, BOX)
+        np.testing.assert_array_equal(spots, expected)
+
+
+class TestLocalizeChunked:
+    """Streaming mode of ``localize`` (``chunk_size`` given)."""
+
+    @staticmethod
+    def _localize(picasso_movie, movie_info, **kwargs):
+        return localize.localize(
+            picasso_movie,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            movie_info=movie_info,
+            fitting_method="gausslq",
+            threaded=False,
+            return_info=True,
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 17, 1000])
+    def test_matches_non_chunked(self, picasso_movie, movie_info, chunk_size):
+        """Chunking must not change the localizations (up to order)."""
+        locs, _ = self._localize(picasso_movie, movie_info)
+        locs_chunked, _ = self._localize(
+            picasso_movie, movie_info, chunk_size=chunk_size
+        )
+        keys = ["frame", "y", "x"]
+        locs = locs.sort_values(keys).reset_index(drop=True)
+        locs_chunked = locs_chunked.sort_values(keys).reset_index(drop=True)
+        assert list(locs.columns) == list(locs_chunked.columns)
+        pd.testing.assert_frame_equal(locs, locs_chunked, rtol=1e-4)
+
+    def test_frames_are_ordered(self, picasso_movie, movie_info):
+        locs, _ = self._localize(picasso_movie, movie_info, chunk_size=10)
+        assert (np.diff(locs["frame"].to_numpy()) >= 0).all()
+
+    def test_frame_bounds(self, picasso_movie, movie_info):
+        """Frame bounds are inclusive as in ``identify``."""
+        locs, _ = self._localize(
+            picasso_movie, movie_info, frame_bounds=(5, 30)
+        )
+        locs_chunked, _ = self._localize(
+            picasso_movie, movie_info, frame_bounds=(5, 30), chunk_size=7
+        )
+        assert len(locs) == len(locs_chunked)
+        assert locs_chunked["frame"].min() >= 5
+        assert locs_chunked["frame"].max() <= 30
+
+    def test_info_contains_chunk_size(self, picasso_movie, movie_info):
+        _, info = self._localize(picasso_movie, movie_info, chunk_size=10)
+        assert len(info) == len(movie_info) + 2
+        assert info[-2]["Chunk Size"] == 10
+        assert "Fit method" in info[-1]
+
+    def test_no_spots_returns_empty_locs(self, picasso_movie, movie_info):
+        locs, _ = localize.localize(
+            picasso_movie,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": 1e12, "Box Size": BOX},
+            movie_info=movie_info,
+            threaded=False,
+            chunk_size=10,
+            return_info=True,
+        )
+        assert len(locs) == 0
+        for col in ["frame", "x", "y", "photons", "sx", "sy", "bg"]:
+            assert col in locs.columns
+
+    def test_progress_callbacks_are_cumulative(
+        self, picasso_movie, movie_info
+    ):
+        frames, spots = [], []
+        locs, _ = self._localize(
+            picasso_movie,
+            movie_info,
+            chunk_size=30,
+            identification_progress_callback=frames.append,
+            fit_progress_callback=spots.append,
+        )
+        assert frames[-1] == len(picasso_movie)
+        assert spots[-1] == len(locs)
+        assert frames == sorted(frames)
+        assert spots == sorted(spots)
+
+    def test_invalid_chunk_size_rejected(self, picasso_movie, movie_info):
+        with pytest.raises(AssertionError, match="chunk_size"):
+            self._localize(picasso_movie, movie_info, chunk_size=0)
+
+    def test_checkpoint_resumes(self, picasso_movie, movie_info, tmp_path):
+        """An interrupted run resumes after the last checkpointed frame
+        and yields the same localizations as an uninterrupted one."""
+        path = str(tmp_path / "movie_locs.hdf5")
+        locs, _ = self._localize(picasso_movie, movie_info, chunk_size=10)
+
+        class Interrupt(Exception):
+            pass
+
+        def interrupt(n_frames):
+            if n_frames >= 30:
+                raise Interrupt
+
+        with pytest.raises(Interrupt):
+            self._localize(
+                picasso_movie,
+                movie_info,
+                chunk_size=10,
+                checkpoint_path=path,
+                identification_progress_callback=interrupt,
+            )
+        assert io.is_locs_checkpoint(path, online=False)
+        assert not io.is_locs_checkpoint(path, online=True)
+        frames = []
+        with pytest.warns(UserWarning, match="after frame 19"):
+            locs_resumed, _ = self._localize(
+                picasso_movie,
+                movie_info,
+                chunk_size=10,
+                checkpoint_path=path,
+                identification_progress_callback=frames.append,
+            )
+        # the first 20 frames were checkpointed before the interruption
+        assert frames[0] == 30
+        keys = ["frame", "y", "x"]
+        locs = locs.sort_values(keys).reset_index(drop=True)
+        locs_resumed = locs_resumed.sort_values(keys).reset_index(drop=True)
+        pd.testing.assert_frame_equal(locs, locs_resumed, rtol=1e-4)
+
+
+# ---------------------------------------------------------------------------
+# localize_online — localization of a movie while it is being acquired
+# ---------------------------------------------------------------------------
+
+
+class TestLocalizeOnline:
+    @staticmethod
+    def _write_raw(movie, movie_info, path, n_frames, byte_order="<"):
+        frames = np.asarray(movie[:n_frames])
+        frames.astype(frames.dtype.newbyteorder(byte_order)).tofile(path)
+        info = [movie_info[0] | {"Frames": n_frames, "Byte Order": byte_order}]
+        io.save_info(path.replace(".raw", ".yaml"), info)
+
+    @staticmethod
+    def _localize_online(path, **kwargs):
+        return localize.localize_online(
+            path,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            path.replace(".raw", "_locs.hdf5"),
+            chunk_size=10,
+            poll_interval=0.01,
+            idle_timeout=0,
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize("byte_order", ["<", ">"])
+    def test_matches_localize(
+        self, movie, picasso_movie, movie_info, tmp_path, byte_order
+    ):
+        path = str(tmp_path / "movie.raw")
+        self._write_raw(movie, movie_info, path, len(movie), byte_order)
+        locs, info = self._localize_online(path)
+        locs_ref, _ = localize.localize(
+            picasso_movie,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            movie_info=movie_info,
+            threaded=False,
+            return_info=True,
+        )
+        keys = ["frame", "y", "x"]
+        locs = locs.sort_values(keys).reset_index(drop=True)
+        locs_ref = locs_ref.sort_values(keys).reset_index(drop=True)
+        pd.testing.assert_frame_equal(locs, locs_ref, rtol=1e-4)
+        assert info[0]["Frames"] == len(movie)
+
+    def test_growing_movie(self, movie, movie_info, tmp_path):
+        """Frames written after the start are localized and the results
+        can be loaded with ``io.load_locs``."""
+        path = str(tmp_path / "movie.raw")
+        out_path = path.replace(".raw", "_locs.hdf5")
+        self._write_raw(movie, movie_info, path, 20)
+        progress = []
+
+        def grow(n_frames, n_locs):
+            assert io.is_locs_checkpoint(out_path, online=True)
+            progress.append(n_frames)
+            if n_frames == 20:
+                self._write_raw(movie, movie_info, path, len(movie))
+
+        locs, info = self._localize_online(path, progress_callback=grow)
+        assert progress[-1] == len(movie)
+        assert locs["frame"].max() >= 20
+        _, info_saved = io.load_locs(out_path)
+        assert info_saved[0]["Frames"] == len(movie)
+
+    def test_new_tif_part(self, movie, tmp_path):
+        """Frames in a file that Micro-Manager starts during the
+        acquisition (``<name>_1.ome.tif``) are localized."""
+        tifffile = pytest.importorskip("tifffile")
+        path = str(tmp_path / "movie.ome.tif")
+        out_path = str(tmp_path / "movie_locs.hdf5")
+        frames = np.asarray(movie)
+        tifffile.imwrite(path, frames[:20], photometric="minisblack")
+        progress = []
+        started = []
+
+        def start_part(n_frames, n_locs):
+            if n_frames >= 19 and not started:
+                started.append(n_frames)
+                tifffile.imwrite(
+                    str(tmp_path / "movie_1.ome.tif"),
+                    frames[20:],
+                    photometric="minisblack",
+                )
+            progress.append(n_frames)
+
+        locs, info = localize.localize_online(
+            path,
+            CAMERA_INFO_WITH_PIXELSIZE,
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            out_path,
+            chunk_size=10,
+            poll_interval=0.01,
+            idle_timeout=0,
+            progress_callback=start_part,
+        )
+        assert progress[-1] == len(movie)
+        assert locs["frame"].max() >= 20
+        _, info_saved = io.load_locs(out_path)
+        assert info_saved[0]["Frames"] == len(movie)
+
+
 # ---------------------------------------------------------------------------
 # localize_3D — identify + 2D fit + z fitting
 # ---------------------------------------------------------------------------
@@ -1139,3 +1726,58 @@ class TestLocalize3D:
             assert col in locs.columns
         assert np.all(np.isfinite(locs["z"].to_numpy()))
         assert (locs["lpz"] > 0).all()
+
+    def test_fused_pipeline_matches_separate_zfit(
+        self, picasso_movie, movie_info
+    ):
+        """z fitted per chunk equals z fitted after the 2D pass."""
+        locs_3d, info_3d = localize._localize_3D(
+            picasso_movie,
+            movie_info=movie_info,
+            camera_info=dict(CAMERA_INFO_WITH_PIXELSIZE),
+            box=BOX,
+            minimum_ng=MIN_NG,
+            calibration_3d=dict(CALIB_3D),
+            fitting_method="gausslq",
+            multiprocess=False,
+            chunk_size=2,
+        )
+        locs_2d, info_2d = localize.localize(
+            picasso_movie,
+            camera_info=dict(CAMERA_INFO_WITH_PIXELSIZE),
+            parameters={"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            movie_info=movie_info,
+            fitting_method="gausslq",
+            threaded=False,
+            chunk_size=2,
+            return_info=True,
+        )
+        locs_z, _ = zfit.zfit(
+            locs_2d,
+            info_2d,
+            calibration=dict(CALIB_3D),
+            fitting_method="gausslq",
+            filter=0,
+            multiprocess=False,
+        )
+        assert len(locs_3d) == len(locs_z)
+        for col in ["x", "y", "z", "d_zcalib", "lpz"]:
+            np.testing.assert_allclose(
+                locs_3d[col].to_numpy(), locs_z[col].to_numpy()
+            )
+        assert info_3d[-1]["Generated by"].endswith("Fit 3D")
+
+    def test_fit_z_console_progress(self, picasso_movie, movie_info, capsys):
+        localize._localize_3D(
+            picasso_movie,
+            movie_info=movie_info,
+            camera_info=dict(CAMERA_INFO_WITH_PIXELSIZE),
+            box=BOX,
+            minimum_ng=MIN_NG,
+            calibration_3d=dict(CALIB_3D),
+            fitting_method="gausslq",
+            multiprocess=False,
+            fit_z_progress_callback="console",
+            chunk_size=10,
+        )
+        assert "Fitting z" in capsys.readouterr().err
@@ -9,13 +9,18 @@ Most fixtures (``locs``, ``info``) live in ``tests/conftest.py``.
 
 from __future__ import annotations
 
+import importlib.util
+import os
+import subprocess
+import sys
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from picasso import clusterer, g5m, postprocess, zfit
+from picasso import clusterer, g5m, io, localize, postprocess, zfit
 
-from tests.conftest import CALIB_3D
+from tests.conftest import BOX, CALIB_3D, CAMERA_INFO, MIN_NG
 
 
 # Reused parameters
@@ -578,10 +583,85 @@ class TestLinking:
         for col in ["len", "n", "photon_rate"]:
             assert col in out.columns
 
-    def test_link_refit_not_implemented(self, locs, info):
-        with pytest.raises(NotImplementedError):
+    def test_link_refit_requires_movie(self, locs, info):
+        with pytest.raises(ValueError, match="movie"):
             postprocess.link(locs.copy(), info, combine_mode="refit")
 
+    @pytest.mark.parametrize("fitting_method", ["gaussmle", "gausslq"])
+    def test_link_refit(self, movie, movie_info, fitting_method):
+        """Refitting the summed spots of binding events agrees with the
+        weighted average of the per-frame fits."""
+        movie_locs, movie_locs_info = localize.localize(
+            movie,
+            CAMERA_INFO | {"Pixelsize": 130},
+            {"Min. Net Gradient": MIN_NG, "Box Size": BOX},
+            movie_info=movie_info,
+            fitting_method="gausslq",
+            return_info=True,
+        )
+        kwargs = dict(r_max=0.5, remove_ambiguous_lengths=False)
+        average = postprocess.link(movie_locs, movie_locs_info, **kwargs)
+        refit = postprocess.link(
+            movie_locs,
+            movie_locs_info,
+            combine_mode="refit",
+            movie=movie,
+            fitting_method=fitting_method,
+            chunk_size=7,
+            **kwargs,
+        )
+        assert len(refit) == len(average)
+        pd.testing.assert_index_equal(refit.index, average.index)
+        np.testing.assert_array_equal(refit["n"], average["n"])
+        np.testing.assert_array_equal(refit["frame"], average["frame"])
+        bright = refit["photons"] > 1000
+        np.testing.assert_allclose(
+            refit["x"][bright], average["x"][bright], atol=0.25
+        )
+        np.testing.assert_allclose(
+            refit["y"][bright], average["y"][bright], atol=0.25
+        )
+        assert np.isfinite(refit["lpx"][bright]).all()
+        # per-frame fit statistics are not averaged
+        assert "net_gradient" not in refit.columns
+        assert "converged" not in refit.columns
+        if fitting_method == "gaussmle":
+            assert (refit["iterations"] < 100).all()
+        else:
+            assert "iterations" not in refit.columns
+
+    @pytest.mark.parametrize("max_dark_time", [0, 3])
+    def test_link_lazy_matches_link(self, tmp_path, locs, info, max_dark_time):
+        """Linking block by block carries unfinished binding events over
+        and gives the same binding events as linking all at once."""
+        path = str(tmp_path / "locs.hdf5")
+        io.save_locs(path, locs, info, layout="columns")
+        lazy_locs = io.LazyLocs(path, block_size=50)
+        kwargs = dict(r_max=0.5, max_dark_time=max_dark_time)
+        linked = postprocess.link_lazy(
+            lazy_locs, str(tmp_path / "locs_link.hdf5"), **kwargs
+        )
+        assert linked.sorted_by_frame
+        result = linked.to_dataframe()
+        expected = postprocess.link(locs.copy(), info, **kwargs)
+        assert list(result.columns) == list(expected.columns)
+        assert (expected["len"] > 1).any()
+        by = ["frame", "x", "y"]
+        pd.testing.assert_frame_equal(
+            result.sort_values(by).reset_index(drop=True),
+            expected.sort_values(by).reset_index(drop=True),
+        )
+
+    def test_link_lazy_empty_keeps_columns(self, tmp_path, locs, info):
+        path = str(tmp_path / "locs.hdf5")
+        io.save_locs(path, locs.iloc[:0], info, layout="columns")
+        linked = postprocess.link_lazy(
+            io.LazyLocs(path), str(tmp_path / "locs_link.hdf5")
+        )
+        assert len(linked) == 0
+        for col in ["len", "n", "photon_rate"]:
+            assert col in linked.columns
+
     def test_link_groups_consistent_with_link(self, locs, info):
         # The number of unique non-(-1) link groups must equal the
         # number of linked events when there are no ambiguities to drop.
@@ -1217,6 +1297,27 @@ class TestG5M:
         assert len(mols) > 0
 
 
+    def test_pool_after_parallel_kernel(self):
+        """G5M workers are not forked: once a parallel numba kernel ran,
+        forked workers keep the interpreter from exiting."""
+        script = (
+            "import numpy as np\n"
+            "from picasso import avgroi, clusterer, g5m, io\n"
+            "locs, info = io.load_locs('./tests/data/testdata_locs.hdf5')\n"
+            "avgroi.fit_spots_batch(np.ones((1000, 7, 7), np.float32))\n"
+            "locs = clusterer.dbscan(locs, radius=2 / 130, min_samples=2)\n"
+            "g5m.g5m(locs, info, min_locs=5, bootstrap_check=False)\n"
+        )
+        env = os.environ.copy()
+        if importlib.util.find_spec("tbb") is not None:
+            # the threading layer under which forked workers hang
+            env["NUMBA_THREADING_LAYER"] = "tbb"
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, timeout=300
+        )
+        assert result.returncode == 0
+
+
 class TestG5M3D:
     @pytest.fixture
     def dbscan_locs_3d(self, locs, info):
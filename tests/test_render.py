@@ -255,6 +255,23 @@ class TestRender:
         )
         assert not np.array_equal(im_no_rot, im_rot)
 
+    @pytest.mark.parametrize("blur_method", [None] + BLUR_METHODS)
+    def test_render_columns_suffice(self, locs, info, blur_method):
+        columns = render.render_columns(blur_method)
+        _, expected = render.render(
+            locs, info, 5, FULL_VIEWPORT, blur_method=blur_method
+        )
+        _, im = render.render(
+            locs[columns], info, 5, FULL_VIEWPORT, blur_method=blur_method
+        )
+        np.testing.assert_array_equal(im, expected)
+
+    def test_render_columns_without_precision(self):
+        assert render.render_columns(None) == ["x", "y"]
+        assert render.render_columns("smooth") == ["x", "y"]
+        with pytest.raises(ValueError, match="blur_method"):
+            render.render_columns("unknown")
+
 
 # ---------------------------------------------------------------------------
 # render_hist_numba
@@ -0,0 +1,163 @@
+"""Tests for ``picasso.resources``.
+
+Worker counts are resolved from environment variables, calibration
+results and default fractions of the available CPUs, in this order.
+
+:author: Rafal Kowalewski, 2026
+:copyright: Copyright (c) 2026 Jungmann Lab, MPI of Biochemistry
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from picasso import lib, resources
+
+
+@pytest.fixture(autouse=True)
+def no_calibration(monkeypatch):
+    """Ignore calibration results stored in the user settings and
+    environment variables set outside the tests."""
+    monkeypatch.setattr(resources, "_calibration", {})
+    for key in list(resources.os.environ):
+        if key.startswith(("PICASSO_WORKERS", "PICASSO_TASKS_PER_WORKER")):
+            monkeypatch.delenv(key)
+
+
+# ---------------------------------------------------------------------------
+# n_workers / n_tasks
+# ---------------------------------------------------------------------------
+
+
+class TestNWorkers:
+    def test_default_fraction(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 128)
+        assert resources.n_workers("fit", processes=False) == 96
+        assert resources.n_workers("g5m", processes=False) == 44
+
+    def test_more_than_64_workers_on_linux(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 128)
+        monkeypatch.setattr(resources.sys, "platform", "linux")
+        assert resources.n_workers("identify") == 102
+
+    def test_windows_process_pools_are_capped(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 128)
+        monkeypatch.setattr(resources.sys, "platform", "win32")
+        assert resources.n_workers("identify") == 61
+        assert resources.n_workers("identify", processes=False) == 102
+
+    def test_environment_overrides(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 16)
+        monkeypatch.setenv("PICASSO_WORKERS", "0.5")
+        assert resources.n_workers("fit") == 8
+        monkeypatch.setenv("PICASSO_WORKERS_FIT", "3")
+        assert resources.n_workers("fit") == 3
+        assert resources.n_workers("zfit") == 8
+
+    def test_invalid_environment_value(self, monkeypatch):
+        monkeypatch.setenv("PICASSO_WORKERS", "many")
+        with pytest.raises(ValueError, match="PICASSO_WORKERS"):
+            resources.n_workers("fit")
+
+    def test_calibration_is_used(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 16)
+        monkeypatch.setattr(resources, "_calibration", {"fit": {"Workers": 5}})
+        assert resources.n_workers("fit") == 5
+        assert resources.n_workers("zfit") == 12
+
+    def test_unknown_stage(self):
+        with pytest.raises(ValueError, match="Unknown stage"):
+            resources.n_workers("render")
+
+    def test_n_tasks(self, monkeypatch):
+        assert resources.n_tasks("fit", 4) == 400
+        monkeypatch.setenv("PICASSO_TASKS_PER_WORKER_FIT", "10")
+        assert resources.n_tasks("fit", 4) == 40
+
+
+# ---------------------------------------------------------------------------
+# autotune
+# ---------------------------------------------------------------------------
+
+
+class TestAutotune:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the timer of the benchmarks by a clock that only the
+        benchmarks advance, so that timings do not depend on the load
+        of the machine."""
+
+        class Clock:
+            now = 0.0
+
+            def __call__(self):
+                return self.now
+
+            def advance(self, seconds):
+                self.now += seconds
+
+        clock = Clock()
+        monkeypatch.setattr(resources.time, "perf_counter", clock)
+        return clock
+
+    def test_picks_fewest_workers_within_tolerance(self, clock):
+        durations = {1: 0.04, 2: 0.02, 4: 0.0201, 8: 0.03}
+
+        def benchmark(n):
+            clock.advance(durations[n])
+
+        best = resources.autotune(
+            "identify",
+            benchmark,
+            candidates=list(durations),
+            tolerance=0.25,
+            save=False,
+        )
+        assert best == 2
+        assert resources.n_workers("identify") == 2
+
+    def test_candidates_include_all_cpus(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 12)
+        assert resources._candidates(processes=False) == [1, 2, 4, 8, 12]
+
+    def test_tasks_per_worker(self, clock):
+        durations = {1: 0.06, 4: 0.02, 16: 0.02}
+
+        def benchmark(tasks_per_worker):
+            clock.advance(durations[tasks_per_worker])
+
+        best = resources.autotune_tasks(
+            "fit",
+            benchmark,
+            candidates=list(durations),
+            tolerance=0.5,
+            save=False,
+        )
+        assert best == 4
+        assert resources.n_tasks("fit", 3) == 12
+
+
+# ---------------------------------------------------------------------------
+# migration of the former cpu_utilization setting
+# ---------------------------------------------------------------------------
+
+
+class TestMigrateCpuUtilization:
+    def test_fraction_is_taken_over(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 10)
+        settings = lib.AutoDict({"Localize": {"cpu_utilization": 0.5}})
+        calibration = {}
+        assert resources._migrate_cpu_utilization(settings, calibration)
+        assert "cpu_utilization" not in settings["Localize"]
+        monkeypatch.setattr(resources, "_calibration", calibration)
+        assert resources.n_workers("identify") == 5
+
+    def test_calibration_is_kept(self):
+        settings = lib.AutoDict({"Localize": {"cpu_utilization": 0.5}})
+        calibration = {"identify": {"Workers": 3}}
+        resources._migrate_cpu_utilization(settings, calibration)
+        assert calibration == {"identify": {"Workers": 3}}
+
+    def test_nothing_to_migrate(self):
+        settings = lib.AutoDict()
+        assert not resources._migrate_cpu_utilization(settings, {})
@@ -5,7 +5,8 @@ Covers the new (non-deprecated) API:
 - numerical helpers (``__get_calib_size``, ``_get_prime_calib_size``,
   ``_interpolate_nan``, ``filter_z_fits``);
 - the main ``zfit()`` pipeline (serial + multiprocess, with abort hooks
-  and argument overrides);
+  and argument overrides) and its agreement with a per-localization
+  ``scipy.optimize.minimize_scalar`` fit;
 - ``axial_localization_precision`` and ``axial_localization_precision_astig``
   (Kowalewski et al. 2026);
 - ``calibrate_z`` driven by synthetic bead-stack data.
@@ -19,6 +20,11 @@ exercised here.
 
 from __future__ import annotations
 
+import importlib.util
+import os
+import subprocess
+import sys
+
 import matplotlib
 import numpy as np
 import pandas as pd
@@ -279,6 +285,54 @@ class TestZfit:
             s["lpz"].to_numpy(), p["lpz"].to_numpy(), atol=1e-3
         )
 
+    def test_multiprocess_then_process_pool(self):
+        """The compiled multithreaded z fit does not keep a process pool
+        started afterwards in the same interpreter from exiting."""
+        script = (
+            "from picasso import io, zfit\n"
+            "from tests.conftest import CALIB_3D\n"
+            "locs, info = io.load_locs('./tests/data/testdata_locs.hdf5')\n"
+            "calib = dict(CALIB_3D)\n"
+            "zfit.zfit(locs, info, calibration=calib, multiprocess=True)\n"
+            "zfit._fit_z_parallel(locs, info, calib, 0.79, 130)\n"
+        )
+        env = os.environ.copy()
+        if importlib.util.find_spec("tbb") is not None:
+            # the threading layer under which forked workers hang
+            env["NUMBA_THREADING_LAYER"] = "tbb"
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, timeout=300
+        )
+        assert result.returncode == 0
+
+    def test_matches_minimize_scalar(self, locs, info):
+        """The tabulated + refined z fit matches a per-localization
+        bounded scalar minimization within the documented tolerance
+        where the latter finds the global minimum."""
+        from scipy.optimize import minimize_scalar
+
+        out, _ = zfit.zfit(
+            locs,
+            info,
+            calibration=dict(CALIB_3D),
+            magnification_factor=1.0,
+            filter=0,
+        )
+        cx = np.array(CALIB_3D["X Coefficients"])
+        cy = np.array(CALIB_3D["Y Coefficients"])
+        for i in range(0, len(out), max(1, len(out) // 200)):
+            row = out.iloc[i]
+            result = minimize_scalar(
+                zfit._fit_z_target,
+                bounds=[-1000, 1000],
+                args=(row["sx"], row["sy"], cx, cy),
+            )
+            d_zcalib = np.sqrt(result.fun)
+            # never worse than the scalar minimization
+            assert row["d_zcalib"] <= d_zcalib + 1e-6
+            if abs(row["d_zcalib"] - d_zcalib) < 1e-6:
+                assert abs(row["z"] - result.x) < 0.01
+
     @pytest.mark.slow
     def test_abort_callback_returns_none(self, locs, info):
         """Returning True from ``abort_callback`` aborts and yields